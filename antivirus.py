@@ -1,26 +1,94 @@
 import sys
 import os
 import ctypes
+import csv
+import errno
+import io
 import json
 import shutil
+import hashlib
+import struct
+import time
+import threading
+import queue
+from collections import deque
+from itertools import islice
+from functools import lru_cache
+from contextlib import contextmanager
 from datetime import datetime
 from PyQt5.QtWidgets import (QApplication, QWidget, QVBoxLayout, QPushButton, QLabel, QTextEdit,
                              QProgressBar, QFileDialog, QHBoxLayout, QMessageBox, QTabWidget,
                              QGroupBox, QCheckBox, QLineEdit, QSpinBox, QComboBox, QTableWidget,
-                             QTableWidgetItem, QHeaderView, QSplitter, QListWidget, QFrame)
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QTimer
-from PyQt5.QtGui import QFont, QColor, QPalette, QIcon
+                             QTableWidgetItem, QHeaderView, QSplitter, QListWidget, QFrame,
+                             QPlainTextEdit, QListView, QTableView, QStyledItemDelegate,
+                             QStyleOptionButton, QStyle)
+from PyQt5.QtCore import (Qt, QThread, QThreadPool, QRunnable, pyqtSignal, QTimer, QElapsedTimer,
+                          QAbstractListModel, QAbstractTableModel, QModelIndex, QRectF, QEvent, QUrl,
+                          QSaveFile, QIODevice)
+from PyQt5.QtGui import QFont, QColor, QBrush, QPainter, QPalette, QIcon, QDesktopServices
+
+# PyQtChart / watchdog은 실제로 사용할 때 임포트 (시작 시간 단축)
+HAS_CHART = None  # None: 아직 확인 전
+QtChart = None  # PyQt5.QtChart 모듈 (load_chart_support()가 True일 때 설정)
+
+def load_chart_support():
+    """PyQtChart 사용 가능 여부 (첫 호출 시에만 임포트 - 모듈은 QtChart에 보관)"""
+    global HAS_CHART, QtChart
+    if HAS_CHART is None:
+        try:
+            from PyQt5 import QtChart
+            HAS_CHART = True
+        except ImportError:
+            HAS_CHART = False
+            print("[경고] PyQtChart가 설치되지 않았습니다. 차트 기능이 비활성화됩니다.")
+            print("       설치: pip install PyQtChart")
+    return HAS_CHART
 
 try:
-    from PyQt5.QtChart import QChart, QChartView, QPieSeries
-    HAS_CHART = True
+    import orjson
+    HAS_ORJSON = True
 except ImportError:
-    HAS_CHART = False
-    print("[경고] PyQtChart가 설치되지 않았습니다. 차트 기능이 비활성화됩니다.")
-    print("       설치: pip install PyQtChart")
+    HAS_ORJSON = False
+
 
-from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler
+# ============================================================================
+# JSON 헬퍼 (orjson이 있으면 사용)
+# ============================================================================
+if HAS_ORJSON:
+    def json_loads(data):
+        """JSON 파싱 - bytes를 decode 없이 바로 파싱"""
+        return orjson.loads(data)
+
+    def json_dumps_pretty(obj):
+        """들여쓰기 JSON (UTF-8 bytes)"""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+
+    def json_dumps_compact(obj):
+        """공백 없는 JSON (UTF-8 bytes)"""
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+else:
+    def json_loads(data):
+        """JSON 파싱 - bytes는 UTF-8로 디코딩 후 파싱"""
+        if isinstance(data, (bytes, bytearray)):
+            data = data.decode('utf-8')
+        return json.loads(data)
+
+    def json_dumps_pretty(obj):
+        """들여쓰기 JSON (UTF-8 bytes)"""
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+    def json_dumps_compact(obj):
+        """공백 없는 JSON (UTF-8 bytes)"""
+        return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+def write_file_atomic(path, data):
+    """QSaveFile로 임시 파일에 쓴 뒤 commit 때 교체 (쓰는 도중 실패하면 기존 파일 유지, 임시 파일은 자동 삭제)"""
+    save_file = QSaveFile(path)
+    if not save_file.open(QIODevice.WriteOnly):
+        raise OSError(f"파일을 열 수 없음: {path} ({save_file.errorString()})")
+    save_file.write(data)
+    if not save_file.commit():  # 쓰기 오류가 있었으면 commit이 실패하고 임시 파일은 버려짐
+        raise OSError(f"파일 저장 실패: {path} ({save_file.errorString()})")
 
 # ============================================================================
 # 전역 설정
@@ -33,14 +101,18 @@ else:
     # 일반 Python 스크립트 실행
     SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 
+# 기본 경로 (한 번만 계산해서 재사용)
+DEFAULT_SETTINGS_FILE = os.path.join(SCRIPT_DIR, "settings.json")
+DEFAULT_QUARANTINE_DIR = os.path.join(SCRIPT_DIR, "quarantine")
+
 # 설정 파일 경로 결정 (기본 경로에서 실제 경로를 읽어옴)
 def get_settings_file_path():
     """설정 파일 경로 결정 - 기본 경로에서 실제 경로를 읽어옴"""
-    default_path = os.path.join(SCRIPT_DIR, "settings.json")
+    default_path = DEFAULT_SETTINGS_FILE
     if os.path.exists(default_path):
         try:
-            with open(default_path, 'r', encoding='utf-8') as f:
-                temp_settings = json.load(f)
+            with open(default_path, 'rb') as f:
+                temp_settings = json_loads(f.read())
                 custom_path = temp_settings.get('settings_file_path', '')
                 if custom_path and os.path.exists(custom_path):
                     return custom_path
@@ -54,7 +126,8 @@ print(f"[설정] 설정 파일 경로: {SETTINGS_FILE}")
 def load_settings():
     """설정 파일 로드"""
     default_settings = {
-        'quarantine_dir': os.path.join(SCRIPT_DIR, "quarantine"),
+        'quarantine_dir': DEFAULT_QUARANTINE_DIR,
+        'parallel_scan': True,  # 여러 CPU 코어로 병렬 스캔
         'exclusions': {
             'folders': [],      # 제외 폴더 목록
             'files': [],        # 제외 파일 목록
@@ -64,8 +137,8 @@ def load_settings():
     }
     if os.path.exists(SETTINGS_FILE):
         try:
-            with open(SETTINGS_FILE, 'r', encoding='utf-8') as f:
-                settings = json.load(f)
+            with open(SETTINGS_FILE, 'rb') as f:
+                settings = json_loads(f.read())
                 print(f"[설정] 설정 파일 로드 성공!")
                 # 기본값과 병합
                 for key, value in default_settings.items():
@@ -93,8 +166,7 @@ def load_settings():
 def save_settings(settings):
     """설정 파일 저장"""
     try:
-        with open(SETTINGS_FILE, 'w', encoding='utf-8') as f:
-            json.dump(settings, f, indent=2, ensure_ascii=False)
+        write_file_atomic(SETTINGS_FILE, json_dumps_pretty(settings))
         print(f"[설정] 설정 저장 완료: {SETTINGS_FILE}")
         return True
     except Exception as e:
@@ -104,10 +176,14 @@ def save_settings(settings):
 # 설정 로드
 SETTINGS = load_settings()
 QUARANTINE_DIR = SETTINGS['quarantine_dir']
-HISTORY_FILE = os.path.join(SCRIPT_DIR, "scan_history.json")
+HISTORY_FILE = os.path.join(SCRIPT_DIR, "scan_history.jsonl")  # 한 줄에 기록 하나
+LEGACY_HISTORY_FILE = os.path.join(SCRIPT_DIR, "scan_history.json")  # 이전 형식 (JSON 배열)
+HISTORY_DISPLAY_LIMIT = 50  # 히스토리 탭에 표시할 최근 기록 수
+HISTORY_MAX_ENTRIES = 10000  # 메모리/파일에 보관할 최대 히스토리 기록 수 (오래된 것부터 버림)
+SCAN_CACHE_FILE = os.path.join(SCRIPT_DIR, "scan_cache.jsonl")  # 첫 줄 헤더, 이후 한 줄에 항목 하나
+CLEAN_BLOOM_FILE = os.path.join(SCRIPT_DIR, "scan_clean.bloom")
 
-if not os.path.exists(QUARANTINE_DIR):
-    os.makedirs(QUARANTINE_DIR)
+os.makedirs(QUARANTINE_DIR, exist_ok=True)
 
 # ============================================================================
 # DLL 로딩
@@ -125,7 +201,10 @@ else:
 
 dll_path = os.path.join(dll_dir, libname)
 engine = None
+ENGINE_SYMBOLS = set()  # DLL에서 찾은 선택 함수 이름
 has_detailed_scan = False
+has_batch_scan = False
+has_batch_basic_scan = False
 has_add_signature = False
 has_add_hash = False
 has_yara = False
@@ -143,72 +222,47 @@ try:
     engine.scan_file.argtypes = [ctypes.c_wchar_p]
     engine.scan_file.restype = ctypes.c_int
 
-    try:
-        engine.scan_file_detailed.argtypes = [ctypes.c_wchar_p]
-        engine.scan_file_detailed.restype = ctypes.c_char_p
-        has_detailed_scan = True
-    except AttributeError:
-        print("[경고] scan_file_detailed 함수를 찾을 수 없습니다.")
-
-    try:
-        engine.add_signature.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int]
-        engine.add_signature.restype = ctypes.c_int
-        has_add_signature = True
-    except AttributeError:
-        print("[경고] add_signature 함수를 찾을 수 없습니다.")
-
-    try:
-        engine.add_hash.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int, ctypes.c_bool]
-        engine.add_hash.restype = ctypes.c_int
-        has_add_hash = True
-    except AttributeError:
-        print("[경고] add_hash 함수를 찾을 수 없습니다.")
-
-    # 새 함수들
-    try:
-        engine.add_yara_rule.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_char_p, 
-                                          ctypes.c_char_p, ctypes.c_int, ctypes.c_int]
-        engine.add_yara_rule.restype = ctypes.c_int
-        has_yara = True
-    except AttributeError:
-        pass
-
-    try:
-        engine.analyze_imports_api.argtypes = [ctypes.c_wchar_p]
-        engine.analyze_imports_api.restype = ctypes.c_char_p
-        has_import_analysis = True
-    except AttributeError:
-        pass
-
-    try:
-        engine.analyze_pe_file.argtypes = [ctypes.c_wchar_p]
-        engine.analyze_pe_file.restype = ctypes.c_char_p
-        has_pe_analysis = True
-    except AttributeError:
-        pass
-
-    try:
-        engine.analyze_archive.argtypes = [ctypes.c_wchar_p]
-        engine.analyze_archive.restype = ctypes.c_char_p
-        has_archive_analysis = True
-    except AttributeError:
-        pass
-
-    try:
-        engine.get_engine_stats.argtypes = []
-        engine.get_engine_stats.restype = ctypes.c_char_p
-    except AttributeError:
-        pass
-
-    try:
-        engine.get_engine_version.argtypes = []
-        engine.get_engine_version.restype = ctypes.c_char_p
-    except AttributeError:
-        pass
+    # 선택 함수 - (이름, argtypes, restype, 없을 때 경고 여부) 표 하나로 확인
+    _optional_symbols = [
+        ("scan_file_detailed", [ctypes.c_wchar_p], ctypes.c_char_p, True),
+        ("scan_files_detailed", [ctypes.POINTER(ctypes.c_wchar_p), ctypes.c_int], ctypes.c_char_p, False),
+        ("scan_files", [ctypes.POINTER(ctypes.c_wchar_p), ctypes.c_int, ctypes.POINTER(ctypes.c_int)],
+         ctypes.c_int, False),
+        ("add_signature", [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int], ctypes.c_int, True),
+        ("add_hash", [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int, ctypes.c_bool], ctypes.c_int, True),
+        ("add_yara_rule", [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_char_p,
+                           ctypes.c_char_p, ctypes.c_int, ctypes.c_int], ctypes.c_int, False),
+        ("analyze_imports_api", [ctypes.c_wchar_p], ctypes.c_char_p, False),
+        ("analyze_pe_file", [ctypes.c_wchar_p], ctypes.c_char_p, False),
+        ("analyze_archive", [ctypes.c_wchar_p], ctypes.c_char_p, False),
+        ("get_engine_stats", [], ctypes.c_char_p, False),
+        ("get_engine_version", [], ctypes.c_char_p, False),
+    ]
+    for _name, _argtypes, _restype, _warn in _optional_symbols:
+        _func = getattr(engine, _name, None)
+        if _func is None:
+            if _warn:
+                print(f"[경고] {_name} 함수를 찾을 수 없습니다.")
+            continue
+        _func.argtypes = _argtypes
+        _func.restype = _restype
+        ENGINE_SYMBOLS.add(_name)
+
+    has_detailed_scan = "scan_file_detailed" in ENGINE_SYMBOLS
+    has_batch_scan = "scan_files_detailed" in ENGINE_SYMBOLS
+    has_batch_basic_scan = "scan_files" in ENGINE_SYMBOLS
+    has_add_signature = "add_signature" in ENGINE_SYMBOLS
+    has_add_hash = "add_hash" in ENGINE_SYMBOLS
+    has_yara = "add_yara_rule" in ENGINE_SYMBOLS
+    has_import_analysis = "analyze_imports_api" in ENGINE_SYMBOLS
+    has_pe_analysis = "analyze_pe_file" in ENGINE_SYMBOLS
+    has_archive_analysis = "analyze_archive" in ENGINE_SYMBOLS
 
     print(f"[성공] {libname} 로드 완료!")
     print(f"  - 기본 스캔: ✓")
     print(f"  - 상세 스캔: {'✓' if has_detailed_scan else '✗'}")
+    print(f"  - 배치 스캔: {'✓' if has_batch_scan else '✗'}")
+    print(f"  - 배치 기본 스캔: {'✓' if has_batch_basic_scan else '✗'}")
     print(f"  - 시그니처 추가: {'✓' if has_add_signature else '✗'}")
     print(f"  - 해시 추가: {'✓' if has_add_hash else '✗'}")
     print(f"  - YARA 룰: {'✓' if has_yara else '✗'}")
@@ -220,30 +274,200 @@ except Exception as e:
     print(f"\n[치명적 오류] DLL 로드 실패: {e}\n")
     sys.exit(1)
 
+# ============================================================================
+# 스캔 핫 경로 바인딩 (cffi 우선, 없으면 ctypes)
+# ============================================================================
+# 파일마다 호출되는 스캔 함수만 cffi로 다시 바인딩 (ctypes 호출 오버헤드 감소)
+# 나머지(시그니처/해시 추가, 분석 함수 등)는 호출 빈도가 낮아 ctypes 유지
+try:
+    import cffi
+    HAS_CFFI = True
+except ImportError:
+    HAS_CFFI = False
+
+_ffi = None
+_fast_engine = None
+if HAS_CFFI:
+    try:
+        _ffi = cffi.FFI()
+        _ffi.cdef("""
+            int scan_file(const wchar_t* filepath);
+            const char* scan_file_detailed(const wchar_t* filepath);
+            const char* scan_files_detailed(const wchar_t** filepaths, int count);
+            int scan_files(const wchar_t** filepaths, int count, int* results);
+        """)
+        _fast_engine = _ffi.dlopen(dll_path)
+    except Exception as e:
+        print(f"[경고] cffi 바인딩 실패, ctypes 사용: {e}")
+        _ffi = None
+        _fast_engine = None
+print(f"  - cffi 바인딩: {'✓' if _fast_engine is not None else '✗'}")
+
+if _fast_engine is not None:
+    _ffi_string = _ffi.string
+    _ffi_new = _ffi.new
+    _ffi_NULL = _ffi.NULL
+
+    def _engine_scan_file(abs_path):
+        """scan_file 호출 (cffi)"""
+        return _fast_engine.scan_file(abs_path)
+
+    def _engine_scan_file_detailed(abs_path):
+        """scan_file_detailed 호출 (cffi) - JSON bytes 반환"""
+        result_ptr = _fast_engine.scan_file_detailed(abs_path)
+        return _ffi_string(result_ptr) if result_ptr != _ffi_NULL else None
+
+    def _engine_scan_files_detailed(abs_paths):
+        """scan_files_detailed 호출 (cffi) - JSON 배열 bytes 반환"""
+        # 호출이 끝날 때까지 각 문자열 버퍼가 살아 있도록 리스트로 보관
+        path_bufs = [_ffi_new("wchar_t[]", p) for p in abs_paths]
+        path_array = _ffi_new("wchar_t*[]", path_bufs)
+        result_ptr = _fast_engine.scan_files_detailed(path_array, len(path_bufs))
+        return _ffi_string(result_ptr) if result_ptr != _ffi_NULL else None
+
+    def _engine_scan_files(abs_paths):
+        """scan_files 호출 (cffi) - 결과 코드 목록 반환"""
+        path_bufs = [_ffi_new("wchar_t[]", p) for p in abs_paths]
+        path_array = _ffi_new("wchar_t*[]", path_bufs)
+        codes = _ffi_new("int[]", len(path_bufs))
+        _fast_engine.scan_files(path_array, len(path_bufs), codes)
+        return list(codes)
+else:
+    # 경로 인자용 유니코드 버퍼 - 호출마다 새로 만들지 않고 스레드별로 하나씩 재사용
+    _PATH_BUFFER_SIZE = 32768  # Windows 최대 경로 길이
+    _path_buffers = threading.local()
+
+    def _path_buffer(abs_path):
+        """abs_path를 채운 현재 스레드의 재사용 버퍼"""
+        buf = getattr(_path_buffers, 'buf', None)
+        if buf is None:
+            buf = _path_buffers.buf = ctypes.create_unicode_buffer(_PATH_BUFFER_SIZE)
+        try:
+            buf.value = abs_path
+        except ValueError:
+            # 버퍼보다 긴 경로는 별도 버퍼 사용
+            return ctypes.create_unicode_buffer(abs_path)
+        return buf
+
+    def _engine_scan_file(abs_path):
+        """scan_file 호출 (ctypes)"""
+        return engine.scan_file(_path_buffer(abs_path))
+
+    def _engine_scan_file_detailed(abs_path):
+        """scan_file_detailed 호출 (ctypes) - JSON bytes 반환"""
+        return engine.scan_file_detailed(_path_buffer(abs_path))
+
+    def _engine_scan_files_detailed(abs_paths):
+        """scan_files_detailed 호출 (ctypes) - JSON 배열 bytes 반환"""
+        path_array = (ctypes.c_wchar_p * len(abs_paths))(*abs_paths)
+        return engine.scan_files_detailed(path_array, len(abs_paths))
+
+    def _engine_scan_files(abs_paths):
+        """scan_files 호출 (ctypes) - 결과 코드 목록 반환"""
+        path_array = (ctypes.c_wchar_p * len(abs_paths))(*abs_paths)
+        codes = (ctypes.c_int * len(abs_paths))()
+        engine.scan_files(path_array, len(abs_paths), codes)
+        return list(codes)
+
 # ============================================================================
 # 스캔 통계 클래스
 # ============================================================================
+# 결과 코드(-1~3) → counts 인덱스 (인덱스 = 코드 + 1)
+_STATS_SLOT = (0, 1, 2, 2, 3)
+
 class ScanStats:
     def __init__(self):
-        self.total_scanned = 0
-        self.clean_files = 0
-        self.malicious_files = 0
-        self.suspicious_files = 0
-        self.errors = 0
+        self.counts = [0, 0, 0, 0]  # [오류, 정상, 악성, 의심]
         self.quarantined = 0
         self.skipped = 0  # 제외된 파일 수
+        self.version = 0  # counts가 바뀔 때마다 증가 (대시보드 갱신 여부 판단)
 
     def reset(self):
+        version = self.version + 1
         self.__init__()
+        self.version = version
+
+    def add(self, code):
+        """결과 코드 하나 집계 (코드 → 칸은 테이블 조회, 범위 밖 코드는 오류로 집계)"""
+        self.counts[_STATS_SLOT[code + 1] if -1 <= code <= 3 else 0] += 1
+        self.version += 1
+
+    def add_codes(self, codes):
+        """결과 코드 여러 개 집계 - 파일별 분기 대신 코드별 count 한 번씩"""
+        clean = codes.count(0)
+        malicious = codes.count(1) + codes.count(2)
+        suspicious = codes.count(3)
+        self.counts[0] += len(codes) - clean - malicious - suspicious
+        self.counts[1] += clean
+        self.counts[2] += malicious
+        self.counts[3] += suspicious
+        self.version += 1
+
+    def set_counts(self, clean, malicious, suspicious, errors):
+        """스캔 스레드에서 받은 집계로 갱신"""
+        self.counts = [errors, clean, malicious, suspicious]
+        self.version += 1
+
+    @property
+    def total_scanned(self):
+        return sum(self.counts)
+
+    @property
+    def errors(self):
+        return self.counts[0]
+
+    @property
+    def clean_files(self):
+        return self.counts[1]
+
+    @property
+    def malicious_files(self):
+        return self.counts[2]
+
+    @property
+    def suspicious_files(self):
+        return self.counts[3]
+
+# ============================================================================
+# 경로 문자열 헬퍼 (파일마다 호출되는 곳에서 os.path 대신 사용)
+# ============================================================================
+def base_name(filepath):
+    """os.path.basename과 같은 결과를 문자열 검색만으로 계산"""
+    i = filepath.rfind(os.sep)
+    if os.altsep:
+        i = max(i, filepath.rfind(os.altsep))
+    return filepath[i + 1:]
+
+_PATH_SEPS = os.sep + (os.altsep or '')
+
+def split_path(filepath):
+    """os.path.split과 같은 (폴더, 파일명)
+
+    일반적인 경로 (마지막 구분자 앞이 평범한 문자)는 문자열 검색만으로 나누고
+    구분자 없음/루트/드라이브/연속 구분자/UNC 경로는 os.path.split에 맡김
+    """
+    i = filepath.rfind(os.sep)
+    if os.altsep:
+        i = max(i, filepath.rfind(os.altsep))
+    if i > 0 and filepath[i - 1] not in _PATH_SEPS and filepath[i - 1] != ':' \
+            and filepath[1:2] not in _PATH_SEPS:
+        return filepath[:i], filepath[i + 1:]
+    return os.path.split(filepath)
+
+def file_ext(filename):
+    """확장자 (점 포함) - 이름이 점으로 시작하는 숨김 파일은 확장자 없음"""
+    dot = filename.rfind('.')
+    return filename[dot:] if dot > 0 else ''
 
 # ============================================================================
 # 제외 목록 확인 함수
 # ============================================================================
-def is_excluded(filepath, exclusions):
-    """파일이 제외 목록에 있는지 확인"""
+def is_excluded(filepath, exclusions, filename=None):
+    """파일이 제외 목록에 있는지 확인 (filename을 넘기면 basename 재계산 생략)"""
     filepath_lower = filepath.lower()
-    filename = os.path.basename(filepath)
-    ext = os.path.splitext(filepath)[1].lower()
+    if filename is None:
+        filename = base_name(filepath)
+    ext = file_ext(filename).lower()
     
     # 폴더 제외 확인
     for folder in exclusions.get('folders', []):
@@ -254,7 +478,7 @@ def is_excluded(filepath, exclusions):
     # 파일 제외 확인
     for file in exclusions.get('files', []):
         file_lower = file.lower()
-        if filepath_lower == file_lower or filename.lower() == os.path.basename(file_lower):
+        if filepath_lower == file_lower or filename.lower() == base_name(file_lower):
             return True, f"제외 파일: {file}"
     
     # 확장자 제외 확인
@@ -281,6 +505,36 @@ def is_hash_excluded(md5_hash, sha256_hash, exclusions):
 # ============================================================================
 # 스캔 함수
 # ============================================================================
+# 결과 코드(-1~3) → 표시 문자열 (인덱스 = 코드 + 1)
+_STATUS_TEXT = ("오류", "정상", "악성-시그니처", "악성-해시", "의심-휴리스틱")
+_STATUS_LABEL = ("❌ 오류", "✅ 정상", "🔴 악성", "🔴 악성", "⚠️ 의심")
+
+def status_text(code):
+    """결과 코드 → 로그용 문자열"""
+    return _STATUS_TEXT[code + 1] if -1 <= code <= 3 else "알수없음"
+
+def status_label(code):
+    """결과 코드 → 결과 테이블용 문자열"""
+    return _STATUS_LABEL[code + 1] if -1 <= code <= 3 else "❓ 알수없음"
+
+class ScanRow:
+    """결과 테이블 한 행 - 스캔 스레드에서 엔진 결과 dict를 한 번만 풀어 둠 (GUI에서는 속성 접근만)"""
+    __slots__ = ('filepath', 'folder', 'filename', 'status', 'threat_name', 'md5', 'file_size')
+
+    def __init__(self, filepath, filename, result):
+        self.filepath = filepath
+        self.folder = split_path(filepath)[0]
+        self.filename = filename
+        self.status = result.get('status', -1)
+        self.threat_name = result.get('threat_name', 'Unknown')
+        self.md5 = result.get('md5', '')
+        self.file_size = result.get('file_size', 0)
+
+    @property
+    def is_threat(self):
+        """악성 또는 의심 여부 (격리 버튼 / 최근 위협 대상)"""
+        return 1 <= self.status <= 3
+
 def scan_file_basic(filepath):
     """기본 스캔 - 안전한 호출"""
     if engine is None:
@@ -290,12 +544,8 @@ def scan_file_basic(filepath):
     try:
         # 경로를 절대 경로로 변환
         abs_path = os.path.abspath(filepath)
-        # ctypes.create_unicode_buffer를 사용하여 안전하게 문자열 전달
-        path_buffer = ctypes.create_unicode_buffer(abs_path)
-        result = engine.scan_file(path_buffer)
-        status_map = {0: "정상", 1: "악성-시그니처", 2: "악성-해시", 3: "의심-휴리스틱", -1: "오류"}
-        status_text = status_map.get(result, "알수없음")
-        return f"[{status_text}] {filepath}", result
+        result = _engine_scan_file(abs_path)
+        return f"[{status_text(result)}] {filepath}", result
     except Exception as e:
         return f"[오류] {e}", -1
 
@@ -316,11 +566,9 @@ def scan_file_detailed(filepath):
         }
     try:
         abs_path = os.path.abspath(filepath)
-        # ctypes.create_unicode_buffer를 사용하여 안전하게 문자열 전달
-        path_buffer = ctypes.create_unicode_buffer(abs_path)
-        result_ptr = engine.scan_file_detailed(path_buffer)
-        if result_ptr:
-            return json.loads(result_ptr.decode('utf-8'))
+        result_bytes = _engine_scan_file_detailed(abs_path)
+        if result_bytes:
+            return json_loads(result_bytes)
         else:
             raise Exception("NULL 반환")
     except Exception as e:
@@ -336,197 +584,2037 @@ def scan_file_detailed(filepath):
             return {"status": -1, "threat_type": "error", "threat_name": "Scan Error",
                     "md5": "", "sha256": "", "entropy": 0.0, "file_size": 0}
 
+def make_scan_entries(paths):
+    """경로 목록 → 스캔 목록 [(경로, 파일명)] (파일명은 여기서 한 번만 계산)"""
+    return [(path, base_name(path)) for path in paths]
+
+# 순회 중 들어가지 않는 폴더 (소문자) - 접근 거부, 하드링크 저장소, 휴지통, 이전 설치본
+SKIP_DIR_NAMES = frozenset(['system volume information', '$recycle.bin', 'winsxs', 'windows.old'])
+# 시스템이 잠가 두어 읽을 수 없는 파일 (소문자)
+SKIP_FILE_NAMES = frozenset(['pagefile.sys', 'hiberfil.sys', 'swapfile.sys', 'dumpstack.log.tmp'])
+# 이 크기를 넘으면 검사하지 않는 시스템/로그 파일 확장자
+LARGE_SKIP_EXTS = ('.sys', '.log', '.evtx')
+LARGE_SKIP_SIZE = 100 * 1024 * 1024
+FILE_ATTRIBUTE_REPARSE_POINT = 0x400
+
+
+def should_walk_dir(entry):
+    """하위 폴더로 들어갈지 (is_dir(follow_symlinks=False)인 항목에 대해 호출)
+
+    제외 폴더와 정션(재분석 지점)은 건너뜀 - 정션은 is_symlink()로 걸러지지 않아 순환을 만듦.
+    Windows에서는 DirEntry가 폴더 목록을 읽을 때 받은 속성을 캐시하므로 추가 syscall 없음
+    """
+    if entry.name.lower() in SKIP_DIR_NAMES:
+        return False
+    if sys.platform.startswith("win"):
+        attrs = entry.stat(follow_symlinks=False).st_file_attributes
+        return not attrs & FILE_ATTRIBUTE_REPARSE_POINT
+    return True
+
+
+def should_scan_file(entry):
+    """파일을 검사 목록에 넣을지 - 잠긴 시스템 파일과 큰 로그 파일은 제외"""
+    name = entry.name.lower()
+    if name in SKIP_FILE_NAMES:
+        return False
+    if name.endswith(LARGE_SKIP_EXTS):
+        return entry.stat(follow_symlinks=False).st_size <= LARGE_SKIP_SIZE
+    return True
+
+
+def iter_scan_entries(folder, recursive=True):
+    """폴더의 스캔 목록을 하나씩 생성 (os.scandir, 전체 목록을 메모리에 만들지 않음)
+
+    DirEntry가 이미 가진 경로/종류 정보를 그대로 사용해 파일마다 stat()을 다시 하지 않음
+    """
+    stack = [folder]
+    while stack:
+        current = stack.pop()
+        try:
+            it = os.scandir(current)
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive and should_walk_dir(entry):
+                            stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False) and should_scan_file(entry):
+                        yield entry.path, entry.name
+                except OSError:
+                    continue
+
+# 병렬 폴더 순회 스레드 수 (폴더 읽기 대기 시간을 겹쳐서 숨김)
+ENUM_WORKERS = 4
+
+
+def _put_unless_cancelled(q, item, cancel):
+    """가득 찬 대기열에 넣을 때 취소되면 포기"""
+    while not cancel.is_set():
+        try:
+            q.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            pass
+    return False
+
+
+def iter_dir_entries_parallel(roots, workers=ENUM_WORKERS, recursive=True, cancel=None):
+    """여러 스레드가 폴더 대기열을 나눠 읽으며 폴더별 (경로, 파일명) 목록을 생성
+
+    순서는 보장하지 않음. 소비를 중단하면(generator close) 워커도 종료됨
+    """
+    cancel = cancel or threading.Event()
+    dirs = queue.Queue()
+    out = queue.Queue(maxsize=256)
+    lock = threading.Lock()
+    pending = [len(roots)]  # 대기열에 있거나 처리 중인 폴더 수
+    if not roots:
+        return
+    for root in roots:
+        dirs.put(root)
+
+    def worker():
+        while not cancel.is_set():
+            try:
+                current = dirs.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            files = []
+            subdirs = []
+            try:
+                with os.scandir(current) as it:
+                    for entry in it:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                if recursive and should_walk_dir(entry):
+                                    subdirs.append(entry.path)
+                            elif entry.is_file(follow_symlinks=False) and should_scan_file(entry):
+                                files.append((entry.path, entry.name))
+                        except OSError:
+                            continue
+            except OSError:
+                pass
+            with lock:
+                pending[0] += len(subdirs)
+            for subdir in subdirs:
+                dirs.put(subdir)
+            if files and not _put_unless_cancelled(out, files, cancel):
+                return
+            with lock:
+                pending[0] -= 1
+                done = pending[0] == 0
+            if done:
+                _put_unless_cancelled(out, None, cancel)  # 모든 폴더 처리 완료
+
+    threads = [threading.Thread(target=worker, daemon=True) for _ in range(max(1, workers))]
+    for thread in threads:
+        thread.start()
+    try:
+        while not cancel.is_set():
+            try:
+                files = out.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            if files is None:
+                return
+            yield files
+    finally:
+        cancel.set()  # 남은 워커 종료
+
+# GetDriveType 반환값 - 이동식 드라이브
+DRIVE_REMOVABLE = 2
+# 드라이브 목록 캐시 유지 시간 (초) - 한 번의 사용자 조작 동안 재사용
+DRIVE_CACHE_SECONDS = 5.0
+_drive_cache = (float('-inf'), [])
+
+
+def list_drives():
+    """(드라이브 루트, GetDriveType 값) 목록 (Windows)
+
+    GetLogicalDrives 한 번으로 있는 드라이브를 확인하고 잠시 캐시함.
+    API를 쓸 수 없으면 루트 존재 여부로 찾고 종류는 None
+    """
+    global _drive_cache
+    now = time.monotonic()
+    if now - _drive_cache[0] < DRIVE_CACHE_SECONDS:
+        return _drive_cache[1]
+    try:
+        kernel32 = ctypes.windll.kernel32
+        mask = kernel32.GetLogicalDrives()
+        drives = []
+        for i in range(26):
+            if mask & (1 << i):
+                drive = f"{chr(ord('A') + i)}:\\"
+                drives.append((drive, kernel32.GetDriveTypeW(drive)))
+    except Exception as e:
+        print(f"드라이브 탐지 오류: {e}")
+        drives = [(f"{chr(ord('A') + i)}:\\", None) for i in range(26)
+                  if os.path.exists(f"{chr(ord('A') + i)}:\\")]
+    _drive_cache = (now, drives)
+    return drives
+
+
+def list_dir_entries(folder):
+    """폴더 바로 아래 파일들의 스캔 목록 (하위 폴더 제외)"""
+    with os.scandir(folder) as it:
+        return [(entry.path, entry.name) for entry in it
+                if entry.is_file(follow_symlinks=False) and should_scan_file(entry)]
+
+# 배치 스캔 시 한 번의 DLL 호출로 넘기는 파일 수
+SCAN_BATCH_SIZE = 256
+# 파일 단위 스캔에서 취소 여부를 확인하는 간격 (파일 수)
+CANCEL_CHECK_INTERVAL = 64
+# 진행률/통계 시그널 최소 발송 간격 (ms) - GUI 이벤트 큐 과부하 방지
+PROGRESS_EMIT_INTERVAL_MS = 100
+# 병렬 스캔 최대 워커 수 (디스크 I/O 경합을 고려해 상한 설정)
+MAX_SCAN_WORKERS = 16
+# CPU 코어당 스캔 워커 수 - 한 워커가 파일 읽기를 기다리는 동안 다른 워커가 해시 계산
+SCAN_WORKERS_PER_CPU = 2
+
+def get_scan_workers():
+    """병렬 스캔 워커 수 (설정에서 비활성화 시 1)"""
+    if not SETTINGS.get('parallel_scan', True):
+        return 1
+    return max(1, min(MAX_SCAN_WORKERS, (os.cpu_count() or 1) * SCAN_WORKERS_PER_CPU))
+
+def scan_files_detailed(filepaths):
+    """배치 상세 스캔 - 여러 파일을 한 번의 DLL 호출로 검사 (결과는 입력 순서와 동일)"""
+    if not filepaths:
+        return []
+    if engine is None or not has_batch_scan:
+        return [scan_file_detailed(fp) for fp in filepaths]
+    try:
+        abs_paths = [os.path.abspath(fp) for fp in filepaths]
+        result_bytes = _engine_scan_files_detailed(abs_paths)
+        if not result_bytes:
+            raise Exception("NULL 반환")
+        results = json_loads(result_bytes)
+        if len(results) != len(filepaths):
+            raise Exception(f"결과 개수 불일치 ({len(results)}/{len(filepaths)})")
+        return results
+    except Exception as e:
+        print(f"배치 스캔 오류: {e}")
+        # 파일별 상세 스캔으로 폴백
+        return [scan_file_detailed(fp) for fp in filepaths]
+
+def scan_files_basic(filepaths):
+    """배치 기본 스캔 - 결과 코드 목록 (입력 순서와 동일)"""
+    if not filepaths:
+        return []
+    if engine is None or not has_batch_basic_scan:
+        return [scan_file_basic(fp)[1] for fp in filepaths]
+    try:
+        return _engine_scan_files([os.path.abspath(fp) for fp in filepaths])
+    except Exception as e:
+        print(f"배치 스캔 오류: {e}")
+        # 파일별 기본 스캔으로 폴백
+        return [scan_file_basic(fp)[1] for fp in filepaths]
+
 # ============================================================================
-# 파일 수집 스레드 (UI 블로킹 방지)
+# 스캔 결과 캐시
 # ============================================================================
-class FileCollectorThread(QThread):
-    progress_msg = pyqtSignal(str)
-    finished = pyqtSignal(list)
-    
-    def __init__(self, paths, max_files=100000, recursive=True):
+# 캐시 파일 형식 버전 (형식이 바뀌면 올림)
+SCAN_CACHE_FORMAT = 2
+# 캐시 최대 항목 수 (초과 시 오래된 항목부터 제거)
+SCAN_CACHE_MAX_ENTRIES = 200000
+
+# 실행 중 add_* 로 엔진에 추가한 룰 내용 다이제스트 (DLL은 추가 룰을 저장하지 않으므로
+# 세션마다 다른 룰을 넣으면 개수가 같아도 다른 값이 되도록 내용으로 누적)
+_engine_rules_digest = hashlib.sha256()
+_engine_rules_lock = threading.Lock()
+
+def record_engine_rule(kind, *fields):
+    """엔진에 추가한 룰(시그니처/해시/YARA)을 다이제스트에 반영 - add_* 호출 성공 후 호출"""
+    with _engine_rules_lock:
+        _engine_rules_digest.update(json_dumps_compact([kind, *fields]) + b'\n')
+
+@lru_cache(maxsize=2)
+def _file_content_digest(path, mtime_ns, size):
+    """파일 내용 SHA-256 - (mtime, 크기)가 같으면 다시 읽지 않음"""
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            h.update(block)
+    return h.hexdigest()
+
+def get_engine_cache_version():
+    """엔진/시그니처 DB 상태 문자열 - 바뀌면 스캔 캐시/블룸 필터 무효화
+
+    내장 룰은 DLL에 컴파일되어 있으므로 DLL 내용 해시로 구분
+    (압축 해제/복사로 mtime이 보존된 채 교체돼도 놓치지 않도록 mtime/크기 대신 내용 사용).
+    """
+    parts = [str(SCAN_CACHE_FORMAT)]
+    try:
+        st = os.stat(dll_path)
+        parts.append(_file_content_digest(dll_path, st.st_mtime_ns, st.st_size))
+    except OSError:
+        pass
+    for name in ('get_engine_version', 'get_engine_stats'):
+        if name in ENGINE_SYMBOLS:
+            result_ptr = getattr(engine, name)()
+            if result_ptr:
+                parts.append(result_ptr.decode('utf-8', errors='replace'))
+    with _engine_rules_lock:
+        parts.append(_engine_rules_digest.hexdigest())
+    return '|'.join(parts)
+
+class ScanCache:
+    """상세 스캔 결과 캐시 - (경로, mtime_ns, 크기)가 같으면 재검사 생략
+
+    파일은 추가 전용 JSONL (첫 줄 헤더, 이후 한 줄에 항목 하나). 저장할 때는 새 항목만 끝에 덧붙이고,
+    같은 경로를 덮어쓴 줄이 쌓이면 로드 후 다음 저장 때 한 번 압축해서 다시 씀.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.version = None
+        self.entries = {}  # filepath -> [mtime_ns, size, result]
+        self._pending = []  # 아직 파일에 쓰지 않은 줄
+        self._rewrite = False  # 다음 저장 때 파일 전체 다시 쓰기 (버전 변경/압축)
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def _load(self):
+        self._loaded = True
+        try:
+            with open(self.path, 'rb') as f:
+                header = json_loads(f.readline())
+                lines = [line for line in f.read().splitlines() if line.strip()]
+            version = header.get('version')
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            print(f"[캐시] 스캔 캐시 로드 오류: {e}")
+            return
+        try:
+            # 줄들을 배열 하나로 묶어 한 번에 파싱 (orjson 호출 1회)
+            rows = json_loads(b'[' + b','.join(lines) + b']')
+        except ValueError:
+            rows = []
+            for line in lines:
+                try:
+                    rows.append(json_loads(line))
+                except ValueError:
+                    pass  # 손상된 줄(쓰는 도중 종료 등)은 건너뜀
+        entries = self.entries
+        for row in rows:
+            try:
+                filepath, mtime_ns, size, result = row
+            except (TypeError, ValueError):
+                continue
+            entries.pop(filepath, None)  # 나중 줄이 최신 - 순서도 맨 뒤로
+            entries[filepath] = [mtime_ns, size, result]
+        while len(entries) > SCAN_CACHE_MAX_ENTRIES:
+            del entries[next(iter(entries))]
+        self.version = version
+        # 덮어쓰거나 밀려난 줄이 절반을 넘으면 압축
+        if len(lines) > 2 * len(entries):
+            self._rewrite = True
+
+    def validate(self):
+        """엔진/시그니처 DB가 바뀌었으면 캐시 비우기 (스캔 시작 시 호출)"""
+        if not self._loaded:
+            self._load()
+        version = get_engine_cache_version()
+        if self.version != version:
+            if self.entries:
+                print("[캐시] 엔진/시그니처 변경 - 스캔 캐시 초기화")
+            with self._lock:
+                self.version = version
+                self.entries = {}
+                self._pending = []
+                self._rewrite = True
+
+    def get(self, filepath):
+        """캐시된 결과 조회 - (결과 또는 None, 파일 키) 반환"""
+        try:
+            st = os.stat(filepath)
+        except OSError:
+            return None, None
+        key = (st.st_mtime_ns, st.st_size)
+        entry = self.entries.get(filepath)
+        if entry and entry[0] == key[0] and entry[1] == key[1]:
+            return dict(entry[2]), key
+        return None, key
+
+    def put(self, filepath, key, result):
+        """검사 결과 저장 (오류 결과는 저장하지 않음)"""
+        if key is None or result.get('status', -1) < 0:
+            return
+        result = dict(result)
+        try:
+            line = json_dumps_compact([filepath, key[0], key[1], result])
+        except (TypeError, ValueError):
+            return  # UTF-8로 인코딩할 수 없는 경로(서로게이트 포함)는 캐시하지 않음
+        with self._lock:
+            self.entries.pop(filepath, None)
+            if len(self.entries) >= SCAN_CACHE_MAX_ENTRIES:
+                del self.entries[next(iter(self.entries))]
+            self.entries[filepath] = [key[0], key[1], result]
+            self._pending.append(line)
+
+    def save(self):
+        """새 항목만 파일 끝에 추가 (버전 변경/압축이 필요하면 전체 다시 쓰기)"""
+        with self._lock:
+            rewrite, self._rewrite = self._rewrite, False
+            if rewrite:
+                lines = [json_dumps_compact({'version': self.version})]
+                lines.extend(json_dumps_compact([filepath, *entry]) for filepath, entry in self.entries.items())
+                self._pending = []
+            else:
+                lines, self._pending = self._pending, []
+        if not lines:
+            return
+        data = b''.join(line + b'\n' for line in lines)
+        try:
+            if rewrite:
+                write_file_atomic(self.path, data)
+            else:
+                with open(self.path, 'ab') as f:
+                    f.write(data)
+        except Exception as e:
+            print(f"[캐시] 스캔 캐시 저장 오류: {e}")
+
+SCAN_CACHE = ScanCache(SCAN_CACHE_FILE)
+
+# 엔진이 내용을 읽지 않고 정상 처리하는 파일 크기 상한 (antivirus_core.cpp MAX_FILE_SIZE)
+ENGINE_MAX_FILE_SIZE = 100 * 1024 * 1024
+
+def unread_scan_result(size):
+    """엔진이 읽지 않는 크기(빈 파일/상한 초과)의 상세 결과 - 엔진 응답과 같은 형식"""
+    return {"status": 0, "threat_type": "none", "threat_name": "Clean",
+            "md5": "", "sha256": "", "entropy": 0, "file_size": size}
+
+# ============================================================================
+# 정상 파일 블룸 필터 (기본 스캔 재검사 생략)
+# ============================================================================
+# 2 MiB, 해시 10개 → 100만 개 기준 거짓 양성 약 0.05%
+# (거짓 양성 = 검사하지 않은 파일을 정상으로 간주하므로 넉넉하게 잡음)
+CLEAN_BLOOM_BITS = 1 << 24
+CLEAN_BLOOM_HASHES = 10
+CLEAN_BLOOM_CAPACITY = 1000000  # 이보다 많이 추가되면 비우고 새로 시작
+
+class CleanBloomFilter:
+    """정상 판정된 파일 (경로, 크기, mtime_ns) 블룸 필터 - 기본 스캔 전용
+
+    상세 스캔은 결과(해시 등)가 필요하므로 ScanCache를 사용.
+    """
+
+    def __init__(self, path, bits=CLEAN_BLOOM_BITS, k=CLEAN_BLOOM_HASHES):
+        self.path = path
+        self.nbits = bits
+        self.k = k
+        self._unpack = struct.Struct(f'<{k}I').unpack
+        self.version = None
+        self.count = 0
+        self.bits = bytearray(bits >> 3)
+        self._loaded = False
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def _load(self):
+        self._loaded = True
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'rb') as f:
+                header = json_loads(f.readline())
+                data = f.read()
+            if header.get('bits') == self.nbits and header.get('k') == self.k and len(data) == len(self.bits):
+                self.version = header.get('version')
+                self.count = header.get('count', 0)
+                self.bits = bytearray(data)
+        except Exception as e:
+            print(f"[캐시] 블룸 필터 로드 오류: {e}")
+
+    def clear(self):
+        self.bits = bytearray(self.nbits >> 3)
+        self.count = 0
+        self._dirty = True
+
+    def validate(self):
+        """엔진/시그니처 DB가 바뀌었으면 비우기 (스캔 시작 시 호출)
+
+        필터에 걸린 파일은 엔진을 거치지 않으므로 DLL 내용과 추가 룰 다이제스트까지 같을 때만 유지.
+        """
+        if not self._loaded:
+            self._load()
+        version = get_engine_cache_version()
+        if self.version != version:
+            self.version = version
+            self.clear()
+
+    def _positions(self, filepath, st):
+        digest = hashlib.blake2b(f"{filepath}\0{st.st_size}\0{st.st_mtime_ns}".encode('utf-8', 'surrogatepass'),
+                                 digest_size=self.k * 4).digest()
+        nbits = self.nbits
+        return [h % nbits for h in self._unpack(digest)]
+
+    def identity(self, filepath):
+        """파일 식별자 비트 위치 (stat 실패 시 None)"""
+        try:
+            return self._positions(filepath, os.stat(filepath))
+        except OSError:
+            return None
+
+    def contains(self, positions):
+        bits = self.bits
+        return all(bits[p >> 3] & (1 << (p & 7)) for p in positions)
+
+    def add(self, positions):
+        with self._lock:
+            if self.count >= CLEAN_BLOOM_CAPACITY:
+                self.clear()
+            bits = self.bits
+            for p in positions:
+                bits[p >> 3] |= 1 << (p & 7)
+            self.count += 1
+            self._dirty = True
+
+    def save(self):
+        """변경된 경우에만 파일로 저장"""
+        if not self._dirty:
+            return
+        with self._lock:
+            header = json_dumps_compact({'version': self.version, 'bits': self.nbits,
+                                         'k': self.k, 'count': self.count})
+            data = header + b'\n' + bytes(self.bits)
+            self._dirty = False
+        try:
+            write_file_atomic(self.path, data)
+        except Exception as e:
+            print(f"[캐시] 블룸 필터 저장 오류: {e}")
+
+CLEAN_BLOOM = CleanBloomFilter(CLEAN_BLOOM_FILE)
+
+# ============================================================================
+# 스트리밍 파일 열거 (열거와 스캔을 동시에 진행)
+# ============================================================================
+# 열거 청크 크기 - 배치 스캔 크기와 같게 두어 스캔 스레드가 청크를 다시 나누지 않게 함
+ENUM_CHUNK_SIZE = SCAN_BATCH_SIZE
+
+
+# 열거 스레드가 스캔보다 앞서 쌓아둘 수 있는 최대 청크 수 (메모리 상한)
+FEED_MAX_CHUNKS = 64
+
+
+class ScanFeed:
+    """열거된 (경로, 파일명) 청크를 스캔 스레드로 넘기는 크기 제한 대기열
+
+    가득 차면 열거 쪽이 기다림. 순회는 close() 후 남은 청크를 모두 꺼내면 끝남
+    """
+
+    def __init__(self, max_chunks=FEED_MAX_CHUNKS):
+        self._queue = queue.Queue(max_chunks)
+        self._closed = False
+
+    def put_chunk(self, entries):
+        """청크 추가 (열거 스레드에서 호출) - 닫히면 버림"""
+        while entries and not self._closed:
+            try:
+                self._queue.put(entries, timeout=0.1)
+                return
+            except queue.Full:
+                pass
+
+    def close(self):
+        """더 이상 들어올 항목이 없음 (중복 호출 무시)"""
+        self._closed = True
+
+    def iter_chunks(self):
+        """넣은 청크를 그대로 순회"""
+        while True:
+            try:
+                chunk = self._queue.get(timeout=0.1)
+            except queue.Empty:
+                # close() 전에 넣은 청크가 남아 있을 수 있으므로 비었는지 다시 확인
+                if self._closed and self._queue.empty():
+                    return
+                continue
+            yield chunk
+
+    def __iter__(self):
+        for chunk in self.iter_chunks():
+            yield from chunk
+
+
+class FileEnumerator(QThread):
+    """여러 스레드로 폴더를 순회하며 ENUM_CHUNK_SIZE개 이상 모이면 feed에 넣음 (끝나면 feed를 닫음)"""
+    finished_enum = pyqtSignal(int)
+
+    def __init__(self, paths, feed, recursive=True, max_files=None, workers=ENUM_WORKERS):
         super().__init__()
         self.paths = paths if isinstance(paths, list) else [paths]
-        self.max_files = max_files
+        self.feed = feed
         self.recursive = recursive
-        self._stop_requested = False
-    
+        self.max_files = max_files  # 전체 경로를 합친 상한 (None이면 제한 없음)
+        self.workers = workers
+        self._cancel = threading.Event()  # stop() 요청
+        # 순회 워커 종료 플래그 - stop()과 함께 설정되고, 상한 도달로 순회를 닫을 때도 설정됨
+        self._walker_cancel = threading.Event()
+
     def stop(self):
-        self._stop_requested = True
-    
+        self._cancel.set()
+        self._walker_cancel.set()  # 폴더를 읽고 있는 워커도 바로 멈춤
+
     def run(self):
-        file_list = []
-        for path in self.paths:
-            if self._stop_requested:
-                break
-            try:
-                if self.recursive:
-                    for root, _, files in os.walk(path):
-                        if self._stop_requested:
-                            break
-                        for name in files:
-                            if self._stop_requested:
-                                break
-                            file_list.append(os.path.join(root, name))
-                            if len(file_list) % 1000 == 0:
-                                self.progress_msg.emit(f"파일 수집 중... {len(file_list)}개")
-                            if len(file_list) >= self.max_files:
-                                break
-                        if len(file_list) >= self.max_files:
-                            break
-                else:
-                    for name in os.listdir(path):
-                        filepath = os.path.join(path, name)
-                        if os.path.isfile(filepath):
-                            file_list.append(filepath)
-            except Exception as e:
-                self.progress_msg.emit(f"오류: {e}")
-        
-        self.finished.emit(file_list)
+        count = 0
+        chunk = []
+        # 순회 워커는 별도 플래그 사용 (상한 도달로 멈춰도 stop()과 구분)
+        walker = iter_dir_entries_parallel(self.paths, self.workers, self.recursive, self._walker_cancel)
+        try:
+            for files in walker:
+                if self._cancel.is_set():
+                    break
+                if self.max_files is not None:
+                    files = files[:self.max_files - count - len(chunk)]
+                chunk.extend(files)
+                if len(chunk) >= ENUM_CHUNK_SIZE:
+                    # 꽉 찬 청크는 오프셋으로 잘라 넘기고 나머지만 남김 (남은 목록을 매번 복사하지 않음)
+                    full = len(chunk) - len(chunk) % ENUM_CHUNK_SIZE
+                    for offset in range(0, full, ENUM_CHUNK_SIZE):
+                        self.feed.put_chunk(chunk[offset:offset + ENUM_CHUNK_SIZE])
+                    count += full
+                    chunk = chunk[full:]
+                if self.max_files is not None and count + len(chunk) >= self.max_files:
+                    break
+        finally:
+            walker.close()
+        if chunk and not self._cancel.is_set():
+            count += len(chunk)
+            self.feed.put_chunk(chunk)
+        # 개수를 먼저 알린 뒤 닫음 - 스캔 스레드의 finished보다 GUI에 먼저 도착하도록
+        self.finished_enum.emit(count)
+        self.feed.close()
 
 # ============================================================================
 # 배치 스캔 스레드
 # ============================================================================
+class ScanTask(QRunnable):
+    """청크 스캔 작업 (QThreadPool 워커에서 실행) - 완료 시 done 설정"""
+
+    def __init__(self, scan_func, chunk, cancel_event):
+        super().__init__()
+        self.setAutoDelete(False)  # 결과를 읽을 때까지 파이썬 쪽에서 보관
+        self.scan_func = scan_func
+        self.chunk = chunk
+        self.cancel_event = cancel_event
+        self.result = None
+        self.error = None
+        self.done = threading.Event()
+
+    def run(self):
+        try:
+            # 취소된 뒤 대기열에서 꺼내진 작업은 스캔하지 않음
+            if not self.cancel_event.is_set():
+                self.result = self.scan_func(self.chunk)
+        except Exception as e:
+            self.error = e
+        finally:
+            self.done.set()
+
 class BatchScanThread(QThread):
+    """배치 스캔 공통 부분 (시그널, 통계, 취소, 청크 스케줄링)
+
+    스캔 방식별 루프는 DetailedScanThread / BasicScanThread에서 구현
+    (파일마다 상세/기본 여부를 분기하지 않도록). 생성은 make_scan_thread() 사용.
+
+    하위 클래스가 구현할 메서드:
+      _scan_chunk(chunk) - 청크 전체를 엔진 배치 호출로 스캔 (워커 스레드에서 호출)
+      _process_chunk(start, chunk, scanned) - 배치 결과 반영 (스캔 스레드에서 순서대로 호출)
+      _scan_one(i, filepath, filename) - 배치 미지원 DLL에서 파일 하나 스캔
+    """
     progress = pyqtSignal(int)
     result_msg = pyqtSignal(str)
-    result_detailed = pyqtSignal(dict)
+    results_ready = pyqtSignal(list)  # 상세 스캔 결과 묶음 (진행률과 같은 간격으로 발송)
     stats_update = pyqtSignal(dict)
-    skipped_file = pyqtSignal(str)  # 제외된 파일 시그널
+    skipped_files = pyqtSignal(list)  # 제외된 파일 메시지 묶음 (진행률과 같은 간격으로 발송)
     finished = pyqtSignal()
 
-    def __init__(self, file_list, use_detailed=True, exclusions=None):
+    def __init__(self, file_list, exclusions=None, max_workers=1, total_hint=None):
         super().__init__()
+        # (경로, 파일명) 리스트 또는 제너레이터 - 청크 단위로 꺼내 쓰므로 전체 목록이 필요 없음
         self.file_list = file_list
-        self.use_detailed = use_detailed
+        # 전체 파일 수 (모르면 None - 진행바는 진행 표시만)
+        self.total = len(file_list) if hasattr(file_list, '__len__') else total_hint
+        self.max_workers = max(1, max_workers)
         self.exclusions = exclusions or {'folders': [], 'files': [], 'extensions': [], 'hashes': []}
         self.stats = ScanStats()
-        self._stop_requested = False
+        self._cancel = threading.Event()  # 스캔 스레드와 워커가 공유하는 취소 플래그
         self.was_stopped = False  # 중지되었는지 여부
+        self._emit_timer = QElapsedTimer()
+        self._last_index = 0
+        self._pending_results = []
+        self._pending_skipped = []
 
     def stop(self):
-        self._stop_requested = True
+        self._cancel.set()
+
+    @property
+    def processed(self):
+        """지금까지 처리한 파일 수"""
+        return self._last_index
 
     def run(self):
-        for i, filepath in enumerate(self.file_list, 1):
-            if self._stop_requested:
-                self.was_stopped = True  # 중지됨 표시
-                self.result_msg.emit("\n[중지됨] 사용자가 스캔을 중지했습니다.\n")
+        self._emit_timer.start()
+        self._before_scan()
+        if self._batch_supported():
+            self._run_batched()
+        else:
+            self._run_sequential()
+        self._flush_progress()  # 마지막 상태는 항상 발송
+        self._after_scan()
+        self.finished.emit()
+
+    # ---- 스캔 방식별 구현 ----
+    def _batch_supported(self):
+        return False
+
+    def _before_scan(self):
+        pass
+
+    def _after_scan(self):
+        pass
+
+    # ---- 공통 ----
+    def _iter_chunks(self, size):
+        """(시작 인덱스, 청크) 순회 - file_list에서 size개씩 꺼냄"""
+        if isinstance(self.file_list, ScanFeed):
+            yield from self._iter_feed_chunks(size)
+            return
+        it = iter(self.file_list)
+        start = 0
+        while True:
+            chunk = list(islice(it, size))
+            if not chunk:
+                return
+            yield start, chunk
+            start += len(chunk)
+
+    def _iter_feed_chunks(self, size):
+        """열거 스레드가 만든 청크를 그대로 사용 (size보다 큰 청크만 나눔)"""
+        start = 0
+        for chunk in self.file_list.iter_chunks():
+            parts = [chunk] if len(chunk) <= size else \
+                [chunk[offset:offset + size] for offset in range(0, len(chunk), size)]
+            for part in parts:
+                yield start, part
+                start += len(part)
+
+    def _run_batched(self):
+        """SCAN_BATCH_SIZE개씩 묶어 DLL을 한 번만 호출"""
+        chunks = self._iter_chunks(SCAN_BATCH_SIZE)
+        if self.max_workers == 1:
+            for start, chunk in chunks:
+                if self._cancel.is_set():
+                    self._mark_stopped()
+                    break
+                self._process_chunk(start, chunk, self._scan_chunk(chunk))
+            return
+
+        # 병렬 스캔 - DLL 호출 중에는 GIL이 해제되므로 청크를 QThreadPool 워커에서 동시에 스캔
+        # 워커 수의 2배까지만 미리 제출하고, 결과는 입력 순서대로 처리
+        pool = QThreadPool()
+        pool.setMaxThreadCount(self.max_workers)
+        window = self.max_workers * 2
+        pending = deque()
+        while True:
+            while len(pending) < window and not self._cancel.is_set():
+                next_chunk = next(chunks, None)
+                if next_chunk is None:
+                    break
+                start, chunk = next_chunk
+                task = ScanTask(self._scan_chunk, chunk, self._cancel)
+                pending.append((start, chunk, task))
+                pool.start(task)
+
+            # 취소 확인은 청크 단위로 한 번
+            if self._cancel.is_set():
+                self._mark_stopped()
+                break
+            if not pending:
                 break
 
-            # 제외 목록 확인
-            excluded, reason = is_excluded(filepath, self.exclusions)
-            if excluded:
-                self.stats.skipped += 1
-                self.skipped_file.emit(f"[제외] {os.path.basename(filepath)} - {reason}")
-                self.progress.emit(i)
-                self.stats_update.emit({
-                    'total': self.stats.total_scanned,
-                    'clean': self.stats.clean_files,
-                    'malicious': self.stats.malicious_files,
-                    'suspicious': self.stats.suspicious_files,
-                    'errors': self.stats.errors,
-                    'skipped': self.stats.skipped
-                })
-                continue
+            start, chunk, task = pending.popleft()
+            task.done.wait()
+            if task.error is not None:
+                print(f"청크 스캔 오류: {task.error}")
+                # 워커에서 실패한 청크는 이 스레드에서 다시 스캔
+                task.result = self._scan_chunk(chunk)
+            self._process_chunk(start, chunk, task.result)
+
+        pool.clear()  # 아직 시작하지 않은 작업 제거
+        pool.waitForDone()
+
+    def _check_exclusions(self, chunk):
+        """청크의 제외 여부 확인 - (확인 결과 목록, 스캔 대상 경로 목록)"""
+        exclusions = self.exclusions
+        checks = [is_excluded(filepath, exclusions, filename) for filepath, filename in chunk]
+        targets = [filepath for (filepath, _), (excluded, _) in zip(chunk, checks) if not excluded]
+        return checks, targets
+
+    def _run_sequential(self):
+        """파일 단위 스캔 (배치 API가 없는 DLL) - 취소 확인은 CANCEL_CHECK_INTERVAL개마다"""
+        scan_one = self._scan_one
+        skip = self._skip
+        exclusions = self.exclusions
+        cancel = self._cancel
+        for start, chunk in self._iter_chunks(CANCEL_CHECK_INTERVAL):
+            if cancel.is_set():
+                self._mark_stopped()
+                break
 
-            if self.use_detailed:
-                result_dict = scan_file_detailed(filepath)
-                result_dict['filepath'] = filepath
-                
-                # 해시 제외 확인
-                md5 = result_dict.get('md5', '')
-                sha256 = result_dict.get('sha256', '')
-                hash_excluded, hash_reason = is_hash_excluded(md5, sha256, self.exclusions)
-                if hash_excluded:
-                    self.stats.skipped += 1
-                    self.skipped_file.emit(f"[제외] {os.path.basename(filepath)} - {hash_reason}")
-                    self.progress.emit(i)
-                    self.stats_update.emit({
-                        'total': self.stats.total_scanned,
-                        'clean': self.stats.clean_files,
-                        'malicious': self.stats.malicious_files,
-                        'suspicious': self.stats.suspicious_files,
-                        'errors': self.stats.errors,
-                        'skipped': self.stats.skipped
-                    })
-                    continue
-                
-                self.result_detailed.emit(result_dict)
-
-                status = result_dict.get('status', -1)
-                self.stats.total_scanned += 1
-                if status == 0:
-                    self.stats.clean_files += 1
-                elif status in [1, 2]:
-                    self.stats.malicious_files += 1
-                elif status == 3:
-                    self.stats.suspicious_files += 1
+            for i, (filepath, filename) in enumerate(chunk, start + 1):
+                # 제외 목록 확인
+                excluded, reason = is_excluded(filepath, exclusions, filename)
+                if excluded:
+                    skip(i, filename, reason)
                 else:
-                    self.stats.errors += 1
+                    scan_one(i, filepath, filename)
+
+    def _mark_stopped(self):
+        self.was_stopped = True  # 중지됨 표시
+        self.result_msg.emit("\n[중지됨] 사용자가 스캔을 중지했습니다.\n")
+
+    def _report_progress(self, i):
+        """진행률/통계 갱신 - PROGRESS_EMIT_INTERVAL_MS 간격으로만 시그널 발송"""
+        self._last_index = i
+        if self._emit_timer.elapsed() >= PROGRESS_EMIT_INTERVAL_MS:
+            self._flush_progress()
+
+    def _flush_progress(self):
+        """현재 진행률/통계 시그널 발송 (모아둔 결과 포함)"""
+        if self._pending_results:
+            self.results_ready.emit(self._pending_results)
+            self._pending_results = []
+        if self._pending_skipped:
+            self.skipped_files.emit(self._pending_skipped)
+            self._pending_skipped = []
+        self._emit_stats()
+        if self._last_index:
+            self.progress.emit(self._last_index)
+        self._emit_timer.restart()
+
+    def _emit_stats(self):
+        errors, clean, malicious, suspicious = self.stats.counts
+        self.stats_update.emit({
+            'total': errors + clean + malicious + suspicious,
+            'clean': clean,
+            'malicious': malicious,
+            'suspicious': suspicious,
+            'errors': errors,
+            'skipped': self.stats.skipped
+        })
+
+    def _skip(self, i, filename, reason):
+        """제외된 파일 처리"""
+        self.stats.skipped += 1
+        self._pending_skipped.append(f"[제외] {filename} - {reason}")
+        self._report_progress(i)
+
+class DetailedScanThread(BatchScanThread):
+    """상세 스캔 (해시/엔트로피/PE 정보 포함, 결과 캐시 사용)"""
+
+    def _batch_supported(self):
+        return has_batch_scan
+
+    def _before_scan(self):
+        SCAN_CACHE.validate()
+
+    def _after_scan(self):
+        SCAN_CACHE.save()
+
+    def _scan_chunk(self, chunk):
+        """청크 스캔 (워커 스레드에서 실행) - 캐시에 없는(또는 변경된) 파일만 DLL로 스캔"""
+        checks, targets = self._check_exclusions(chunk)
+        cached = [self._lookup(filepath) for filepath in targets]
+        scanned = iter(scan_files_detailed(
+            [filepath for filepath, (result, _) in zip(targets, cached) if result is None]))
+        results = []
+        for filepath, (result, key) in zip(targets, cached):
+            if result is None:
+                result = next(scanned)
+                SCAN_CACHE.put(filepath, key, result)
+            results.append(result)
+        return checks, results
+
+    def _process_chunk(self, start, chunk, scanned):
+        """청크 결과 처리 - 입력 순서대로 (진행률이 역행하지 않도록)"""
+        checks, results = scanned
+        # 루프 안에서 반복 조회하지 않도록 자주 쓰는 속성은 지역 변수로
+        skip = self._skip
+        handle = self._handle_result
+        next_result = iter(results).__next__
+        for i, ((filepath, filename), (excluded, reason)) in enumerate(zip(chunk, checks), start + 1):
+            if excluded:
+                skip(i, filename, reason)
+            else:
+                handle(i, filepath, filename, next_result())
+
+    def _scan_one(self, i, filepath, filename):
+        """파일 하나 상세 스캔 (캐시 확인 후)"""
+        result, key = self._lookup(filepath)
+        if result is None:
+            result = scan_file_detailed(filepath)
+            SCAN_CACHE.put(filepath, key, result)
+        self._handle_result(i, filepath, filename, result)
+
+    @staticmethod
+    def _lookup(filepath):
+        """캐시 조회 - 크기만으로 결과가 정해지는 파일은 DLL에 넘기지 않음 (열기/읽기 생략)
+
+        (결과 또는 None, 파일 키) 반환. 크기로 정한 결과는 키를 None으로 돌려 캐시에 넣지 않음
+        """
+        result, key = SCAN_CACHE.get(filepath)
+        if result is None and key is not None and not 0 < key[1] <= ENGINE_MAX_FILE_SIZE:
+            return unread_scan_result(key[1]), None
+        return result, key
+
+    def _handle_result(self, i, filepath, filename, result_dict):
+        """상세 스캔 결과 처리 (해시 제외 확인, 통계, 시그널)"""
+        row = ScanRow(filepath, filename, result_dict)
+
+        # 해시 제외 확인
+        hash_excluded, hash_reason = is_hash_excluded(row.md5, result_dict.get('sha256', ''), self.exclusions)
+        if hash_excluded:
+            self._skip(i, filename, hash_reason)
+            return
 
-                status_map = {0: "정상", 1: "악성-시그니처", 2: "악성-해시", 3: "의심-휴리스틱", -1: "오류"}
-                status = status_map.get(result_dict.get('status', -1), "알수없음")
-                threat = result_dict.get('threat_name', 'Unknown')
-                msg = f"[{status}] {threat} - {os.path.basename(filepath)}"
-                self.result_msg.emit(msg)
+        self._pending_results.append(row)
+        self.stats.add(row.status)
+        self._report_progress(i)
+
+class BasicScanThread(BatchScanThread):
+    """기본 스캔 (결과 코드만)"""
+
+    def _batch_supported(self):
+        return has_batch_basic_scan
+
+    def _before_scan(self):
+        CLEAN_BLOOM.validate()
+
+    def _after_scan(self):
+        CLEAN_BLOOM.save()
+
+    def _scan_chunk(self, chunk):
+        """청크 스캔 (워커 스레드에서 실행) - 이전에 정상이었던(변경 없는) 파일은 DLL 호출 생략"""
+        checks, targets = self._check_exclusions(chunk)
+        identities = [CLEAN_BLOOM.identity(filepath) for filepath in targets]
+        known = [ident is not None and CLEAN_BLOOM.contains(ident) for ident in identities]
+        scanned = iter(scan_files_basic(
+            [filepath for filepath, is_known in zip(targets, known) if not is_known]))
+        codes = []
+        for ident, is_known in zip(identities, known):
+            if is_known:
+                codes.append(0)
             else:
-                msg, code = scan_file_basic(filepath)
-                self.result_msg.emit(msg)
-                self.stats.total_scanned += 1
-                if code == 0:
-                    self.stats.clean_files += 1
-                elif code in [1, 2]:
-                    self.stats.malicious_files += 1
-                elif code == 3:
-                    self.stats.suspicious_files += 1
-                else:
-                    self.stats.errors += 1
+                code = next(scanned)
+                if code == 0 and ident is not None:
+                    CLEAN_BLOOM.add(ident)
+                codes.append(code)
+        return checks, codes
+
+    def _process_chunk(self, start, chunk, scanned):
+        """청크 결과 처리 - 통계는 청크 단위로 한 번에 집계"""
+        checks, codes = scanned
+        self.stats.add_codes(codes)
+        skip = self._skip
+        report = self._report_progress
+        for i, ((filepath, filename), (excluded, reason)) in enumerate(zip(chunk, checks), start + 1):
+            if excluded:
+                skip(i, filename, reason)
+            else:
+                report(i)
+
+    def _scan_one(self, i, filepath, filename):
+        """파일 하나 기본 스캔 (블룸 필터 확인 후)"""
+        ident = CLEAN_BLOOM.identity(filepath)
+        if ident is not None and CLEAN_BLOOM.contains(ident):
+            code = 0
+        else:
+            code = scan_file_basic(filepath)[1]
+            if code == 0 and ident is not None:
+                CLEAN_BLOOM.add(ident)
+        self.stats.add(code)
+        self._report_progress(i)
+
+def make_scan_thread(file_list, use_detailed=True, exclusions=None, max_workers=1, total_hint=None):
+    """스캔 방식에 맞는 배치 스캔 스레드 생성"""
+    thread_class = DetailedScanThread if use_detailed else BasicScanThread
+    return thread_class(file_list, exclusions, max_workers, total_hint)
+
+# ============================================================================
+# 실시간 모니터링
+# ============================================================================
+# 실시간 감시 대기열 크기 / 스캔 워커 수
+MONITOR_QUEUE_SIZE = 1000
+MONITOR_WORKERS = 2
+# 감시 로그를 모아서 GUI에 반영하는 간격 (ms) - 파일이 몰려 생겨도 로그 갱신은 묶어서 처리
+MONITOR_LOG_COALESCE_MS = 100
+
+
+def make_monitor_observer():
+    """실시간 감시 Observer - 폴링으로 떨어지지 않도록 OS 기본 백엔드를 직접 선택
+
+    Windows: ReadDirectoryChangesW, Linux: inotify (감시 스레드는 이벤트가 올 때까지 대기)
+    """
+    if sys.platform.startswith("win"):
+        from watchdog.observers.read_directory_changes import WindowsApiObserver as observer_class
+    elif sys.platform.startswith("linux"):
+        from watchdog.observers.inotify import InotifyObserver as observer_class
+    else:
+        from watchdog.observers import Observer as observer_class
+    return observer_class()
+
+_folder_handler_class = None
+
+def make_folder_handler(callback):
+    """실시간 감시 핸들러 생성 (watchdog은 감시를 처음 시작할 때 임포트)"""
+    global _folder_handler_class
+    if _folder_handler_class is None:
+        from watchdog.events import FileSystemEventHandler
+
+        class FolderHandler(FileSystemEventHandler):
+            """watchdog 스레드는 대기열에 넣기만 하고, 스캔은 워커 스레드에서 처리"""
+
+            def __init__(self, callback):
+                self.callback = callback
+                self.queue = queue.Queue(maxsize=MONITOR_QUEUE_SIZE)
+                self._workers = [threading.Thread(target=self._worker, daemon=True)
+                                 for _ in range(MONITOR_WORKERS)]
+                for worker in self._workers:
+                    worker.start()
+
+            def on_created(self, event):
+                if not event.is_directory:
+                    try:
+                        self.queue.put_nowait(event.src_path)
+                    except queue.Full:
+                        self.callback(f"[경고] 감시 대기열이 가득 차 건너뜀: {event.src_path}")
+
+            def _worker(self):
+                while True:
+                    path = self.queue.get()
+                    try:
+                        if path is None:  # 종료 신호
+                            return
+                        msg, _ = scan_file_basic(path)
+                        self.callback(msg)
+                    finally:
+                        self.queue.task_done()
+
+            def close(self):
+                """대기 중인 이벤트를 버리고 워커 종료"""
+                try:
+                    while True:
+                        self.queue.get_nowait()
+                        self.queue.task_done()
+                except queue.Empty:
+                    pass
+                for _ in self._workers:
+                    self.queue.put(None)
+
+        _folder_handler_class = FolderHandler
+    return _folder_handler_class(callback)
+
+# ============================================================================
+# 파일 잠금 프로세스 탐지 (Windows: 시스템 핸들 테이블, 그 외: psutil)
+# ============================================================================
+SYSTEM_EXTENDED_HANDLE_INFORMATION = 64
+STATUS_INFO_LENGTH_MISMATCH = 0xC0000004
+PROCESS_TERMINATE = 0x0001
+PROCESS_DUP_HANDLE = 0x0040
+PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+DUPLICATE_SAME_ACCESS = 0x0002
+FILE_READ_ATTRIBUTES = 0x0080
+FILE_SHARE_ALL = 0x0007
+OPEN_EXISTING = 3
+FILE_FLAG_BACKUP_SEMANTICS = 0x02000000
+FILE_TYPE_DISK = 0x0001
+FILE_ATTRIBUTE_NORMAL = 0x0080
+ERROR_NOT_SAME_DEVICE = 17
+INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+# 강제 종료하면 안 되는 시스템 프로세스
+PROTECTED_PROCESS_NAMES = frozenset(['system', 'csrss.exe', 'smss.exe', 'wininit.exe'])
+
+
+class _HandleEntry(ctypes.Structure):
+    """SYSTEM_HANDLE_TABLE_ENTRY_INFO_EX"""
+    _fields_ = [('Object', ctypes.c_void_p),
+                ('UniqueProcessId', ctypes.c_size_t),
+                ('HandleValue', ctypes.c_size_t),
+                ('GrantedAccess', ctypes.c_uint32),
+                ('CreatorBackTraceIndex', ctypes.c_uint16),
+                ('ObjectTypeIndex', ctypes.c_uint16),
+                ('HandleAttributes', ctypes.c_uint32),
+                ('Reserved', ctypes.c_uint32)]
+
+
+class _FileInfo(ctypes.Structure):
+    """BY_HANDLE_FILE_INFORMATION"""
+    _pack_ = 4  # FILETIME은 DWORD 두 개 (4바이트 정렬)
+    _fields_ = [('dwFileAttributes', ctypes.c_uint32),
+                ('ftCreationTime', ctypes.c_uint64),
+                ('ftLastAccessTime', ctypes.c_uint64),
+                ('ftLastWriteTime', ctypes.c_uint64),
+                ('dwVolumeSerialNumber', ctypes.c_uint32),
+                ('nFileSizeHigh', ctypes.c_uint32),
+                ('nFileSizeLow', ctypes.c_uint32),
+                ('nNumberOfLinks', ctypes.c_uint32),
+                ('nFileIndexHigh', ctypes.c_uint32),
+                ('nFileIndexLow', ctypes.c_uint32)]
+
+
+_kernel32 = None
+
+def _get_kernel32():
+    """핸들 값을 잘리지 않게 받도록 시그니처를 지정한 kernel32 (최초 사용 시 로드)"""
+    global _kernel32
+    if _kernel32 is None:
+        from ctypes import wintypes
+        k = ctypes.WinDLL('kernel32')
+        k.CreateFileW.restype = wintypes.HANDLE
+        k.CreateFileW.argtypes = [wintypes.LPCWSTR, wintypes.DWORD, wintypes.DWORD, wintypes.LPVOID,
+                                  wintypes.DWORD, wintypes.DWORD, wintypes.HANDLE]
+        k.OpenProcess.restype = wintypes.HANDLE
+        k.OpenProcess.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
+        k.GetCurrentProcess.restype = wintypes.HANDLE
+        k.DuplicateHandle.argtypes = [wintypes.HANDLE, wintypes.HANDLE, wintypes.HANDLE,
+                                      ctypes.POINTER(wintypes.HANDLE), wintypes.DWORD,
+                                      wintypes.BOOL, wintypes.DWORD]
+        k.CloseHandle.argtypes = [wintypes.HANDLE]
+        k.GetFileType.argtypes = [wintypes.HANDLE]
+        k.GetFileInformationByHandle.argtypes = [wintypes.HANDLE, ctypes.POINTER(_FileInfo)]
+        k.QueryFullProcessImageNameW.argtypes = [wintypes.HANDLE, wintypes.DWORD, wintypes.LPWSTR,
+                                                 ctypes.POINTER(wintypes.DWORD)]
+        k.TerminateProcess.argtypes = [wintypes.HANDLE, wintypes.UINT]
+        k.SetFileAttributesW.argtypes = [wintypes.LPCWSTR, wintypes.DWORD]
+        _kernel32 = k
+    return _kernel32
+
+
+def _query_handle_table():
+    """시스템 전체 핸들 테이블을 한 번에 조회 (버퍼가 작으면 늘려서 재시도)"""
+    ntdll = ctypes.WinDLL('ntdll')
+    size = 1 << 20
+    while True:
+        buf = ctypes.create_string_buffer(size)
+        ret_len = ctypes.c_ulong(0)
+        status = ntdll.NtQuerySystemInformation(SYSTEM_EXTENDED_HANDLE_INFORMATION, buf,
+                                                ctypes.c_ulong(size), ctypes.byref(ret_len))
+        status &= 0xFFFFFFFF
+        if status == STATUS_INFO_LENGTH_MISMATCH:
+            # 조회 사이에도 핸들이 늘어날 수 있으므로 여유를 둠
+            size = max(size * 2, ret_len.value + (1 << 16))
+            continue
+        if status != 0:
+            raise OSError(f"NtQuerySystemInformation 실패 (0x{status:08X})")
+        # 헤더: NumberOfHandles, Reserved (ULONG_PTR 2개)
+        count = ctypes.c_size_t.from_buffer(buf).value
+        return (_HandleEntry * count).from_buffer(buf, 2 * ctypes.sizeof(ctypes.c_size_t))
+
+
+def _file_identity(kernel32, handle):
+    """(볼륨 일련번호, 파일 인덱스) - 경로 표기와 무관하게 같은 파일인지 비교"""
+    info = _FileInfo()
+    if not kernel32.GetFileInformationByHandle(handle, ctypes.byref(info)):
+        return None
+    return (info.dwVolumeSerialNumber, info.nFileIndexHigh, info.nFileIndexLow)
+
+
+def _find_file_lock_pids_psutil(file_path):
+    """psutil로 파일을 열고 있는 다른 프로세스 찾기 (Windows 이외, psutil 없으면 ImportError)"""
+    import psutil
+    target = os.path.realpath(file_path)
+    own_pid = os.getpid()
+    pids = set()
+    for proc in psutil.process_iter():
+        if proc.pid == own_pid:
+            continue
+        try:
+            if any(item.path == target for item in proc.open_files()):
+                pids.add(proc.pid)
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            continue
+    return pids
+
+
+def find_file_lock_pids(file_path):
+    """파일을 열고 있는 다른 프로세스의 PID 집합
+
+    핸들 테이블을 한 번만 조회하고 파일 객체 핸들만 복제해 대상 파일과 비교함.
+    파이프 핸들에서 멈추지 않도록 디스크 파일인지 먼저 확인 (이름 조회는 하지 않음)
+    """
+    if not sys.platform.startswith("win"):
+        return _find_file_lock_pids_psutil(file_path)
+    from ctypes import wintypes
+    kernel32 = _get_kernel32()
+
+    # 대상 파일을 속성 조회 권한으로 열어 식별자와 파일 객체 타입 번호를 얻음
+    target = kernel32.CreateFileW(os.path.abspath(file_path), FILE_READ_ATTRIBUTES, FILE_SHARE_ALL,
+                                  None, OPEN_EXISTING, FILE_FLAG_BACKUP_SEMANTICS, None)
+    if not target or target == INVALID_HANDLE_VALUE:
+        raise ctypes.WinError()
+    own_pid = os.getpid()
+    try:
+        target_id = _file_identity(kernel32, target)
+        table = _query_handle_table()
+        file_type_index = next((e.ObjectTypeIndex for e in table
+                                if e.UniqueProcessId == own_pid and e.HandleValue == target), None)
+    finally:
+        kernel32.CloseHandle(target)
+    if target_id is None or file_type_index is None:
+        raise OSError("대상 파일 핸들을 찾을 수 없음")
+
+    current = kernel32.GetCurrentProcess()
+    processes = {}
+    pids = set()
+    try:
+        for entry in table:
+            pid = entry.UniqueProcessId
+            if entry.ObjectTypeIndex != file_type_index or pid == own_pid or pid in pids:
+                continue
+            if pid not in processes:
+                processes[pid] = kernel32.OpenProcess(PROCESS_DUP_HANDLE, False, pid)
+            proc = processes[pid]
+            if not proc:
+                continue  # 접근 거부 (보호된 프로세스 등)
+
+            dup = wintypes.HANDLE()
+            if not kernel32.DuplicateHandle(proc, entry.HandleValue, current, ctypes.byref(dup),
+                                            0, False, DUPLICATE_SAME_ACCESS):
+                continue
+            try:
+                if (kernel32.GetFileType(dup) == FILE_TYPE_DISK
+                        and _file_identity(kernel32, dup) == target_id):
+                    pids.add(pid)
+            finally:
+                kernel32.CloseHandle(dup)
+    finally:
+        for proc in processes.values():
+            if proc:
+                kernel32.CloseHandle(proc)
+    return pids
+
+
+def get_process_name(pid):
+    """PID의 실행 파일 이름 (알 수 없으면 빈 문자열)"""
+    if not sys.platform.startswith("win"):
+        import psutil
+        try:
+            return psutil.Process(pid).name()
+        except psutil.Error:
+            return ""
+    from ctypes import wintypes
+    kernel32 = _get_kernel32()
+    proc = kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+    if not proc:
+        return ""
+    try:
+        buf = ctypes.create_unicode_buffer(1024)
+        size = wintypes.DWORD(len(buf))
+        if not kernel32.QueryFullProcessImageNameW(proc, 0, buf, ctypes.byref(size)):
+            return ""
+        return os.path.basename(buf.value)
+    finally:
+        kernel32.CloseHandle(proc)
+
+
+def terminate_process(pid):
+    """프로세스 강제 종료"""
+    if not sys.platform.startswith("win"):
+        import psutil
+        try:
+            psutil.Process(pid).kill()
+            return True
+        except psutil.Error:
+            return False
+    kernel32 = _get_kernel32()
+    proc = kernel32.OpenProcess(PROCESS_TERMINATE, False, pid)
+    if not proc:
+        return False
+    try:
+        return bool(kernel32.TerminateProcess(proc, 1))
+    finally:
+        kernel32.CloseHandle(proc)
+
+# ============================================================================
+# 최근 위협 목록 모델 (최대 개수 제한)
+# ============================================================================
+RECENT_THREATS_MAX = 200
+
+
+class RecentThreatsModel(QAbstractListModel):
+    """최근 위협 문자열 목록 - 가득 차면 가장 오래된 항목부터 제거"""
+
+    def __init__(self, maxlen=RECENT_THREATS_MAX, parent=None):
+        super().__init__(parent)
+        self._items = deque(maxlen=maxlen)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._items)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and index.isValid():
+            return self._items[index.row()]
+        return None
+
+    def add_threat(self, text):
+        if len(self._items) == self._items.maxlen:
+            self.beginRemoveRows(QModelIndex(), 0, 0)
+            self._items.popleft()
+            self.endRemoveRows()
+        row = len(self._items)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._items.append(text)
+        self.endInsertRows()
+
+
+# ============================================================================
+# 검사 결과 / 히스토리 테이블 (모델/뷰 - 셀마다 QTableWidgetItem을 만들지 않음)
+# ============================================================================
+RESULT_ACTION_COLUMN = 6  # '작업' 열 (위협 행에만 격리 버튼)
+
+@contextmanager
+def bulk_table_update(table):
+    """QTableWidget에 여러 행을 채우는 동안 다시 그리기/정렬/시그널 중지"""
+    sorting = table.isSortingEnabled()
+    table.setUpdatesEnabled(False)
+    table.setSortingEnabled(False)
+    blocked = table.blockSignals(True)
+    try:
+        yield table
+    finally:
+        table.blockSignals(blocked)
+        table.setSortingEnabled(sorting)
+        table.setUpdatesEnabled(True)
+
+class ScanResultModel(QAbstractTableModel):
+    """ScanRow 목록을 그대로 들고 있다가 보이는 셀만 문자열로 변환"""
+    HEADERS = ("파일명", "경로", "상태", "위협", "MD5", "크기", "작업")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and index.isValid():
+            return self.text(index.row(), index.column())
+        return None
+
+    def text(self, row, column):
+        """셀 표시 문자열 (내보내기에서도 사용)"""
+        r = self._rows[row]
+        if column == 0:
+            return r.filename
+        if column == 1:
+            return r.folder
+        if column == 2:
+            return status_label(r.status)
+        if column == 3:
+            return r.threat_name
+        if column == 4:
+            return r.md5[:16] + "..." if r.md5 else ""
+        if column == 5:
+            return f"{r.file_size} bytes"
+        return '🗂️ 격리' if r.is_threat else None
+
+    def row_at(self, row):
+        return self._rows[row]
+
+    def text_rows(self, columns):
+        """columns 열의 표시 문자열을 행마다 튜플로 모아 둔 스냅샷 (내보내기용)"""
+        text = self.text
+        return [tuple(text(row, column) for column in columns) for row in range(len(self._rows))]
+
+    def add_rows(self, rows):
+        """묶음 전체를 한 번의 삽입 알림으로 추가"""
+        if not rows:
+            return
+        start = len(self._rows)
+        self.beginInsertRows(QModelIndex(), start, start + len(rows) - 1)
+        self._rows.extend(rows)
+        self.endInsertRows()
+
+    def clear(self):
+        self.beginResetModel()
+        self._rows = []
+        self.endResetModel()
+
+class ButtonDelegate(QStyledItemDelegate):
+    """셀에 버튼 모양만 그리고 클릭 시 행 번호를 알림 (셀마다 QPushButton 위젯을 만들지 않음)"""
+    clicked = pyqtSignal(int)
+
+    def paint(self, painter, option, index):
+        text = index.data()
+        if not text:
+            super().paint(painter, option, index)
+            return
+        button = QStyleOptionButton()
+        button.rect = option.rect.adjusted(2, 2, -2, -2)
+        button.text = text
+        button.state = QStyle.State_Enabled
+        style = option.widget.style() if option.widget else QApplication.style()
+        style.drawControl(QStyle.CE_PushButton, button, painter, option.widget)
+
+    def editorEvent(self, event, model, option, index):
+        if (event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton
+                and index.data() and option.rect.contains(event.pos())):
+            self.clicked.emit(index.row())
+            return True
+        return False
+
+
+class HistoryModel(QAbstractTableModel):
+    """스캔 히스토리 표 - 표시 문자열 튜플 목록 (최신 기록이 맨 위, 최대 maxlen행)"""
+    HEADERS = ("시간", "스캔 유형", "총 파일", "위협 발견", "상태")
+
+    def __init__(self, maxlen=HISTORY_DISPLAY_LIMIT, parent=None):
+        super().__init__(parent)
+        self._maxlen = maxlen
+        self._rows = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and index.isValid():
+            return self._rows[index.row()][index.column()]
+        return None
+
+    def prepend_entries(self, entries):
+        """최신 순서의 기록 목록을 맨 위에 한 번에 삽입하고 maxlen을 넘는 행은 잘라냄"""
+        rows = [(entry['time'], entry['type'], str(entry['total']), str(entry['threats']), entry['status'])
+                for entry in islice(entries, self._maxlen)]
+        if not rows:
+            return
+        self.beginInsertRows(QModelIndex(), 0, len(rows) - 1)
+        self._rows[:0] = rows
+        self.endInsertRows()
+        if len(self._rows) > self._maxlen:
+            self.beginRemoveRows(QModelIndex(), self._maxlen, len(self._rows) - 1)
+            del self._rows[self._maxlen:]
+            self.endRemoveRows()
+
+    def clear(self):
+        self.beginResetModel()
+        self._rows = []
+        self.endResetModel()
+
+
+# ============================================================================
+# 결과 내보내기 (직렬화와 파일 쓰기는 백그라운드 스레드)
+# ============================================================================
+EXPORT_CSV_HEADER = ("파일명", "상태", "위협", "MD5", "크기")
+
+def write_export_file(filename, rows):
+    """스냅샷한 결과 행을 .json이면 JSON, 아니면 CSV로 저장"""
+    if filename.endswith('.json'):
+        results = [{'filename': name, 'status': status, 'threat': threat, 'md5': md5, 'size': size}
+                   for name, status, threat, md5, size in rows]
+        data = json_dumps_pretty(results)
+    else:
+        # csv 모듈(C 구현)로 메모리에 기록 - 쉼표가 든 경로도 올바르게 인용
+        buf = io.StringIO(newline='')
+        writer = csv.writer(buf)
+        writer.writerow(EXPORT_CSV_HEADER)
+        writer.writerows(rows)
+        data = buf.getvalue().encode('utf-8')  # UTF-8 인코딩은 전체에 대해 한 번만
+    write_file_atomic(filename, data)  # 덮어쓰다 실패해도 기존 파일은 그대로
+
+class ExportThread(QThread):
+    """결과 내보내기 - 행은 GUI 스레드에서 미리 스냅샷 (모델은 스레드 안전하지 않음)"""
+    export_done = pyqtSignal(str)  # 오류 메시지 (성공이면 빈 문자열)
+
+    def __init__(self, filename, rows):
+        super().__init__()
+        self.filename = filename
+        self.rows = rows
+
+    def run(self):
+        try:
+            write_export_file(self.filename, self.rows)
+        except Exception as e:
+            self.export_done.emit(str(e) or type(e).__name__)
+        else:
+            self.export_done.emit("")
+
+
+# ============================================================================
+# 대시보드 통계 카드 (위젯 하나에 네 카드를 직접 그림)
+# ============================================================================
+class StatCardsWidget(QWidget):
+    """통계 카드 네 개를 QPainter로 그리는 위젯 - 값이 바뀔 때만 다시 그림"""
+    CARDS = (("총 스캔", "#3498db"), ("정상", "#2ecc71"), ("악성", "#e74c3c"), ("의심", "#f39c12"))
+    SPACING = 8
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._values = (0, 0, 0, 0)
+        self._colors = [QColor(color) for _, color in self.CARDS]
+        self._title_font = QFont("Arial", 12, QFont.Bold)
+        self._value_font = QFont("Arial", 32, QFont.Bold)
+        self.setMinimumSize(4 * 150 + 3 * self.SPACING, 120)
+
+    def set_values(self, values):
+        values = tuple(values)
+        if values != self._values:
+            self._values = values
+            self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        card_width = (self.width() - 3 * self.SPACING) / 4
+        for i, ((title, _), color, value) in enumerate(zip(self.CARDS, self._colors, self._values)):
+            rect = QRectF(i * (card_width + self.SPACING), 0, card_width, self.height())
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(color)
+            painter.drawRoundedRect(rect, 8, 8)
+            painter.setPen(Qt.white)
+            painter.setFont(self._title_font)
+            painter.drawText(rect.adjusted(0, 16, 0, 0), Qt.AlignHCenter | Qt.AlignTop, title)
+            painter.setFont(self._value_font)
+            painter.drawText(rect.adjusted(0, 24, 0, 0), Qt.AlignCenter, str(value))
+        painter.end()
+
+
+# 공통 위젯 스타일 - 위젯마다 setStyleSheet 대신 setProperty("class", ...)로 지정
+# (테마 스타일시트 뒤에 붙여 한 번만 파싱)
+WIDGET_CLASS_QSS = """
+    QPushButton[class="toolbtn"] {
+        padding: 8px 16px;
+    }
+    QPushButton[class="toolbtn-strong"] {
+        padding: 8px 16px;
+        font-weight: bold;
+    }
+    QPushButton[class="danger"] {
+        background-color: #e74c3c;
+        color: white;
+        font-weight: bold;
+    }
+    QLabel[class="hint"] {
+        color: #7f8c8d;
+        font-size: 11px;
+        padding: 5px;
+    }
+"""
+
+# 테마 색상 (창/글자/입력칸 등 기본 색은 QPalette로, 테두리·여백 등 팔레트로 못 하는 것만 스타일시트로)
+# 역할: (창, 창 글자, 입력칸, 입력칸 교차행, 글자, 버튼, 버튼 글자, 선택, 비활성 글자)
+THEME_COLORS = {
+    True: ("#2b2b2b", "#ffffff", "#3a3a3a", "#2f2f2f", "#ffffff", "#3a3a3a", "#ffffff", "#3498db", "#7f7f7f"),
+    False: ("#f5f5f5", "#333333", "#ffffff", "#f9f9f9", "#333333", "#ffffff", "#333333", "#3498db", "#a0a0a0"),
+}
+
+@lru_cache(maxsize=2)
+def build_theme_palette(dark_mode):
+    """테마 QPalette - 테마마다 한 번만 만들어 재사용 (QApplication 생성 후 호출)"""
+    window, window_text, base, alternate, text, button, button_text, highlight, disabled = (
+        QColor(color) for color in THEME_COLORS[dark_mode])
+    palette = QApplication.style().standardPalette()
+    for role, color in ((QPalette.Window, window), (QPalette.WindowText, window_text),
+                        (QPalette.Base, base), (QPalette.AlternateBase, alternate),
+                        (QPalette.Text, text), (QPalette.Button, button),
+                        (QPalette.ButtonText, button_text), (QPalette.ToolTipBase, base),
+                        (QPalette.ToolTipText, text), (QPalette.Highlight, highlight),
+                        (QPalette.HighlightedText, QColor("#ffffff"))):
+        palette.setColor(role, color)
+    for role in (QPalette.WindowText, QPalette.Text, QPalette.ButtonText):
+        palette.setColor(QPalette.Disabled, role, disabled)
+    return palette
+
+# 테마 스타일시트 (모듈 로드 시 한 번만 만들어 둠)
+DARK_QSS = """
+    QGroupBox {
+        border: 2px solid #555555;
+        border-radius: 5px;
+        margin-top: 10px;
+        padding-top: 10px;
+        font-weight: bold;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px;
+    }
+    QPushButton {
+        background-color: #3a3a3a;
+        border: 1px solid #555555;
+        border-radius: 4px;
+        padding: 6px 12px;
+    }
+    QPushButton:hover {
+        background-color: #4a4a4a;
+    }
+    QPushButton:pressed {
+        background-color: #2a2a2a;
+    }
+    QLineEdit, QTextEdit, QSpinBox, QComboBox {
+        background-color: #3a3a3a;
+        border: 1px solid #555555;
+        border-radius: 3px;
+        padding: 4px;
+    }
+    QTableView {
+        background-color: #3a3a3a;
+        alternate-background-color: #2f2f2f;
+        gridline-color: #555555;
+    }
+    QHeaderView::section {
+        background-color: #4a4a4a;
+        padding: 4px;
+        border: 1px solid #555555;
+        font-weight: bold;
+    }
+    QProgressBar {
+        border: 1px solid #555555;
+        border-radius: 3px;
+        text-align: center;
+        background-color: #3a3a3a;
+    }
+    QProgressBar::chunk {
+        background-color: #3498db;
+    }
+    QListWidget {
+        background-color: #3a3a3a;
+        border: 1px solid #555555;
+    }
+    QTabWidget::pane {
+        border: 1px solid #555555;
+    }
+    QTabBar::tab {
+        background-color: #3a3a3a;
+        border: 1px solid #555555;
+        padding: 8px 16px;
+    }
+    QTabBar::tab:selected {
+        background-color: #4a4a4a;
+    }
+    QLabel#quarantine_path_label {
+        color: #5dade2;
+        font-weight: bold;
+    }
+    QLabel#settings_path_label {
+        color: #5dade2;
+        font-weight: bold;
+    }
+""" + WIDGET_CLASS_QSS
+
+LIGHT_QSS = """
+    QGroupBox {
+        border: 2px solid #cccccc;
+        border-radius: 5px;
+        margin-top: 10px;
+        padding-top: 10px;
+        font-weight: bold;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px;
+    }
+    QPushButton {
+        background-color: #ffffff;
+        border: 1px solid #cccccc;
+        border-radius: 4px;
+        padding: 6px 12px;
+    }
+    QPushButton:hover {
+        background-color: #e8e8e8;
+    }
+    QPushButton:pressed {
+        background-color: #d0d0d0;
+    }
+    QLineEdit, QTextEdit, QSpinBox, QComboBox {
+        background-color: #ffffff;
+        border: 1px solid #cccccc;
+        border-radius: 3px;
+        padding: 4px;
+    }
+    QTableView {
+        background-color: #ffffff;
+        alternate-background-color: #f9f9f9;
+        gridline-color: #e0e0e0;
+    }
+    QHeaderView::section {
+        background-color: #e8e8e8;
+        padding: 4px;
+        border: 1px solid #cccccc;
+        font-weight: bold;
+    }
+    QProgressBar {
+        border: 1px solid #cccccc;
+        border-radius: 3px;
+        text-align: center;
+        background-color: #ffffff;
+    }
+    QProgressBar::chunk {
+        background-color: #3498db;
+    }
+    QListWidget {
+        background-color: #ffffff;
+        border: 1px solid #cccccc;
+    }
+    QTabWidget::pane {
+        border: 1px solid #cccccc;
+    }
+    QTabBar::tab {
+        background-color: #ffffff;
+        border: 1px solid #cccccc;
+        padding: 8px 16px;
+    }
+    QTabBar::tab:selected {
+        background-color: #e8e8e8;
+    }
+    QLabel#quarantine_path_label {
+        color: #2c3e50;
+        font-weight: bold;
+    }
+    QLabel#settings_path_label {
+        color: #2c3e50;
+        font-weight: bold;
+    }
+""" + WIDGET_CLASS_QSS
+
+# 텍스트 차트 막대 (비율 100% = 50칸, 잘라서 사용)
+CHART_BAR = '█' * 50
+
+# 파이 차트 슬라이스 색상 (정상, 악성, 의심)
+PIE_SLICE_BRUSHES = (QBrush(QColor("#2ecc71")), QBrush(QColor("#e74c3c")), QBrush(QColor("#f39c12")))
+
+# ============================================================================
+# 도움말 HTML (테마별로 한 번만 생성)
+# ============================================================================
+@lru_cache(maxsize=2)
+def build_help_html(dark_mode):
+    """(QTextEdit 스타일시트, 도움말 HTML) - 테마마다 한 번만 만들어 재사용"""
+    if dark_mode:
+        # 다크모드용 스타일
+        bg_color = "#2b2b2b"
+        text_color = "#e0e0e0"
+        border_color = "#555555"
+        h1_color = "#5dade2"
+        h2_color = "#85c1e9"
+        feature_bg = "#3a3a3a"
+        warning_bg = "#4a4a2a"
+        warning_border = "#ffc107"
+        tip_bg = "#2a3a4a"
+        tip_border = "#17a2b8"
+        code_bg = "#1e1e1e"
+    else:
+        # 라이트모드용 스타일
+        bg_color = "#ffffff"
+        text_color = "#333333"
+        border_color = "#cccccc"
+        h1_color = "#2c3e50"
+        h2_color = "#34495e"
+        feature_bg = "#ecf0f1"
+        warning_bg = "#fff3cd"
+        warning_border = "#ffc107"
+        tip_bg = "#d1ecf1"
+        tip_border = "#17a2b8"
+        code_bg = "#f8f9fa"
+
+    stylesheet = f"""
+        QTextEdit {{
+            background-color: {bg_color};
+            color: {text_color};
+            border: 1px solid {border_color};
+            border-radius: 3px;
+            padding: 8px;
+        }}
+    """
+
+    help_html = f"""
+<html>
+<head>
+<style>
+body {{ font-family: 'Segoe UI', Arial, sans-serif; line-height: 1.6; color: {text_color}; background-color: {bg_color}; }}
+h1 {{ color: {h1_color}; border-bottom: 3px solid #3498db; padding-bottom: 10px; }}
+h2 {{ color: {h2_color}; margin-top: 20px; border-left: 4px solid #3498db; padding-left: 10px; }}
+h3 {{ color: #7f8c8d; margin-top: 15px; }}
+.feature {{ background-color: {feature_bg}; padding: 10px; margin: 10px 0; border-radius: 5px; }}
+.warning {{ background-color: {warning_bg}; padding: 10px; margin: 10px 0; border-left: 4px solid {warning_border}; }}
+.tip {{ background-color: {tip_bg}; padding: 10px; margin: 10px 0; border-left: 4px solid {tip_border}; }}
+code {{ background-color: {code_bg}; padding: 2px 6px; border-radius: 3px; font-family: 'Consolas', monospace; }}
+ul {{ margin-left: 20px; }}
+li {{ margin: 5px 0; }}
+</style>
+</head>
+<body>
+<h1>🛡️ InfraRed V2.0 - 사용 가이드</h1>
+
+<h2>📊 대시보드</h2>
+<div class="feature">
+<p><strong>실시간 통계 확인</strong></p>
+<ul>
+<li><strong>통계 카드:</strong> 총 스캔, 정상, 악성, 의심 파일 개수 표시</li>
+<li><strong>파이 차트:</strong> 스캔 결과 분포를 시각적으로 표시 (스캔 완료 시 업데이트)</li>
+<li><strong>최근 위협:</strong> 발견된 위협 목록 실시간 표시</li>
+<li><strong>시스템 정보:</strong> 엔진 버전, 격리 파일 개수 등</li>
+</ul>
+</div>
+
+<h2>🔍 파일 검사</h2>
+<div class="feature">
+<p><strong>다양한 스캔 옵션</strong></p>
+<ul>
+<li><strong>📄 파일 선택:</strong> 개별 파일 선택하여 검사</li>
+<li><strong>📁 폴더 검사:</strong> 특정 폴더 전체 검사</li>
+<li><strong>💻 전체 시스템 검사:</strong> C:\\ 드라이브 전체 검사 (최대 10,000개 파일)</li>
+<li><strong>💿 드라이브 선택 검사:</strong> 특정 드라이브 선택하여 검사</li>
+<li><strong>🖥️ 모든 드라이브 검사:</strong> 모든 드라이브 한 번에 검사</li>
+<li><strong>🔌 USB 검사:</strong> USB 드라이브만 자동 탐지하여 검사</li>
+</ul>
+<p><strong>검사 옵션</strong></p>
+<ul>
+<li><strong>상세 스캔:</strong> MD5, SHA256, 엔트로피 등 상세 정보 표시</li>
+<li><strong>자동 격리:</strong> 악성 파일 발견 시 자동으로 격리</li>
+<li><strong>하위 폴더 포함:</strong> 폴더 검사 시 하위 폴더까지 검사</li>
+</ul>
+</div>
+
+<div class="tip">
+<strong>💡 팁:</strong> 스캔 중 <strong>⏹️ 검사 중지</strong> 버튼으로 언제든지 중지할 수 있습니다.
+</div>
+
+<h2>🗂️ 격리 구역</h2>
+<div class="feature">
+<p><strong>악성 파일 안전 관리</strong></p>
+<ul>
+<li><strong>격리:</strong> 악성 파일을 안전한 격리 폴더로 이동</li>
+<li><strong>복원:</strong> 격리된 파일을 원래 위치로 복원</li>
+<li><strong>영구 삭제:</strong> 격리된 파일 완전 삭제</li>
+<li><strong>전체 비우기:</strong> 모든 격리 파일 한 번에 삭제</li>
+</ul>
+<p><strong>파일 핸들 강제 종료</strong></p>
+<ul>
+<li>파일 사용 중인 프로세스 자동 탐지 및 종료</li>
+<li>최대 5번 재시도로 안정적인 격리</li>
+<li>시스템 프로세스는 자동 제외</li>
+</ul>
+</div>
+
+<div class="warning">
+<strong>⚠️ 주의:</strong> 격리 시 파일을 사용 중인 프로그램이 강제 종료될 수 있습니다. 저장하지 않은 데이터가 손실될 수 있으니 주의하세요.
+</div>
+
+<h2>👁️ 실시간 감시</h2>
+<div class="feature">
+<p><strong>폴더 실시간 모니터링</strong></p>
+<ul>
+<li>선택한 폴더에 새 파일 생성 시 자동 검사</li>
+<li>실시간 로그 표시</li>
+<li>언제든지 시작/중지 가능</li>
+</ul>
+</div>
+
+<h2>🔬 고급 분석</h2>
+<div class="feature">
+<p><strong>PE 파일 분석</strong></p>
+<ul>
+<li>PE 헤더 정보 (32/64비트, 섹션 수, Entry Point)</li>
+<li>패킹 탐지 (UPX, ASPack, Themida 등)</li>
+<li>의심스러운 섹션 특성 분석</li>
+</ul>
+<p><strong>Import Table 분석</strong></p>
+<ul>
+<li>Import된 DLL 및 함수 목록</li>
+<li>의심스러운 API 탐지 (40+ 패턴)</li>
+<li>위험 점수 계산 및 카테고리 분류</li>
+</ul>
+<p><strong>압축파일 분석</strong></p>
+<ul>
+<li>ZIP 파일 내부 파일 목록</li>
+<li>실행파일 포함 여부 탐지</li>
+<li>이중 확장자 탐지 (예: .pdf.exe)</li>
+</ul>
+</div>
+
+<h2>📜 YARA 룰</h2>
+<div class="feature">
+<p><strong>YARA 룰 엔진</strong></p>
+<ul>
+<li>8개 내장 룰 (랜섬웨어, 트로이목마, 키로거 등)</li>
+<li>사용자 정의 룰 추가 가능</li>
+<li>문자열 패턴 및 헥스 패턴 지원</li>
+<li>조건 설정 (any/all, 필요 매치 수)</li>
+</ul>
+<p><strong>YARA 룰 테스트</strong></p>
+<ul>
+<li>파일 선택하여 룰 매칭 테스트</li>
+<li>매치된 룰 및 패턴 확인</li>
+</ul>
+</div>
+
+<h2>⚙️ 설정</h2>
+<div class="feature">
+<p><strong>격리 폴더 설정</strong></p>
+<ul>
+<li><strong>📂 폴더 변경:</strong> 원하는 위치로 격리 폴더 변경</li>
+<li><strong>🔍 폴더 열기:</strong> 현재 격리 폴더를 탐색기에서 열기</li>
+<li><strong>🔄 기본값으로:</strong> 기본 폴더로 재설정</li>
+</ul>
+<p><strong>시그니처 관리</strong></p>
+<ul>
+<li>사용자 정의 악성 패턴 추가</li>
+<li>위험도 설정 (1~4)</li>
+</ul>
+<p><strong>해시 관리</strong></p>
+<ul>
+<li>MD5 또는 SHA256 해시 추가</li>
+<li>알려진 악성 파일 데이터베이스 구축</li>
+</ul>
+</div>
+
+<h2>📜 히스토리</h2>
+<div class="feature">
+<p><strong>스캔 기록 관리</strong></p>
+<ul>
+<li>모든 스캔 기록 자동 저장</li>
+<li>시간, 스캔 유형, 결과 확인</li>
+<li>최근 50개 기록 표시</li>
+</ul>
+</div>
+
+<h2>🎨 기타 기능</h2>
+<div class="feature">
+<ul>
+<li><strong>⚡ 빠른 스캔:</strong> 다운로드, 문서, 바탕화면 폴더 빠른 검사</li>
+<li><strong>🌙 다크모드:</strong> 눈의 피로를 줄이는 다크 테마</li>
+<li><strong>💾 결과 내보내기:</strong> 스캔 결과를 CSV 또는 JSON으로 저장</li>
+</ul>
+</div>
+
+<h2>🔧 문제 해결</h2>
+<div class="feature">
+<h3>격리 실패 시</h3>
+<ul>
+<li>Windows 이외의 OS에서는 <code>pip install psutil</code> 명령으로 psutil 설치</li>
+<li>파일을 사용 중인 프로그램 수동으로 종료</li>
+<li>관리자 권한으로 프로그램 실행</li>
+</ul>
+</div>
 
-            self.stats_update.emit({
-                'total': self.stats.total_scanned,
-                'clean': self.stats.clean_files,
-                'malicious': self.stats.malicious_files,
-                'suspicious': self.stats.suspicious_files,
-                'errors': self.stats.errors
-            })
-            self.progress.emit(i)
+<h2>ℹ️ 버전 정보</h2>
+<div class="feature">
+<p><strong>버전:</strong> V2.0</p>
+<p><strong>최종 업데이트:</strong> 2026-01-17</p>
+</div>
 
-        self.finished.emit()
+</body>
+</html>
+"""
+    return stylesheet, help_html
 
 # ============================================================================
-# 실시간 모니터링
+# 메인 GUI
 # ============================================================================
-class FolderHandler(FileSystemEventHandler):
-    def __init__(self, callback):
-        self.callback = callback
+DASHBOARD_TAB_INDEX = 0  # 대시보드 탭 위치 (숨겨져 있으면 갱신 생략)
 
-    def on_created(self, event):
-        if not event.is_directory:
-            msg, _ = scan_file_basic(event.src_path)
-            self.callback(msg)
+SYSTEM_INFO_TEMPLATE = """
+        <b>엔진 버전:</b> V2.0<br>
+        <b>시그니처 DB:</b> 최신<br>
+        <b>마지막 업데이트:</b> {time}<br>
+        <b>격리된 파일:</b> {quarantined}개<br>
+        <b>상세 스캔:</b> {detailed}<br>
+        """
+
+ABOUT_TEMPLATE = """
+<h2>🛡️ InfraRed V2.0</h2>
+<p><b>버전:</b> 2.0</p>
+<p><b>제작자:</b> Dangel</p>
+<p><b>최종 업데이트:</b> 2026-01-17</p>
+<br>
+<p><b>주요 기능:</b></p>
+<ul>
+<li> 시그니처 기반 탐지</li>
+<li> 해시 기반 탐지 (MD5/SHA256)</li>
+<li> 휴리스틱 분석</li>
+<li> 엔트로피 계산</li>
+<li> 파일 핸들 강제 종료</li>
+<li> 드라이브/USB 스캔</li>
+<li> 격리 폴더 지정</li>
+<li> 실시간 감시</li>
+</ul>
+<br>
+<p><b>기술 스택:</b></p>
+<ul>
+<li>C++ 엔진 (OpenSSL)</li>
+<li>Python GUI (PyQt5)</li>
+<li>Windows API (프로세스 관리)</li>
+<li>watchdog (실시간 감시)</li>
+</ul>
+<br>
+<br>
+<p><b>격리 폴더:</b> {quarantine_dir}</p>
+<p><b>DLL 위치:</b> {dll_dir}</p>
+"""
+
+@lru_cache(maxsize=4)
+def build_about_html(quarantine_dir, dll_dir):
+    """정보 다이얼로그 HTML - 경로가 바뀔 때만 새로 채움"""
+    return ABOUT_TEMPLATE.format(quarantine_dir=quarantine_dir, dll_dir=dll_dir)
+
+def open_folder(path):
+    """파일 관리자로 폴더 열기 - 셸을 거치지 않고 바로 반환 (GUI 스레드를 막지 않음)"""
+    if not QDesktopServices.openUrl(QUrl.fromLocalFile(path)):
+        raise OSError(f"폴더를 열 수 없음: {path}")
 
-# ============================================================================
-# 메인 GUI
-# ============================================================================
 class AntivirusGUI(QWidget):
     # 실시간 감시 로그용 시그널
     monitor_log_signal = pyqtSignal(str)
+    # 감시 스레드에서 모아 둔 로그가 생겼을 때 (묶음당 한 번)
+    monitor_log_pending = pyqtSignal()
     
     def __init__(self):
         super().__init__()
         self.setWindowTitle("🛡️ InfraRed V2.0")
         self.setGeometry(100, 50, 1400, 900)
         self.stats = ScanStats()
-        self.scan_history = self.load_history()
+        self._quarantine_count = None  # 격리 파일 수 캐시 (None이면 다음 조회 때 다시 셈)
+        self._last_sysinfo_time = float('-inf')  # update_system_info 마지막 갱신 시각 (monotonic)
+        self._dashboard_version = -1  # 대시보드에 마지막으로 반영한 stats.version
+        self._scan_history = None  # 처음 필요할 때 로드 (시작 시 파일을 읽지 않음)
+        self._history_pending = None  # 히스토리 표에 아직 반영하지 않은 기록 수 (None이면 전체 다시 표시)
         
         # 다크모드 설정을 먼저 로드
         self.dark_mode = SETTINGS.get('dark_mode', False)
+        self._theme_pending = False  # toggle_theme 후 적용 대기 중인지
+        self._pie_chart_dirty = False  # 대시보드가 숨겨진 동안 차트 갱신이 미뤄졌는지
         
         self.init_ui()
         self.apply_theme()
         
         # 실시간 감시 로그 시그널 연결
         self.monitor_log_signal.connect(self._append_monitor_log)
+        self._monitor_log_lock = threading.Lock()
+        self._monitor_log_lines = []  # 감시 스레드가 쌓아 둔 로그 (GUI 반영 대기)
+        self.monitor_log_pending.connect(
+            lambda: QTimer.singleShot(MONITOR_LOG_COALESCE_MS, self._flush_monitor_log))
         
         # 다크모드면 버튼 텍스트 변경
         if self.dark_mode:
@@ -534,20 +2622,15 @@ class AntivirusGUI(QWidget):
         
         self.observer = None
         self.scan_thread = None
-        self.file_collector = None
+        self._enum_total = None
+        self.export_thread = None
+        self.file_enumerator = None
+        self.scan_feed = None
         self.scan_stopped_by_user = False  # 사용자가 중지했는지 여부
 
-        # UI 생성 후 제외 목록 로드
-        self.load_exclusion_lists()
-        
         # 모든 설정 로드 (스캔 옵션 등)
         self.load_all_settings()
 
-        # 실시간 통계 업데이트 타이머
-        self.stats_timer = QTimer()
-        self.stats_timer.timeout.connect(self.update_dashboard)
-        self.stats_timer.start(1000)
-
     def init_ui(self):
         main_layout = QVBoxLayout()
 
@@ -556,16 +2639,28 @@ class AntivirusGUI(QWidget):
         main_layout.addWidget(toolbar)
 
         # 탭 위젯
+        # 대시보드/검사 탭만 바로 만들고 나머지는 처음 선택될 때 생성
         self.tabs = QTabWidget()
         self.tabs.addTab(self.create_dashboard_tab(), "📊 대시보드")
         self.tabs.addTab(self.create_scan_tab(), "🔍 파일 검사")
-        self.tabs.addTab(self.create_advanced_analysis_tab(), "🧑‍💻 고급 분석")
-        self.tabs.addTab(self.create_quarantine_tab(), "❌ 격리 구역")
-        self.tabs.addTab(self.create_monitor_tab(), "👁️ 실시간 감시")
-        self.tabs.addTab(self.create_yara_tab(), "📜 YARA 룰")
-        self.tabs.addTab(self.create_settings_tab(), "⚙️ 설정")
-        self.tabs.addTab(self.create_history_tab(), "📜 히스토리")
-        self.tabs.addTab(self.create_help_tab(), "❓ 도움말")
+        self._tab_builders = {}
+        lazy_tabs = [
+            (self.create_advanced_analysis_tab, "🧑‍💻 고급 분석"),
+            (self.create_quarantine_tab, "❌ 격리 구역"),
+            (self.create_monitor_tab, "👁️ 실시간 감시"),
+            (self.create_yara_tab, "📜 YARA 룰"),
+            (self.create_settings_tab, "⚙️ 설정"),
+            (self.create_history_tab, "📜 히스토리"),
+            (self.create_help_tab, "❓ 도움말"),
+        ]
+        for builder, label in lazy_tabs:
+            placeholder = QWidget()
+            placeholder_layout = QVBoxLayout()
+            placeholder_layout.setContentsMargins(0, 0, 0, 0)
+            placeholder.setLayout(placeholder_layout)
+            index = self.tabs.addTab(placeholder, label)
+            self._tab_builders[index] = builder
+        self.tabs.currentChanged.connect(self._on_tab_changed)
         main_layout.addWidget(self.tabs)
 
         # 하단 상태바
@@ -575,6 +2670,27 @@ class AntivirusGUI(QWidget):
 
         self.setLayout(main_layout)
 
+    def _on_tab_changed(self, index):
+        self._ensure_tab_built(index)
+        if index == DASHBOARD_TAB_INDEX:
+            # 다른 탭에 있는 동안 미뤄진 갱신 반영
+            self.update_dashboard()
+            if self._pie_chart_dirty:
+                self.update_pie_chart()
+        # 테마 변경이 미뤄진 도움말 탭이면 지금 적용
+        self.update_help_text_style()
+        # 히스토리 탭이면 다른 탭에 있는 동안 쌓인 기록 반영 (None = 전체 다시 표시 필요)
+        # 탭을 먼저 그리고 다음 이벤트 루프에서 반영 (다른 탭이면 refresh_history가 바로 리턴)
+        if self._history_pending != 0:
+            QTimer.singleShot(0, self.refresh_history)
+
+    def _ensure_tab_built(self, index):
+        """탭이 처음 선택될 때 실제 내용을 생성해 자리표시 위젯에 넣음"""
+        builder = self._tab_builders.pop(index, None)
+        if builder is None:
+            return
+        self.tabs.widget(index).layout().addWidget(builder())
+
     def create_toolbar(self):
         toolbar = QFrame()
         toolbar.setFrameShape(QFrame.StyledPanel)
@@ -589,19 +2705,19 @@ class AntivirusGUI(QWidget):
         # 빠른 스캔 버튼
         quick_scan_btn = QPushButton("⚡ 빠른 스캔")
         quick_scan_btn.clicked.connect(self.quick_scan)
-        quick_scan_btn.setStyleSheet("padding: 8px 16px; font-weight: bold;")
+        quick_scan_btn.setProperty("class", "toolbtn-strong")
         layout.addWidget(quick_scan_btn)
 
         # 다크모드 토글
         self.theme_btn = QPushButton("🌙 다크모드")
         self.theme_btn.clicked.connect(self.toggle_theme)
-        self.theme_btn.setStyleSheet("padding: 8px 16px;")
+        self.theme_btn.setProperty("class", "toolbtn")
         layout.addWidget(self.theme_btn)
 
         # 설정 저장 버튼
         save_settings_btn = QPushButton("💾 설정 저장")
         save_settings_btn.clicked.connect(self.manual_save_settings)
-        save_settings_btn.setStyleSheet("padding: 8px 16px;")
+        save_settings_btn.setProperty("class", "toolbtn")
         layout.addWidget(save_settings_btn)
 
         toolbar.setLayout(layout)
@@ -611,18 +2727,9 @@ class AntivirusGUI(QWidget):
         tab = QWidget()
         layout = QVBoxLayout()
 
-        # 통계 카드
-        stats_layout = QHBoxLayout()
-        self.total_card = self.create_stat_card("총 스캔", "0", "#3498db")
-        self.clean_card = self.create_stat_card("정상", "0", "#2ecc71")
-        self.malicious_card = self.create_stat_card("악성", "0", "#e74c3c")
-        self.suspicious_card = self.create_stat_card("의심", "0", "#f39c12")
-
-        stats_layout.addWidget(self.total_card)
-        stats_layout.addWidget(self.clean_card)
-        stats_layout.addWidget(self.malicious_card)
-        stats_layout.addWidget(self.suspicious_card)
-        layout.addLayout(stats_layout)
+        # 통계 카드 (총 스캔, 정상, 악성, 의심)
+        self.stat_cards = StatCardsWidget()
+        layout.addWidget(self.stat_cards)
 
         # 차트 및 위협 목록 영역
         chart_splitter = QSplitter(Qt.Horizontal)
@@ -634,7 +2741,10 @@ class AntivirusGUI(QWidget):
         # 최근 위협 목록
         recent_threats_group = QGroupBox("🚨 최근 발견된 위협")
         recent_layout = QVBoxLayout()
-        self.recent_threats_list = QListWidget()
+        self.recent_threats_model = RecentThreatsModel(parent=self)
+        self.recent_threats_list = QListView()
+        self.recent_threats_list.setModel(self.recent_threats_model)
+        self.recent_threats_list.setUniformItemSizes(True)
         self.recent_threats_list.setMinimumHeight(200)
         recent_layout.addWidget(self.recent_threats_list)
         recent_threats_group.setLayout(recent_layout)
@@ -657,64 +2767,32 @@ class AntivirusGUI(QWidget):
         tab.setLayout(layout)
         return tab
 
-    def create_stat_card(self, title, value, color):
-        card = QFrame()
-        card.setFrameShape(QFrame.StyledPanel)
-        card.setStyleSheet(f"background-color: {color}; border-radius: 8px; padding: 20px;")
-        card.setMinimumHeight(120)
-        card.setMinimumWidth(150)
-
-        layout = QVBoxLayout()
-        title_label = QLabel(title)
-        title_label.setStyleSheet("color: white; font-size: 16px; font-weight: bold;")
-        title_label.setAlignment(Qt.AlignCenter)
-
-        value_label = QLabel(value)
-        value_label.setStyleSheet("color: white; font-size: 42px; font-weight: bold;")
-        value_label.setAlignment(Qt.AlignCenter)
-        value_label.setObjectName(f"{title}_value")
-
-        layout.addWidget(title_label)
-        layout.addWidget(value_label)
-        layout.addStretch()
-        card.setLayout(layout)
-        return card
-
     def create_pie_chart(self):
         """파이 차트 생성 (PyQtChart 사용 가능 시) 또는 대체 UI"""
-        if HAS_CHART:
+        if load_chart_support():
             # PyQtChart 사용
-            from PyQt5.QtChart import QPieSeries, QChart, QChartView
-            from PyQt5.QtGui import QPainter
-
-            self.pie_series = QPieSeries()
-            self.pie_series.append("정상", max(self.stats.clean_files, 1))
-            self.pie_series.append("악성", self.stats.malicious_files)
-            self.pie_series.append("의심", self.stats.suspicious_files)
+            self.pie_series = QtChart.QPieSeries()
+            # 슬라이스는 한 번만 만들고 참조를 보관 (이후 업데이트에서는 값/레이블만 변경)
+            self.pie_slices = (
+                self.pie_series.append("정상", max(self.stats.clean_files, 1)),
+                self.pie_series.append("악성", self.stats.malicious_files),
+                self.pie_series.append("의심", self.stats.suspicious_files),
+            )
 
             # 슬라이스 색상 설정
-            slice_clean = self.pie_series.slices()[0]
-            slice_clean.setBrush(QColor("#2ecc71"))
-            slice_clean.setLabelVisible(True)
+            for pie_slice, brush in zip(self.pie_slices, PIE_SLICE_BRUSHES):
+                pie_slice.setBrush(brush)
+                pie_slice.setLabelVisible(True)
 
-            if len(self.pie_series.slices()) > 1:
-                slice_malicious = self.pie_series.slices()[1]
-                slice_malicious.setBrush(QColor("#e74c3c"))
-                slice_malicious.setLabelVisible(True)
-
-            if len(self.pie_series.slices()) > 2:
-                slice_suspicious = self.pie_series.slices()[2]
-                slice_suspicious.setBrush(QColor("#f39c12"))
-                slice_suspicious.setLabelVisible(True)
-
-            self.pie_chart = QChart()
+            self.pie_chart = QtChart.QChart()
             self.pie_chart.addSeries(self.pie_series)
             self.pie_chart.setTitle("📊 스캔 결과 분포")
-            self.pie_chart.setAnimationOptions(QChart.SeriesAnimations)
+            self.pie_chart.setAnimationOptions(QtChart.QChart.SeriesAnimations)
+            self._last_pie_counts = None
             self.pie_chart.legend().setVisible(True)
             self.pie_chart.legend().setAlignment(Qt.AlignBottom)
 
-            chart_view = QChartView(self.pie_chart)
+            chart_view = QtChart.QChartView(self.pie_chart)
             chart_view.setRenderHint(QPainter.Antialiasing)
             chart_view.setMinimumSize(400, 300)
             return chart_view
@@ -722,11 +2800,12 @@ class AntivirusGUI(QWidget):
             # PyQtChart가 없을 때 대체 UI
             group = QGroupBox("📊 스캔 결과 분포")
             layout = QVBoxLayout()
-            self.chart_text = QTextEdit()
+            self.chart_text = QPlainTextEdit()  # 고정폭 텍스트만 표시하므로 리치 텍스트 레이아웃 불필요
             self.chart_text.setReadOnly(True)
             self.chart_text.setMaximumHeight(300)
+            self._last_chart_counts = None
             self.chart_text.setStyleSheet("""
-                QTextEdit {
+                QPlainTextEdit {
                     font-size: 14px;
                     font-family: 'Consolas', monospace;
                     background-color: #f8f9fa;
@@ -743,6 +2822,11 @@ class AntivirusGUI(QWidget):
     def update_chart_text(self):
         """차트 텍스트 업데이트 (PyQtChart 없을 때)"""
         if not HAS_CHART and hasattr(self, 'chart_text'):
+            counts = (self.stats.clean_files, self.stats.malicious_files, self.stats.suspicious_files)
+            if counts == self._last_chart_counts:
+                return  # 값이 그대로면 다시 그리지 않음
+            self._last_chart_counts = counts
+
             total = self.stats.total_scanned
             if total == 0:
                 total = 1  # 0으로 나누기 방지
@@ -759,30 +2843,37 @@ class AntivirusGUI(QWidget):
 ✅ 정상 파일
    개수: {self.stats.clean_files}개
    비율: {clean_pct:.1f}%
-   {'█' * int(clean_pct / 2)}
+   {CHART_BAR[:int(clean_pct / 2)]}
 
 🔴 악성 파일
    개수: {self.stats.malicious_files}개
    비율: {malicious_pct:.1f}%
-   {'█' * int(malicious_pct / 2)}
+   {CHART_BAR[:int(malicious_pct / 2)]}
 
 ⚠️  의심 파일
    개수: {self.stats.suspicious_files}개
    비율: {suspicious_pct:.1f}%
-   {'█' * int(suspicious_pct / 2)}
+   {CHART_BAR[:int(suspicious_pct / 2)]}
 
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 총 스캔: {self.stats.total_scanned}개
 """
             self.chart_text.setPlainText(text)
 
+    def _set_chart_animations(self, enabled):
+        """파이 차트 애니메이션 켜기/끄기 (스캔 중에는 중간 전환 효과를 그리지 않음)"""
+        if HAS_CHART and hasattr(self, 'pie_chart'):
+            QChart = QtChart.QChart
+            self.pie_chart.setAnimationOptions(QChart.SeriesAnimations if enabled else QChart.NoAnimation)
+
     def update_pie_chart(self):
-        """파이 차트 업데이트"""
+        """파이 차트 업데이트 (대시보드가 보이지 않으면 돌아올 때까지 미룸)"""
+        if self.tabs.currentIndex() != DASHBOARD_TAB_INDEX:
+            self._pie_chart_dirty = True
+            return
+        self._pie_chart_dirty = False
         if HAS_CHART and hasattr(self, 'pie_series'):
-            # 기존 데이터 제거
-            self.pie_series.clear()
-
-            # 새 데이터 추가 (최소값 1로 설정하여 차트가 항상 표시되도록)
+            # 새 데이터 (최소값 1로 설정하여 차트가 항상 표시되도록)
             clean = max(self.stats.clean_files, 0)
             malicious = max(self.stats.malicious_files, 0)
             suspicious = max(self.stats.suspicious_files, 0)
@@ -791,28 +2882,16 @@ class AntivirusGUI(QWidget):
             if clean == 0 and malicious == 0 and suspicious == 0:
                 clean = 1
 
-            self.pie_series.append("정상", clean)
-            self.pie_series.append("악성", malicious)
-            self.pie_series.append("의심", suspicious)
-
-            # 슬라이스 색상 및 레이블 설정
-            if len(self.pie_series.slices()) > 0:
-                slice_clean = self.pie_series.slices()[0]
-                slice_clean.setBrush(QColor("#2ecc71"))
-                slice_clean.setLabelVisible(True)
-                slice_clean.setLabel(f"정상 ({clean})")
-
-            if len(self.pie_series.slices()) > 1:
-                slice_malicious = self.pie_series.slices()[1]
-                slice_malicious.setBrush(QColor("#e74c3c"))
-                slice_malicious.setLabelVisible(True)
-                slice_malicious.setLabel(f"악성 ({malicious})")
-
-            if len(self.pie_series.slices()) > 2:
-                slice_suspicious = self.pie_series.slices()[2]
-                slice_suspicious.setBrush(QColor("#f39c12"))
-                slice_suspicious.setLabelVisible(True)
-                slice_suspicious.setLabel(f"의심 ({suspicious})")
+            # 값이 그대로면 다시 그리지 않음
+            if (clean, malicious, suspicious) == self._last_pie_counts:
+                return
+            self._last_pie_counts = (clean, malicious, suspicious)
+
+            # 기존 슬라이스를 재사용해 값과 레이블만 변경 (색상은 생성 시 설정됨)
+            values = (("정상", clean), ("악성", malicious), ("의심", suspicious))
+            for pie_slice, (name, value) in zip(self.pie_slices, values):
+                pie_slice.setValue(value)
+                pie_slice.setLabel(f"{name} ({value})")
         else:
             # 텍스트 차트 업데이트
             self.update_chart_text()
@@ -867,6 +2946,17 @@ class AntivirusGUI(QWidget):
         self.recursive_check = QCheckBox("하위 폴더 포함")
         self.recursive_check.setChecked(True)
         options_row.addWidget(self.recursive_check)
+
+        self.parallel_check = QCheckBox("병렬 스캔")
+        self.parallel_check.setChecked(SETTINGS.get('parallel_scan', True))
+        self.parallel_check.setToolTip("여러 CPU 코어로 동시에 검사합니다 (해제 시 단일 스레드)")
+        self.parallel_check.toggled.connect(self.toggle_parallel_scan)
+        if not (has_batch_scan or has_batch_basic_scan):
+            # 병렬 스캔은 배치 스캔 API(scan_files/scan_files_detailed)로만 동작 - 이전 DLL에서는 끔
+            self.parallel_check.setEnabled(False)
+            self.parallel_check.setToolTip("현재 DLL은 배치 스캔을 지원하지 않아 병렬 스캔을 사용할 수 없습니다.\n"
+                                           "antivirus_core.cpp로 DLL을 다시 빌드하세요 (README 설치 방법 참고).")
+        options_row.addWidget(self.parallel_check)
         btn_layout.addLayout(options_row)
 
         btn_group.setLayout(btn_layout)
@@ -885,7 +2975,7 @@ class AntivirusGUI(QWidget):
         self.stop_scan_btn = QPushButton('⏹️ 검사 중지')
         self.stop_scan_btn.clicked.connect(self.stop_scan)
         self.stop_scan_btn.setEnabled(False)
-        self.stop_scan_btn.setStyleSheet("background-color: #e74c3c; color: white; font-weight: bold;")
+        self.stop_scan_btn.setProperty("class", "danger")
         progress_layout.addWidget(self.stop_scan_btn)
 
         progress_group.setLayout(progress_layout)
@@ -895,21 +2985,25 @@ class AntivirusGUI(QWidget):
         result_group = QGroupBox("📋 검사 결과")
         result_layout = QVBoxLayout()
 
-        self.result_table = QTableWidget()
-        self.result_table.setColumnCount(7)
-        self.result_table.setHorizontalHeaderLabels(["파일명", "경로", "상태", "위협", "MD5", "크기", "작업"])
+        self.result_model = ScanResultModel(self)
+        self.result_table = QTableView()
+        self.result_table.setModel(self.result_model)
         self.result_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.result_table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.result_table.setSelectionBehavior(QTableView.SelectRows)
+        self.result_table.setEditTriggers(QTableView.NoEditTriggers)
+        self.quarantine_delegate = ButtonDelegate(self.result_table)
+        self.quarantine_delegate.clicked.connect(self.quarantine_result_row)
+        self.result_table.setItemDelegateForColumn(RESULT_ACTION_COLUMN, self.quarantine_delegate)
         result_layout.addWidget(self.result_table)
 
         result_btn_layout = QHBoxLayout()
         clear_btn = QPushButton('🗑️ 결과 지우기')
-        clear_btn.clicked.connect(lambda: self.result_table.setRowCount(0))
+        clear_btn.clicked.connect(self.result_model.clear)
         result_btn_layout.addWidget(clear_btn)
 
-        export_btn = QPushButton('💾 결과 내보내기')
-        export_btn.clicked.connect(self.export_results)
-        result_btn_layout.addWidget(export_btn)
+        self.export_btn = QPushButton('💾 결과 내보내기')
+        self.export_btn.clicked.connect(self.export_results)
+        result_btn_layout.addWidget(self.export_btn)
         result_layout.addLayout(result_btn_layout)
 
         result_group.setLayout(result_layout)
@@ -954,7 +3048,8 @@ class AntivirusGUI(QWidget):
 
         layout.addLayout(btn_layout)
         tab.setLayout(layout)
-        self.refresh_quarantine()
+        # 탭을 먼저 표시하고 격리 폴더는 다음 이벤트 루프에서 읽음
+        QTimer.singleShot(0, self.refresh_quarantine)
         return tab
 
     def create_monitor_tab(self):
@@ -1377,8 +3472,10 @@ class AntivirusGUI(QWidget):
 
     def update_engine_info(self):
         """엔진 정보 업데이트"""
+        if not hasattr(self, 'engine_info_text'):
+            return
         try:
-            if hasattr(engine, 'get_engine_stats'):
+            if 'get_engine_stats' in ENGINE_SYMBOLS:
                 result_ptr = engine.get_engine_stats()
                 if result_ptr:
                     # bytes를 여러 인코딩으로 시도
@@ -1431,13 +3528,14 @@ class AntivirusGUI(QWidget):
             ("EICAR_Test", "EICAR test file", "any", 1, "내장"),
         ]
         
-        self.yara_rules_table.setRowCount(len(default_rules))
-        for row, (name, desc, condition, severity, status) in enumerate(default_rules):
-            self.yara_rules_table.setItem(row, 0, QTableWidgetItem(name))
-            self.yara_rules_table.setItem(row, 1, QTableWidgetItem(desc))
-            self.yara_rules_table.setItem(row, 2, QTableWidgetItem(condition))
-            self.yara_rules_table.setItem(row, 3, QTableWidgetItem(str(severity)))
-            self.yara_rules_table.setItem(row, 4, QTableWidgetItem(status))
+        with bulk_table_update(self.yara_rules_table) as table:
+            table.setRowCount(len(default_rules))
+            for row, (name, desc, condition, severity, status) in enumerate(default_rules):
+                table.setItem(row, 0, QTableWidgetItem(name))
+                table.setItem(row, 1, QTableWidgetItem(desc))
+                table.setItem(row, 2, QTableWidgetItem(condition))
+                table.setItem(row, 3, QTableWidgetItem(str(severity)))
+                table.setItem(row, 4, QTableWidgetItem(status))
 
     def add_yara_rule(self):
         """YARA 룰 추가"""
@@ -1469,6 +3567,7 @@ class AntivirusGUI(QWidget):
                 required,
                 severity
             )
+            record_engine_rule('yara', name, desc, strings, condition, required, severity)
             
             # 테이블에 추가
             row = self.yara_rules_table.rowCount()
@@ -1567,24 +3666,24 @@ class AntivirusGUI(QWidget):
         quarantine_btn_layout = QHBoxLayout()
         change_folder_btn = QPushButton('📂 경로 변경')
         change_folder_btn.clicked.connect(self.change_quarantine_folder)
-        change_folder_btn.setStyleSheet("padding: 8px 16px;")
+        change_folder_btn.setProperty("class", "toolbtn")
         quarantine_btn_layout.addWidget(change_folder_btn)
 
         open_folder_btn = QPushButton('🔍 폴더 열기')
         open_folder_btn.clicked.connect(self.open_quarantine_folder)
-        open_folder_btn.setStyleSheet("padding: 8px 16px;")
+        open_folder_btn.setProperty("class", "toolbtn")
         quarantine_btn_layout.addWidget(open_folder_btn)
 
         reset_folder_btn = QPushButton('🔄 기본값으로')
         reset_folder_btn.clicked.connect(self.reset_quarantine_folder)
-        reset_folder_btn.setStyleSheet("padding: 8px 16px;")
+        reset_folder_btn.setProperty("class", "toolbtn")
         quarantine_btn_layout.addWidget(reset_folder_btn)
         quarantine_btn_layout.addStretch()
         quarantine_layout.addLayout(quarantine_btn_layout)
 
         # 정보 레이블
         info_label = QLabel("💡 격리 폴더를 변경하면 기존 격리 파일은 이동되지 않습니다.")
-        info_label.setStyleSheet("color: #7f8c8d; font-size: 11px; padding: 5px;")
+        info_label.setProperty("class", "hint")
         info_label.setWordWrap(True)
         quarantine_layout.addWidget(info_label)
 
@@ -1609,24 +3708,24 @@ class AntivirusGUI(QWidget):
         settings_btn_layout = QHBoxLayout()
         change_settings_btn = QPushButton('📂 경로 변경')
         change_settings_btn.clicked.connect(self.change_settings_folder)
-        change_settings_btn.setStyleSheet("padding: 8px 16px;")
+        change_settings_btn.setProperty("class", "toolbtn")
         settings_btn_layout.addWidget(change_settings_btn)
 
         open_settings_btn = QPushButton('🔍 폴더 열기')
         open_settings_btn.clicked.connect(self.open_settings_folder)
-        open_settings_btn.setStyleSheet("padding: 8px 16px;")
+        open_settings_btn.setProperty("class", "toolbtn")
         settings_btn_layout.addWidget(open_settings_btn)
 
         reset_settings_btn = QPushButton('🔄 기본값으로')
         reset_settings_btn.clicked.connect(self.reset_settings_folder)
-        reset_settings_btn.setStyleSheet("padding: 8px 16px;")
+        reset_settings_btn.setProperty("class", "toolbtn")
         settings_btn_layout.addWidget(reset_settings_btn)
         settings_btn_layout.addStretch()
         settings_path_layout.addLayout(settings_btn_layout)
 
         # 정보 레이블
         settings_info_label = QLabel("💡 설정 파일 경로를 변경하면 기존 설정은 새 경로로 복사됩니다.")
-        settings_info_label.setStyleSheet("color: #7f8c8d; font-size: 11px; padding: 5px;")
+        settings_info_label.setProperty("class", "hint")
         settings_info_label.setWordWrap(True)
         settings_path_layout.addWidget(settings_info_label)
 
@@ -1835,7 +3934,7 @@ class AntivirusGUI(QWidget):
         # 전체 삭제 버튼
         clear_all_exclusions_btn = QPushButton('🧹 모든 제외 목록 삭제')
         clear_all_exclusions_btn.clicked.connect(self.clear_all_exclusions)
-        clear_all_exclusions_btn.setStyleSheet("background-color: #e74c3c; color: white;")
+        clear_all_exclusions_btn.setProperty("class", "danger")
         exclusion_layout.addWidget(clear_all_exclusions_btn)
         
         exclusion_group.setLayout(exclusion_layout)
@@ -1843,6 +3942,7 @@ class AntivirusGUI(QWidget):
 
         layout.addStretch()
         tab.setLayout(layout)
+        self.load_exclusion_lists()
         return tab
 
     def create_history_tab(self):
@@ -1850,9 +3950,10 @@ class AntivirusGUI(QWidget):
         layout = QVBoxLayout()
 
         # 히스토리 테이블
-        self.history_table = QTableWidget()
-        self.history_table.setColumnCount(5)
-        self.history_table.setHorizontalHeaderLabels(["시간", "스캔 유형", "총 파일", "위협 발견", "상태"])
+        self.history_model = HistoryModel(parent=self)
+        self.history_table = QTableView()
+        self.history_table.setModel(self.history_model)
+        self.history_table.setEditTriggers(QTableView.NoEditTriggers)
         self.history_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         layout.addWidget(self.history_table)
 
@@ -1866,258 +3967,50 @@ class AntivirusGUI(QWidget):
         clear_btn.clicked.connect(self.clear_history)
         btn_layout.addWidget(clear_btn)
 
-        layout.addLayout(btn_layout)
-        tab.setLayout(layout)
-        self.refresh_history()
-        return tab
-
-    def create_help_tab(self):
-        tab = QWidget()
-        layout = QVBoxLayout()
-
-        # 도움말 텍스트
-        self.help_text = QTextEdit()
-        self.help_text.setReadOnly(True)
-        self.update_help_text_style()
-        layout.addWidget(self.help_text)
-
-        # 하단 버튼
-        btn_layout = QHBoxLayout()
-        docs_btn = QPushButton('📚 문서 폴더 열기')
-        docs_btn.clicked.connect(self.open_docs_folder)
-        docs_btn.setStyleSheet("padding: 8px 16px;")
-        btn_layout.addWidget(docs_btn)
-
-        btn_layout.addStretch()
-
-        about_btn = QPushButton('ℹ️ 정보')
-        about_btn.clicked.connect(self.show_about)
-        about_btn.setStyleSheet("padding: 8px 16px;")
-        btn_layout.addWidget(about_btn)
-
-        layout.addLayout(btn_layout)
-        tab.setLayout(layout)
-        return tab
-
-    def update_help_text_style(self):
-        """도움말 텍스트 스타일 업데이트 (다크모드 대응)"""
-        if self.dark_mode:
-            # 다크모드용 스타일
-            bg_color = "#2b2b2b"
-            text_color = "#e0e0e0"
-            border_color = "#555555"
-            h1_color = "#5dade2"
-            h2_color = "#85c1e9"
-            feature_bg = "#3a3a3a"
-            warning_bg = "#4a4a2a"
-            warning_border = "#ffc107"
-            tip_bg = "#2a3a4a"
-            tip_border = "#17a2b8"
-            code_bg = "#1e1e1e"
-        else:
-            # 라이트모드용 스타일
-            bg_color = "#ffffff"
-            text_color = "#333333"
-            border_color = "#cccccc"
-            h1_color = "#2c3e50"
-            h2_color = "#34495e"
-            feature_bg = "#ecf0f1"
-            warning_bg = "#fff3cd"
-            warning_border = "#ffc107"
-            tip_bg = "#d1ecf1"
-            tip_border = "#17a2b8"
-            code_bg = "#f8f9fa"
-
-        self.help_text.setStyleSheet(f"""
-            QTextEdit {{
-                background-color: {bg_color};
-                color: {text_color};
-                border: 1px solid {border_color};
-                border-radius: 3px;
-                padding: 8px;
-            }}
-        """)
-
-        help_html = f"""
-<html>
-<head>
-<style>
-body {{ font-family: 'Segoe UI', Arial, sans-serif; line-height: 1.6; color: {text_color}; background-color: {bg_color}; }}
-h1 {{ color: {h1_color}; border-bottom: 3px solid #3498db; padding-bottom: 10px; }}
-h2 {{ color: {h2_color}; margin-top: 20px; border-left: 4px solid #3498db; padding-left: 10px; }}
-h3 {{ color: #7f8c8d; margin-top: 15px; }}
-.feature {{ background-color: {feature_bg}; padding: 10px; margin: 10px 0; border-radius: 5px; }}
-.warning {{ background-color: {warning_bg}; padding: 10px; margin: 10px 0; border-left: 4px solid {warning_border}; }}
-.tip {{ background-color: {tip_bg}; padding: 10px; margin: 10px 0; border-left: 4px solid {tip_border}; }}
-code {{ background-color: {code_bg}; padding: 2px 6px; border-radius: 3px; font-family: 'Consolas', monospace; }}
-ul {{ margin-left: 20px; }}
-li {{ margin: 5px 0; }}
-</style>
-</head>
-<body>
-<h1>🛡️ InfraRed V2.0 - 사용 가이드</h1>
-
-<h2>📊 대시보드</h2>
-<div class="feature">
-<p><strong>실시간 통계 확인</strong></p>
-<ul>
-<li><strong>통계 카드:</strong> 총 스캔, 정상, 악성, 의심 파일 개수 표시</li>
-<li><strong>파이 차트:</strong> 스캔 결과 분포를 시각적으로 표시 (스캔 완료 시 업데이트)</li>
-<li><strong>최근 위협:</strong> 발견된 위협 목록 실시간 표시</li>
-<li><strong>시스템 정보:</strong> 엔진 버전, 격리 파일 개수 등</li>
-</ul>
-</div>
-
-<h2>🔍 파일 검사</h2>
-<div class="feature">
-<p><strong>다양한 스캔 옵션</strong></p>
-<ul>
-<li><strong>📄 파일 선택:</strong> 개별 파일 선택하여 검사</li>
-<li><strong>📁 폴더 검사:</strong> 특정 폴더 전체 검사</li>
-<li><strong>💻 전체 시스템 검사:</strong> C:\\ 드라이브 전체 검사 (최대 10,000개 파일)</li>
-<li><strong>💿 드라이브 선택 검사:</strong> 특정 드라이브 선택하여 검사</li>
-<li><strong>🖥️ 모든 드라이브 검사:</strong> 모든 드라이브 한 번에 검사</li>
-<li><strong>🔌 USB 검사:</strong> USB 드라이브만 자동 탐지하여 검사</li>
-</ul>
-<p><strong>검사 옵션</strong></p>
-<ul>
-<li><strong>상세 스캔:</strong> MD5, SHA256, 엔트로피 등 상세 정보 표시</li>
-<li><strong>자동 격리:</strong> 악성 파일 발견 시 자동으로 격리</li>
-<li><strong>하위 폴더 포함:</strong> 폴더 검사 시 하위 폴더까지 검사</li>
-</ul>
-</div>
-
-<div class="tip">
-<strong>💡 팁:</strong> 스캔 중 <strong>⏹️ 검사 중지</strong> 버튼으로 언제든지 중지할 수 있습니다.
-</div>
-
-<h2>🗂️ 격리 구역</h2>
-<div class="feature">
-<p><strong>악성 파일 안전 관리</strong></p>
-<ul>
-<li><strong>격리:</strong> 악성 파일을 안전한 격리 폴더로 이동</li>
-<li><strong>복원:</strong> 격리된 파일을 원래 위치로 복원</li>
-<li><strong>영구 삭제:</strong> 격리된 파일 완전 삭제</li>
-<li><strong>전체 비우기:</strong> 모든 격리 파일 한 번에 삭제</li>
-</ul>
-<p><strong>파일 핸들 강제 종료</strong></p>
-<ul>
-<li>파일 사용 중인 프로세스 자동 탐지 및 종료</li>
-<li>최대 5번 재시도로 안정적인 격리</li>
-<li>시스템 프로세스는 자동 제외</li>
-</ul>
-</div>
-
-<div class="warning">
-<strong>⚠️ 주의:</strong> 격리 시 파일을 사용 중인 프로그램이 강제 종료될 수 있습니다. 저장하지 않은 데이터가 손실될 수 있으니 주의하세요.
-</div>
-
-<h2>👁️ 실시간 감시</h2>
-<div class="feature">
-<p><strong>폴더 실시간 모니터링</strong></p>
-<ul>
-<li>선택한 폴더에 새 파일 생성 시 자동 검사</li>
-<li>실시간 로그 표시</li>
-<li>언제든지 시작/중지 가능</li>
-</ul>
-</div>
-
-<h2>🔬 고급 분석</h2>
-<div class="feature">
-<p><strong>PE 파일 분석</strong></p>
-<ul>
-<li>PE 헤더 정보 (32/64비트, 섹션 수, Entry Point)</li>
-<li>패킹 탐지 (UPX, ASPack, Themida 등)</li>
-<li>의심스러운 섹션 특성 분석</li>
-</ul>
-<p><strong>Import Table 분석</strong></p>
-<ul>
-<li>Import된 DLL 및 함수 목록</li>
-<li>의심스러운 API 탐지 (40+ 패턴)</li>
-<li>위험 점수 계산 및 카테고리 분류</li>
-</ul>
-<p><strong>압축파일 분석</strong></p>
-<ul>
-<li>ZIP 파일 내부 파일 목록</li>
-<li>실행파일 포함 여부 탐지</li>
-<li>이중 확장자 탐지 (예: .pdf.exe)</li>
-</ul>
-</div>
-
-<h2>📜 YARA 룰</h2>
-<div class="feature">
-<p><strong>YARA 룰 엔진</strong></p>
-<ul>
-<li>8개 내장 룰 (랜섬웨어, 트로이목마, 키로거 등)</li>
-<li>사용자 정의 룰 추가 가능</li>
-<li>문자열 패턴 및 헥스 패턴 지원</li>
-<li>조건 설정 (any/all, 필요 매치 수)</li>
-</ul>
-<p><strong>YARA 룰 테스트</strong></p>
-<ul>
-<li>파일 선택하여 룰 매칭 테스트</li>
-<li>매치된 룰 및 패턴 확인</li>
-</ul>
-</div>
-
-<h2>⚙️ 설정</h2>
-<div class="feature">
-<p><strong>격리 폴더 설정</strong></p>
-<ul>
-<li><strong>📂 폴더 변경:</strong> 원하는 위치로 격리 폴더 변경</li>
-<li><strong>🔍 폴더 열기:</strong> 현재 격리 폴더를 탐색기에서 열기</li>
-<li><strong>🔄 기본값으로:</strong> 기본 폴더로 재설정</li>
-</ul>
-<p><strong>시그니처 관리</strong></p>
-<ul>
-<li>사용자 정의 악성 패턴 추가</li>
-<li>위험도 설정 (1~4)</li>
-</ul>
-<p><strong>해시 관리</strong></p>
-<ul>
-<li>MD5 또는 SHA256 해시 추가</li>
-<li>알려진 악성 파일 데이터베이스 구축</li>
-</ul>
-</div>
+        layout.addLayout(btn_layout)
+        tab.setLayout(layout)
+        # 탭을 먼저 표시하고 히스토리 파일은 다음 이벤트 루프에서 읽음
+        QTimer.singleShot(0, self.refresh_history)
+        return tab
 
-<h2>📜 히스토리</h2>
-<div class="feature">
-<p><strong>스캔 기록 관리</strong></p>
-<ul>
-<li>모든 스캔 기록 자동 저장</li>
-<li>시간, 스캔 유형, 결과 확인</li>
-<li>최근 50개 기록 표시</li>
-</ul>
-</div>
+    def create_help_tab(self):
+        tab = QWidget()
+        layout = QVBoxLayout()
 
-<h2>🎨 기타 기능</h2>
-<div class="feature">
-<ul>
-<li><strong>⚡ 빠른 스캔:</strong> 다운로드, 문서, 바탕화면 폴더 빠른 검사</li>
-<li><strong>🌙 다크모드:</strong> 눈의 피로를 줄이는 다크 테마</li>
-<li><strong>💾 결과 내보내기:</strong> 스캔 결과를 CSV 또는 JSON으로 저장</li>
-</ul>
-</div>
+        # 도움말 텍스트
+        self.help_text = QTextEdit()
+        self.help_text.setReadOnly(True)
+        self._help_dark_mode = None  # 마지막으로 적용한 테마 (탭 선택 시 적용)
+        layout.addWidget(self.help_text)
 
-<h2>🔧 문제 해결</h2>
-<div class="feature">
-<h3>격리 실패 시</h3>
-<ul>
-<li><code>pip install psutil</code> 명령으로 psutil 설치</li>
-<li>파일을 사용 중인 프로그램 수동으로 종료</li>
-<li>관리자 권한으로 프로그램 실행</li>
-</ul>
-</div>
+        # 하단 버튼
+        btn_layout = QHBoxLayout()
+        docs_btn = QPushButton('📚 문서 폴더 열기')
+        docs_btn.clicked.connect(self.open_docs_folder)
+        docs_btn.setProperty("class", "toolbtn")
+        btn_layout.addWidget(docs_btn)
 
-<h2>ℹ️ 버전 정보</h2>
-<div class="feature">
-<p><strong>버전:</strong> V2.0</p>
-<p><strong>최종 업데이트:</strong> 2026-01-17</p>
-</div>
+        btn_layout.addStretch()
 
-</body>
-</html>
-"""
+        about_btn = QPushButton('ℹ️ 정보')
+        about_btn.clicked.connect(self.show_about)
+        about_btn.setProperty("class", "toolbtn")
+        btn_layout.addWidget(about_btn)
+
+        layout.addLayout(btn_layout)
+        tab.setLayout(layout)
+        return tab
+
+    def update_help_text_style(self):
+        """도움말 텍스트 스타일 업데이트 (다크모드 대응)"""
+        if not hasattr(self, 'help_text') or self._help_dark_mode == self.dark_mode:
+            return
+        # 보이지 않는 동안에는 미뤄두고 도움말 탭이 선택될 때 적용
+        if not self.tabs.currentWidget().isAncestorOf(self.help_text):
+            return
+        self._help_dark_mode = self.dark_mode
+        stylesheet, help_html = build_help_html(self.dark_mode)
+        self.help_text.setStyleSheet(stylesheet)
         self.help_text.setHtml(help_html)
 
     # ========================================================================
@@ -2126,20 +4019,34 @@ li {{ margin: 5px 0; }}
 
     def update_dashboard(self):
         # 통계 카드만 업데이트 (차트는 스캔 완료 시에만 업데이트)
-        self.total_card.findChild(QLabel, "총 스캔_value").setText(str(self.stats.total_scanned))
-        self.clean_card.findChild(QLabel, "정상_value").setText(str(self.stats.clean_files))
-        self.malicious_card.findChild(QLabel, "악성_value").setText(str(self.stats.malicious_files))
-        self.suspicious_card.findChild(QLabel, "의심_value").setText(str(self.stats.suspicious_files))
-
-    def update_system_info(self):
-        info = f"""
-        <b>엔진 버전:</b> V2.0<br>
-        <b>시그니처 DB:</b> 최신<br>
-        <b>마지막 업데이트:</b> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}<br>
-        <b>격리된 파일:</b> {len(os.listdir(QUARANTINE_DIR)) if os.path.exists(QUARANTINE_DIR) else 0}개<br>
-        <b>상세 스캔:</b> {'활성화' if has_detailed_scan else '비활성화'}<br>
-        """
-        self.system_info_label.setText(info)
+        # 통계가 바뀌지 않았거나 대시보드가 보이지 않으면 아무것도 하지 않음
+        # (버전이 그대로 남아 있으므로 대시보드로 돌아올 때 반영됨)
+        if self.stats.version == self._dashboard_version or self.tabs.currentIndex() != DASHBOARD_TAB_INDEX:
+            return
+        self._dashboard_version = self.stats.version
+        self.stat_cards.set_values((self.stats.total_scanned, self.stats.clean_files,
+                                    self.stats.malicious_files, self.stats.suspicious_files))
+
+    def update_system_info(self, force=False):
+        # 1초 안에 다시 불리면 이미 표시된 내용을 그대로 둠 (내용이 바뀐 경우 force)
+        now = time.monotonic()
+        if not force and now - self._last_sysinfo_time < 1.0:
+            return
+        self._last_sysinfo_time = now
+        self.system_info_label.setText(SYSTEM_INFO_TEMPLATE.format(
+            time=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            quarantined=self._quarantine_count_cached(),
+            detailed='활성화' if has_detailed_scan else '비활성화'))
+
+    def _quarantine_count_cached(self):
+        """격리 파일 수 (.meta 제외) - 격리 폴더 내용이 바뀔 때만 다시 셈"""
+        if self._quarantine_count is None:
+            try:
+                with os.scandir(QUARANTINE_DIR) as it:
+                    self._quarantine_count = sum(1 for entry in it if not entry.name.endswith('.meta'))
+            except OSError:
+                self._quarantine_count = 0
+        return self._quarantine_count
 
     def quick_scan(self):
         # 빠른 스캔 (다운로드, 문서, 바탕화면)
@@ -2148,15 +4055,10 @@ li {{ margin: 5px 0; }}
             os.path.expanduser("~/Documents"),
             os.path.expanduser("~/Desktop")
         ]
-        file_list = []
-        for path in quick_paths:
-            if os.path.exists(path):
-                for root, _, files in os.walk(path):
-                    for name in files:
-                        file_list.append(os.path.join(root, name))
-
-        if file_list:
-            self._start_batch_scan(file_list, "빠른 스캔")
+        quick_paths = [path for path in quick_paths if os.path.isdir(path)]
+
+        if quick_paths:
+            self._start_streaming_scan(quick_paths, "빠른 스캔")
         else:
             QMessageBox.information(self, "알림", "스캔할 파일이 없습니다.")
 
@@ -2168,12 +4070,12 @@ li {{ margin: 5px 0; }}
             excluded_files = []
             scan_files = []
             
-            for filepath in files:
-                excluded, reason = is_excluded(filepath, exclusions)
+            for filepath, filename in make_scan_entries(files):
+                excluded, reason = is_excluded(filepath, exclusions, filename)
                 if excluded:
-                    excluded_files.append(f"{os.path.basename(filepath)} - {reason}")
+                    excluded_files.append(f"{filename} - {reason}")
                 else:
-                    scan_files.append(filepath)
+                    scan_files.append((filepath, filename))
             
             # 예외 처리된 파일이 있으면 알림
             if excluded_files:
@@ -2192,19 +4094,8 @@ li {{ margin: 5px 0; }}
     def scan_folder(self):
         folder = QFileDialog.getExistingDirectory(self, "폴더 선택")
         if folder:
-            file_list = []
-            if self.recursive_check.isChecked():
-                for root, _, files in os.walk(folder):
-                    for name in files:
-                        file_list.append(os.path.join(root, name))
-            else:
-                file_list = [os.path.join(folder, f) for f in os.listdir(folder)
-                             if os.path.isfile(os.path.join(folder, f))]
-
-            if file_list:
-                self._start_batch_scan(file_list, "폴더 스캔")
-            else:
-                QMessageBox.information(self, "알림", "스캔할 파일이 없습니다.")
+            # 폴더 순회는 별도 스레드에서, 스캔은 열거된 순서대로 바로 시작
+            self._start_streaming_scan([folder], "폴더 스캔", self.recursive_check.isChecked())
 
     def full_system_scan(self):
         reply = QMessageBox.question(self, '전체 시스템 검사',
@@ -2217,33 +4108,14 @@ li {{ margin: 5px 0; }}
             else:
                 root_path = "/"
 
-            self.progress_label.setText("파일 수집 중...")
-            self.status_label.setText("파일 목록 수집 중...")
-            
-            # 버튼 비활성화
-            self.select_btn.setEnabled(False)
-            self.folder_btn.setEnabled(False)
-            self.full_scan_btn.setEnabled(False)
-            self.drive_scan_btn.setEnabled(False)
-            self.all_drives_btn.setEnabled(False)
-            self.usb_scan_btn.setEnabled(False)
-            self.stop_scan_btn.setEnabled(True)
-            
-            self.file_collector = FileCollectorThread([root_path], max_files=10000)
-            self.file_collector.progress_msg.connect(lambda msg: self.progress_label.setText(msg))
-            self.file_collector.finished.connect(lambda files: self._on_files_collected(files, "전체 시스템 스캔"))
-            self.file_collector.start()
+            # 순회와 스캔을 동시에 진행 (최대 10000개 파일)
+            self._start_streaming_scan([root_path], "전체 시스템 스캔", max_files=10000)
 
     def scan_drive(self):
         """특정 드라이브 선택 검사"""
         if sys.platform.startswith("win"):
             # Windows: 사용 가능한 드라이브 목록 가져오기
-            import string
-            available_drives = []
-            for letter in string.ascii_uppercase:
-                drive = f"{letter}:\\"
-                if os.path.exists(drive):
-                    available_drives.append(drive)
+            available_drives = [drive for drive, _ in list_drives()]
 
             if not available_drives:
                 QMessageBox.warning(self, "오류", "사용 가능한 드라이브가 없습니다.")
@@ -2259,22 +4131,7 @@ li {{ margin: 5px 0; }}
                                              f'{drive} 드라이브 전체를 검사하시겠습니까?\n시간이 오래 걸릴 수 있습니다.',
                                              QMessageBox.Yes | QMessageBox.No)
                 if reply == QMessageBox.Yes:
-                    self.progress_label.setText("파일 수집 중...")
-                    self.status_label.setText(f"{drive} 드라이브 파일 목록 수집 중...")
-                    
-                    # 버튼 비활성화
-                    self.select_btn.setEnabled(False)
-                    self.folder_btn.setEnabled(False)
-                    self.full_scan_btn.setEnabled(False)
-                    self.drive_scan_btn.setEnabled(False)
-                    self.all_drives_btn.setEnabled(False)
-                    self.usb_scan_btn.setEnabled(False)
-                    self.stop_scan_btn.setEnabled(True)
-                    
-                    self.file_collector = FileCollectorThread([drive], max_files=50000)
-                    self.file_collector.progress_msg.connect(lambda msg: self.progress_label.setText(msg))
-                    self.file_collector.finished.connect(lambda files: self._on_files_collected(files, f"{drive} 드라이브 스캔"))
-                    self.file_collector.start()
+                    self._start_streaming_scan([drive], f"{drive} 드라이브 스캔", max_files=50000)
         else:
             # Linux/Mac: 폴더 선택
             folder = QFileDialog.getExistingDirectory(self, "검사할 폴더 선택")
@@ -2284,12 +4141,7 @@ li {{ margin: 5px 0; }}
     def scan_all_drives(self):
         """모든 드라이브 검사"""
         if sys.platform.startswith("win"):
-            import string
-            available_drives = []
-            for letter in string.ascii_uppercase:
-                drive = f"{letter}:\\"
-                if os.path.exists(drive):
-                    available_drives.append(drive)
+            available_drives = [drive for drive, _ in list_drives()]
 
             if not available_drives:
                 QMessageBox.warning(self, "오류", "사용 가능한 드라이브가 없습니다.")
@@ -2301,64 +4153,17 @@ li {{ margin: 5px 0; }}
                                          f'⚠️ 시간이 매우 오래 걸릴 수 있습니다!',
                                          QMessageBox.Yes | QMessageBox.No)
             if reply == QMessageBox.Yes:
-                self.progress_label.setText("파일 수집 중...")
-                self.status_label.setText("모든 드라이브 파일 목록 수집 중...")
-                
-                # 버튼 비활성화
-                self.select_btn.setEnabled(False)
-                self.folder_btn.setEnabled(False)
-                self.full_scan_btn.setEnabled(False)
-                self.drive_scan_btn.setEnabled(False)
-                self.all_drives_btn.setEnabled(False)
-                self.usb_scan_btn.setEnabled(False)
-                self.stop_scan_btn.setEnabled(True)
-                
-                self.file_collector = FileCollectorThread(available_drives, max_files=100000)
-                self.file_collector.progress_msg.connect(lambda msg: self.progress_label.setText(msg))
-                self.file_collector.finished.connect(lambda files: self._on_files_collected(files, "모든 드라이브 스캔"))
-                self.file_collector.start()
+                self._start_streaming_scan(available_drives, "모든 드라이브 스캔", max_files=100000)
         else:
             QMessageBox.information(self, "알림", "이 기능은 Windows에서만 사용 가능합니다.")
     
-    def _on_files_collected(self, file_list, scan_type):
-        """파일 수집 완료 후 스캔 시작"""
-        if file_list:
-            self._start_batch_scan(file_list, scan_type)
-        else:
-            # 버튼 다시 활성화
-            self.select_btn.setEnabled(True)
-            self.folder_btn.setEnabled(True)
-            self.full_scan_btn.setEnabled(True)
-            self.drive_scan_btn.setEnabled(True)
-            self.all_drives_btn.setEnabled(True)
-            self.usb_scan_btn.setEnabled(True)
-            self.progress_label.setText("대기 중...")
-            self.status_label.setText("준비 완료")
-            QMessageBox.information(self, "알림", "스캔할 파일이 없습니다.")
-
     def scan_usb(self):
         """USB 드라이브 검사"""
         if sys.platform.startswith("win"):
-            import string
-            # 이동식 드라이브 찾기
-            usb_drives = []
-            try:
-                import ctypes
-                for letter in string.ascii_uppercase:
-                    drive = f"{letter}:\\"
-                    if os.path.exists(drive):
-                        # GetDriveType으로 이동식 드라이브 확인
-                        drive_type = ctypes.windll.kernel32.GetDriveTypeW(drive)
-                        # DRIVE_REMOVABLE = 2
-                        if drive_type == 2:
-                            usb_drives.append(drive)
-            except Exception as e:
-                print(f"USB 드라이브 탐지 오류: {e}")
-                # 대체 방법: 모든 드라이브 표시
-                for letter in string.ascii_uppercase:
-                    drive = f"{letter}:\\"
-                    if os.path.exists(drive) and letter not in ['C', 'D']:  # C, D 제외
-                        usb_drives.append(drive)
+            # 이동식 드라이브 찾기 (종류를 알 수 없으면 C, D를 제외한 모든 드라이브)
+            usb_drives = [drive for drive, drive_type in list_drives()
+                          if drive_type == DRIVE_REMOVABLE or
+                          (drive_type is None and drive[0] not in ('C', 'D'))]
 
             if not usb_drives:
                 QMessageBox.information(self, "알림", "USB 드라이브를 찾을 수 없습니다.\n\n"
@@ -2380,40 +4185,43 @@ li {{ margin: 5px 0; }}
                                          f'{selected_drive} USB를 검사하시겠습니까?',
                                          QMessageBox.Yes | QMessageBox.No)
             if reply == QMessageBox.Yes:
-                file_list = []
+                # 드라이브 접근 가능 여부만 먼저 확인 (순회는 열거 스레드에서)
                 try:
-                    for root, _, files in os.walk(selected_drive):
-                        for name in files:
-                            file_list.append(os.path.join(root, name))
-                            if len(file_list) > 50000:  # 최대 50000개 파일로 제한
-                                break
-                except Exception as e:
+                    with os.scandir(selected_drive):
+                        pass
+                except OSError as e:
                     QMessageBox.warning(self, "오류", f"USB 접근 오류:\n{e}")
                     return
-
-                if file_list:
-                    self._start_batch_scan(file_list, f"USB 스캔 ({selected_drive})")
-                else:
-                    QMessageBox.information(self, "알림", "스캔할 파일이 없습니다.")
+                # 최대 50000개 파일로 제한
+                self._start_streaming_scan([selected_drive], f"USB 스캔 ({selected_drive})", max_files=50000)
         else:
             QMessageBox.information(self, "알림", "이 기능은 Windows에서만 사용 가능합니다.")
 
-    def _start_batch_scan(self, files, scan_type="스캔"):
+    def _start_batch_scan(self, files, scan_type="스캔", total=None):
+        """files: (경로, 파일명) 리스트 또는 제너레이터 (제너레이터면 total은 알 때만 전달)"""
         if not files:
-            return
+            return False
+        if hasattr(files, '__len__'):
+            total = len(files)
 
         # 이미 스캔 중인지 확인
         if self.scan_thread and self.scan_thread.isRunning():
             QMessageBox.warning(self, "경고", "이미 스캔이 진행 중입니다.\n먼저 현재 스캔을 중지하세요.")
-            return
+            return False
 
         # 중지 플래그 초기화
         self.scan_stopped_by_user = False
+        self._enum_total = None  # 폴더 열거로 찾은 파일 수 (스트리밍 스캔에서 열거가 끝나면 설정)
+        # 스캔 중에는 차트 애니메이션 끄기
+        self._set_chart_animations(False)
 
-        self.result_table.setRowCount(0)
-        self.progress.setMaximum(len(files))
+        self.result_model.clear()
+        self.progress.setMaximum(total or 0)  # 개수를 모르면 진행 표시만
         self.progress.setValue(0)
-        self.progress_label.setText(f"{scan_type} 시작... (총 {len(files)}개 파일)")
+        if total is not None:
+            self.progress_label.setText(f"{scan_type} 시작... (총 {total}개 파일)")
+        else:
+            self.progress_label.setText(f"{scan_type} 시작...")
 
         # 버튼 상태 변경
         self.select_btn.setEnabled(False)
@@ -2427,49 +4235,63 @@ li {{ margin: 5px 0; }}
         # 제외 목록 가져오기
         exclusions = SETTINGS.get('exclusions', {'folders': [], 'files': [], 'extensions': [], 'hashes': []})
 
-        self.scan_thread = BatchScanThread(files, self.detailed_check.isChecked(), exclusions)
+        scan_thread = make_scan_thread(files, self.detailed_check.isChecked(), exclusions,
+                                       max_workers=get_scan_workers(), total_hint=total)
+        self.scan_thread = scan_thread
         self.scan_thread.progress.connect(self.progress.setValue)
-        self.scan_thread.result_detailed.connect(self.add_result_to_table)
+        self.scan_thread.results_ready.connect(self.add_results_to_table)
         self.scan_thread.stats_update.connect(self.update_stats)
-        self.scan_thread.skipped_file.connect(self.on_file_skipped)
-        self.scan_thread.finished.connect(lambda: self.scan_finished(scan_type, len(files)))
+        self.scan_thread.skipped_files.connect(self.on_files_skipped)
+        self.scan_thread.finished.connect(lambda: self.scan_finished(scan_type, scan_thread.processed))
         self.scan_thread.start()
+        return True
 
-    def on_file_skipped(self, msg):
-        """제외된 파일 처리"""
+    def _start_streaming_scan(self, paths, scan_type="스캔", recursive=True, max_files=None):
+        """폴더 열거(FileEnumerator)와 스캔을 겹쳐서 실행 - 열거가 끝나면 진행바 총량 설정"""
+        feed = ScanFeed()
+        if not self._start_batch_scan(feed, scan_type):
+            return
+        self.scan_feed = feed
+        # 열거 스레드가 feed에 직접 넣음 (GUI 스레드를 거치지 않고, 스캔이 밀리면 열거가 대기)
+        self.file_enumerator = FileEnumerator(paths, feed, recursive, max_files)
+        self.file_enumerator.finished_enum.connect(self._on_enum_finished)
+        self.file_enumerator.start()
+
+    def _on_enum_finished(self, total):
+        """열거 완료 - 진행바 총량 확정 (0개면 scan_finished에서 알림만 표시)"""
+        # 중지된 이전 열거의 시그널이 이미 대기열에 있던 경우 - 새 스캔에 적용하지 않음
+        if self.sender() is not self.file_enumerator:
+            return
+        self.scan_feed = None
+        self._enum_total = total
+        if total and self.scan_thread and not self.scan_stopped_by_user:
+            self.scan_thread.total = total
+            self.progress.setMaximum(max(total, 1))
+            self.progress_label.setText(f"검사 중... (총 {total}개 파일)")
+
+    def _stop_enumerator(self):
+        """진행 중인 열거 중지 - 대기 중인 스캔 스레드가 끝날 수 있도록 대기열도 닫음"""
+        if self.file_enumerator and self.file_enumerator.isRunning():
+            self.file_enumerator.stop()
+            try:
+                self.file_enumerator.finished_enum.disconnect()
+            except TypeError:
+                pass
+        if self.scan_feed:
+            self.scan_feed.close()
+            self.scan_feed = None
+
+    def toggle_parallel_scan(self, checked):
+        """병렬 스캔 설정 변경"""
+        SETTINGS['parallel_scan'] = checked
+        save_settings(SETTINGS)
+
+    def on_files_skipped(self, msgs):
+        """제외된 파일 처리 (스캔 스레드가 모아 보낸 묶음)"""
         # 로그에만 기록 (UI에 표시하지 않음)
-        print(msg)
+        print('\n'.join(msgs))
 
     def stop_scan(self):
-        # 파일 수집 중인 경우
-        if hasattr(self, 'file_collector') and self.file_collector and self.file_collector.isRunning():
-            reply = QMessageBox.question(self, '스캔 중지', '파일 수집을 중지하시겠습니까?',
-                                         QMessageBox.Yes | QMessageBox.No)
-            if reply == QMessageBox.Yes:
-                self.file_collector.stop()
-                try:
-                    self.file_collector.progress_msg.disconnect()
-                    self.file_collector.finished.disconnect()
-                except:
-                    pass
-                
-                self.stop_scan_btn.setEnabled(False)
-                self.progress.setValue(100)
-                self.progress.setMaximum(100)
-                self.progress_label.setText("⛔ 파일 수집이 중지되었습니다.")
-                
-                # 버튼 상태 복원
-                self.select_btn.setEnabled(True)
-                self.folder_btn.setEnabled(True)
-                self.full_scan_btn.setEnabled(True)
-                self.drive_scan_btn.setEnabled(True)
-                self.all_drives_btn.setEnabled(True)
-                self.usb_scan_btn.setEnabled(True)
-                
-                self.status_label.setText("파일 수집 중지됨")
-                QMessageBox.information(self, "중지", "파일 수집이 중지되었습니다.")
-            return
-        
         # 스캔 중인 경우
         if self.scan_thread and self.scan_thread.isRunning():
             reply = QMessageBox.question(self, '스캔 중지', '정말로 스캔을 중지하시겠습니까?',
@@ -2478,15 +4300,16 @@ li {{ margin: 5px 0; }}
                 # 중지 플래그 설정
                 self.scan_stopped_by_user = True
                 
-                # 스레드 중지 요청
+                # 스레드 중지 요청 (열거 중이면 함께 중지)
                 self.scan_thread.stop()
+                self._stop_enumerator()
                 
                 # 시그널 연결 해제 (더 이상 UI 업데이트 안함)
                 try:
                     self.scan_thread.progress.disconnect()
-                    self.scan_thread.result_detailed.disconnect()
+                    self.scan_thread.results_ready.disconnect()
                     self.scan_thread.stats_update.disconnect()
-                    self.scan_thread.skipped_file.disconnect()
+                    self.scan_thread.skipped_files.disconnect()
                     self.scan_thread.finished.disconnect()
                 except:
                     pass
@@ -2509,6 +4332,7 @@ li {{ margin: 5px 0; }}
                 
                 # 대시보드 업데이트 (차트 포함)
                 self.update_dashboard()
+                self._set_chart_animations(True)
                 self.update_pie_chart()
                 
                 # 중지 알림
@@ -2521,47 +4345,31 @@ li {{ margin: 5px 0; }}
         else:
             QMessageBox.information(self, "알림", "현재 진행 중인 스캔이 없습니다.")
 
-    def add_result_to_table(self, result):
-        row = self.result_table.rowCount()
-        self.result_table.insertRow(row)
-
-        filepath = result.get('filepath', '')
-        filename = os.path.basename(filepath)
-        folder_path = os.path.dirname(filepath)
-        status = result.get('status', -1)
-        threat = result.get('threat_name', 'Unknown')
-        md5 = result.get('md5', '')[:16] + "..." if result.get('md5') else ""
-        size = result.get('file_size', 0)
-
-        status_map = {0: "✅ 정상", 1: "🔴 악성", 2: "🔴 악성", 3: "⚠️ 의심", -1: "❌ 오류"}
-        status_text = status_map.get(status, "❓ 알수없음")
-
-        self.result_table.setItem(row, 0, QTableWidgetItem(filename))
-        self.result_table.setItem(row, 1, QTableWidgetItem(folder_path))
-        self.result_table.setItem(row, 2, QTableWidgetItem(status_text))
-        self.result_table.setItem(row, 3, QTableWidgetItem(threat))
-        self.result_table.setItem(row, 4, QTableWidgetItem(md5))
-        self.result_table.setItem(row, 5, QTableWidgetItem(f"{size} bytes"))
-
-        # 작업 버튼
-        if status in [1, 2, 3]:  # 악성 또는 의심
-            quarantine_btn = QPushButton('🗂️ 격리')
-            quarantine_btn.clicked.connect(lambda: self.quarantine_file(filepath, threat))
-            self.result_table.setCellWidget(row, 6, quarantine_btn)
-
+    def add_results_to_table(self, results):
+        """스캔 스레드가 모아 보낸 ScanRow 묶음을 모델에 한 번에 추가 (위협 행만 따로 처리)"""
+        self.result_model.add_rows(results)
+        threats = [result for result in results if result.is_threat]
+        if not threats:
+            return
+        stamp = datetime.now().strftime('%H:%M:%S')  # 묶음 단위로 한 번만 포맷
+        auto_quarantine = self.auto_quarantine_check.isChecked()
+        for result in threats:
             # 최근 위협 목록에 추가
-            self.recent_threats_list.addItem(f"[{datetime.now().strftime('%H:%M:%S')}] {threat} - {filename}")
+            self.recent_threats_model.add_threat(f"[{stamp}] {result.threat_name} - {result.filename}")
 
             # 자동 격리
-            if self.auto_quarantine_check.isChecked():
-                self.quarantine_file(filepath, threat)
+            if auto_quarantine:
+                self.quarantine_file(result.filepath, result.threat_name)
+
+    def quarantine_result_row(self, row):
+        """결과 테이블 '격리' 버튼 클릭"""
+        result = self.result_model.row_at(row)
+        self.quarantine_file(result.filepath, result.threat_name)
 
     def update_stats(self, stats):
-        self.stats.total_scanned = stats['total']
-        self.stats.clean_files = stats['clean']
-        self.stats.malicious_files = stats['malicious']
-        self.stats.suspicious_files = stats['suspicious']
-        self.stats.errors = stats['errors']
+        """스캔 스레드 통계 시그널 처리 - 폴링 타이머 없이 바뀔 때만 대시보드 갱신"""
+        self.stats.set_counts(stats['clean'], stats['malicious'], stats['suspicious'], stats['errors'])
+        self.update_dashboard()
         self.progress_label.setText(f"진행 중... 정상: {stats['clean']}, 악성: {stats['malicious']}, 의심: {stats['suspicious']}")
 
     def scan_finished(self, scan_type, total_files):
@@ -2578,6 +4386,8 @@ li {{ margin: 5px 0; }}
             self.scan_thread = None
         
         # 진행바 100%로 설정
+        if self.progress.maximum() == 0:
+            self.progress.setMaximum(max(total_files, 1))
         self.progress.setValue(self.progress.maximum())
         self.progress_label.setText(f"✅ 검사 완료! (정상: {self.stats.clean_files}, 악성: {self.stats.malicious_files}, 의심: {self.stats.suspicious_files})")
 
@@ -2591,6 +4401,15 @@ li {{ margin: 5px 0; }}
         self.stop_scan_btn.setEnabled(False)
 
         # 차트 업데이트 (스캔 완료 시에만)
+        self._set_chart_animations(True)
+
+        # 열거된 파일이 없으면 기록하지 않고 알림만 표시
+        if self._enum_total == 0:
+            self.progress.setValue(0)
+            self.progress_label.setText("준비 완료")
+            QMessageBox.information(self, "알림", "스캔할 파일이 없습니다.")
+            return
+
         self.update_pie_chart()
 
         # 히스토리에 추가
@@ -2602,7 +4421,9 @@ li {{ margin: 5px 0; }}
             'status': '완료'
         }
         self.scan_history.append(history_entry)
-        self.save_history()
+        self.append_history(history_entry)
+        if self._history_pending is not None:
+            self._history_pending += 1
         self.refresh_history()
 
         QMessageBox.information(self, "스캔 완료",
@@ -2623,11 +4444,12 @@ li {{ margin: 5px 0; }}
                 return
 
             # 한글 파일명을 안전한 형식으로 변환
-            filename = os.path.basename(filepath)
+            filename = base_name(filepath)
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
 
             # 파일 확장자 분리
-            name_part, ext_part = os.path.splitext(filename)
+            ext_part = file_ext(filename)
+            name_part = filename[:len(filename) - len(ext_part)]
 
             # 안전한 파일명 생성 (영문+숫자만 사용)
             import hashlib
@@ -2640,56 +4462,57 @@ li {{ margin: 5px 0; }}
 
             # 파일을 사용 중인 프로세스 강제 종료 함수
             def force_close_file_handles(file_path):
-                """psutil을 사용하여 파일을 사용 중인 프로세스 찾기 및 종료"""
+                """파일을 사용 중인 프로세스 찾기 및 종료 (Windows: 핸들 테이블, 그 외: psutil)"""
                 try:
-                    import psutil
-                    # 절대 경로로 변환
-                    abs_path = os.path.abspath(file_path).lower()
-                    closed_count = 0
-
-                    # 모든 프로세스 검사
-                    for proc in psutil.process_iter(['pid', 'name']):
-                        try:
-                            # 프로세스가 열고 있는 파일 목록 확인
-                            for item in proc.open_files():
-                                if item.path.lower() == abs_path:
-                                    print(f"[격리] 파일 사용 중인 프로세스 발견: {proc.info['name']} (PID: {proc.info['pid']})")
-
-                                    # 중요 시스템 프로세스는 건너뛰기
-                                    if proc.info['name'].lower() in ['system', 'csrss.exe', 'smss.exe', 'wininit.exe']:
-                                        continue
-
-                                    # 프로세스 강제 종료
-                                    proc.kill()
-                                    closed_count += 1
-                                    print(f"[격리] 프로세스 종료됨: {proc.info['name']}")
-                                    time.sleep(0.3)
-                                    break
-                        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                            continue
-
-                    return closed_count > 0
+                    pids = find_file_lock_pids(file_path)
                 except ImportError:
                     print("[경고] psutil이 설치되지 않았습니다. 파일 핸들 강제 종료를 건너뜁니다.")
                     print("       설치: pip install psutil")
                     return False
                 except Exception as e:
-                    print(f"[오류] 파일 핸들 종료 실패: {e}")
+                    print(f"[오류] 파일 핸들 조회 실패: {e}")
                     return False
 
+                closed_count = 0
+                for pid in pids:
+                    name = get_process_name(pid) or str(pid)
+                    print(f"[격리] 파일 사용 중인 프로세스 발견: {name} (PID: {pid})")
+
+                    # 중요 시스템 프로세스는 건너뛰기
+                    if name.lower() in PROTECTED_PROCESS_NAMES:
+                        continue
+
+                    # 프로세스 강제 종료
+                    if terminate_process(pid):
+                        closed_count += 1
+                        print(f"[격리] 프로세스 종료됨: {name}")
+                        time.sleep(0.3)
+
+                return closed_count > 0
+
             # 파일 복사 재시도 로직
             max_retries = 5
             success = False
             last_error = None
+            copied = False
 
             for attempt in range(max_retries):
                 try:
-                    # 파일을 바이너리 모드로 읽어서 복사 (핸들 즉시 해제)
-                    with open(filepath, 'rb') as src:
-                        file_data = src.read()
-
-                    with open(quarantine_path, 'wb') as dst:
-                        dst.write(file_data)
+                    if not copied:
+                        try:
+                            # 같은 볼륨이면 이름만 바꿔서 이동 (데이터 복사 없음)
+                            os.replace(filepath, quarantine_path)
+                            success = True
+                            break
+                        except OSError as e:
+                            # 다른 볼륨이거나 다른 프로그램이 사용 중이면 복사 후 삭제로 진행
+                            cross_device = (e.errno == errno.EXDEV
+                                            or getattr(e, 'winerror', None) == ERROR_NOT_SAME_DEVICE)
+                            if not (cross_device or isinstance(e, PermissionError)):
+                                raise
+                        # OS 복사 사용 (Windows: CopyFileExW, Linux: copy_file_range/sendfile)
+                        shutil.copyfile(filepath, quarantine_path)
+                        copied = True
 
                     # 원본 파일 삭제 시도
                     time.sleep(0.2)
@@ -2697,7 +4520,7 @@ li {{ margin: 5px 0; }}
                     # Windows에서 파일 속성 변경 (읽기 전용 해제)
                     if sys.platform.startswith("win"):
                         try:
-                            subprocess.run(['attrib', '-R', filepath], capture_output=True, timeout=2)
+                            _get_kernel32().SetFileAttributesW(filepath, FILE_ATTRIBUTE_NORMAL)
                         except:
                             pass
 
@@ -2748,7 +4571,7 @@ li {{ margin: 5px 0; }}
                     # 파일 탐색기에서 파일 위치 열기
                     try:
                         if sys.platform.startswith("win"):
-                            subprocess.run(['explorer', '/select,', filepath])
+                            subprocess.Popen(['explorer', '/select,', filepath])  # 탐색기 종료를 기다리지 않음
                     except:
                         pass
                     QMessageBox.information(self, "수동 삭제 필요",
@@ -2756,16 +4579,16 @@ li {{ margin: 5px 0; }}
                                             f"파일 탐색기가 열렸습니다.\n"
                                             f"파일을 사용 중인 프로그램을 모두 닫은 후 삭제하세요.")
 
-            # 메타데이터 저장 (UTF-8 인코딩 명시)
+            # 메타데이터 저장 (공백 없는 UTF-8 JSON을 한 번에 씀)
             meta_path = quarantine_path + ".meta"
-            with open(meta_path, 'w', encoding='utf-8') as f:
-                json.dump({
+            with open(meta_path, 'wb') as f:
+                f.write(json_dumps_compact({
                     'original_path': filepath,
                     'original_filename': filename,
                     'threat_name': threat_name,
                     'quarantine_time': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
                     'original_deleted': success
-                }, f, ensure_ascii=False, indent=2)
+                }))
 
             self.stats.quarantined += 1
             self.refresh_quarantine()
@@ -2781,57 +4604,82 @@ li {{ margin: 5px 0; }}
             QMessageBox.critical(self, "오류", f"격리 실패:\n{e}")
 
     def refresh_quarantine(self):
-        self.quarantine_table.setRowCount(0)
-        if not os.path.exists(QUARANTINE_DIR):
+        # 격리/복원/삭제/폴더 변경 후 항상 호출되므로 여기서 캐시 무효화
+        self._quarantine_count = None
+        self._fill_quarantine_table()
+        # 격리 파일 수가 바뀌었을 수 있으므로 시스템 정보도 갱신
+        self.update_system_info(force=True)
+
+    def _fill_quarantine_table(self):
+        if not hasattr(self, 'quarantine_table'):
+            return  # 격리 탭이 아직 생성되지 않음 (생성 시 새로 읽음)
+
+        # 폴더를 한 번만 읽어 격리 파일과 .meta 파일을 짝지음 (파일별 exists 확인 없음)
+        entries = {}
+        try:
+            with os.scandir(QUARANTINE_DIR) as it:
+                for entry in it:
+                    if entry.name.endswith('.meta'):
+                        entries.setdefault(entry.name[:-5], {})['meta'] = entry.path
+                    else:
+                        entries.setdefault(entry.name, {})['file'] = entry.path
+        except OSError:
+            self.quarantine_table.setRowCount(0)
             return
 
-        for filename in os.listdir(QUARANTINE_DIR):
-            if filename.endswith('.meta'):
-                continue
-
-            filepath = os.path.join(QUARANTINE_DIR, filename)
-            meta_path = filepath + ".meta"
+        rows = []
+        for filename, paths in entries.items():
+            filepath = paths.get('file')
+            if filepath is None:
+                continue  # 원본 없이 남은 .meta
+            meta_path = paths.get('meta')
 
             threat_name = "Unknown"
             quarantine_time = "Unknown"
             original_filename = filename
 
-            if os.path.exists(meta_path):
+            if meta_path is not None:
                 try:
-                    with open(meta_path, 'r', encoding='utf-8') as f:
-                        meta = json.load(f)
+                    with open(meta_path, 'rb') as f:
+                        meta = json_loads(f.read())
                         threat_name = meta.get('threat_name', 'Unknown')
                         quarantine_time = meta.get('quarantine_time', 'Unknown')
                         original_filename = meta.get('original_filename', filename)
                 except:
                     pass
+            rows.append((filepath, original_filename, quarantine_time, threat_name))
 
-            row = self.quarantine_table.rowCount()
-            self.quarantine_table.insertRow(row)
-            self.quarantine_table.setItem(row, 0, QTableWidgetItem(original_filename))
-            self.quarantine_table.setItem(row, 1, QTableWidgetItem(quarantine_time))
-            self.quarantine_table.setItem(row, 2, QTableWidgetItem(threat_name))
-
-            # 작업 버튼들 (복원, 삭제)을 하나의 위젯에 배치
-            action_widget = QWidget()
-            action_layout = QHBoxLayout(action_widget)
-            action_layout.setContentsMargins(2, 2, 2, 2)
-            action_layout.setSpacing(3)
-            
-            restore_btn = QPushButton('↩️ 복원')
-            restore_btn.clicked.connect(lambda checked, f=filepath: self.restore_file(f))
-            action_layout.addWidget(restore_btn)
-            
-            delete_btn = QPushButton('🗑️ 삭제')
-            delete_btn.clicked.connect(lambda checked, f=filepath: self.delete_file(f))
-            action_layout.addWidget(delete_btn)
-            
-            self.quarantine_table.setCellWidget(row, 3, action_widget)
-            
-            # 경로 확인 버튼 (별도 열)
-            path_btn = QPushButton('📁 경로 확인')
-            path_btn.clicked.connect(lambda checked, f=filepath: self.show_original_path(f))
-            self.quarantine_table.setCellWidget(row, 4, path_btn)
+        # 행 수를 한 번에 정하고 채우는 동안 다시 그리기/시그널 중지
+        with bulk_table_update(self.quarantine_table) as table:
+            table.setRowCount(0)
+            table.setRowCount(len(rows))
+            for row, (filepath, original_filename, quarantine_time, threat_name) in enumerate(rows):
+                table.setItem(row, 0, QTableWidgetItem(original_filename))
+                table.setItem(row, 1, QTableWidgetItem(quarantine_time))
+                table.setItem(row, 2, QTableWidgetItem(threat_name))
+
+                # 작업 버튼들 (복원, 삭제)을 하나의 위젯에 배치
+                action_widget = QWidget()
+                action_layout = QHBoxLayout(action_widget)
+                action_layout.setContentsMargins(2, 2, 2, 2)
+                action_layout.setSpacing(3)
+
+                restore_btn = QPushButton('↩️ 복원')
+                restore_btn.clicked.connect(lambda checked, f=filepath: self.restore_file(f))
+                action_layout.addWidget(restore_btn)
+
+                delete_btn = QPushButton('🗑️ 삭제')
+                delete_btn.clicked.connect(lambda checked, f=filepath: self.delete_file(f))
+                action_layout.addWidget(delete_btn)
+
+                table.setCellWidget(row, 3, action_widget)
+
+                # 경로 확인 버튼 (별도 열)
+                path_btn = QPushButton('📁 경로 확인')
+                path_btn.clicked.connect(lambda checked, f=filepath: self.show_original_path(f))
+                table.setCellWidget(row, 4, path_btn)
+
+        self._quarantine_count = len(rows)
 
     def restore_file(self, filepath):
         # 복원 확인 메시지
@@ -2860,8 +4708,8 @@ li {{ margin: 5px 0; }}
                 return
 
             # 메타 파일 읽기
-            with open(meta_path, 'r', encoding='utf-8') as f:
-                meta = json.load(f)
+            with open(meta_path, 'rb') as f:
+                meta = json_loads(f.read())
 
             original_path = meta.get('original_path')
             if not original_path:
@@ -2870,8 +4718,7 @@ li {{ margin: 5px 0; }}
 
             # 원본 경로의 디렉토리가 존재하는지 확인
             original_dir = os.path.dirname(original_path)
-            if not os.path.exists(original_dir):
-                os.makedirs(original_dir)
+            os.makedirs(original_dir, exist_ok=True)
 
             # 파일 복사 후 격리 파일 삭제
             shutil.copy2(filepath, original_path)
@@ -2903,8 +4750,8 @@ li {{ margin: 5px 0; }}
         meta_path = filepath + ".meta"
         if os.path.exists(meta_path):
             try:
-                with open(meta_path, 'r', encoding='utf-8') as f:
-                    meta = json.load(f)
+                with open(meta_path, 'rb') as f:
+                    meta = json_loads(f.read())
                 original_path = meta.get('original_path', '알 수 없음')
                 original_filename = meta.get('original_filename', '알 수 없음')
                 QMessageBox.information(self, '원본 경로 정보', 
@@ -2949,6 +4796,22 @@ li {{ margin: 5px 0; }}
         """실시간 감시 로그에 메시지 추가 (메인 스레드에서 실행)"""
         self.monitor_log.append(msg)
 
+    def _queue_monitor_log(self, msg):
+        """감시 워커 스레드에서 호출 - 로그를 쌓아 두고 묶음의 첫 줄에서만 GUI에 알림"""
+        line = f"[{datetime.now().strftime('%H:%M:%S')}] {msg}"
+        with self._monitor_log_lock:
+            self._monitor_log_lines.append(line)
+            if len(self._monitor_log_lines) > 1:
+                return  # 이미 반영 예약됨
+        self.monitor_log_pending.emit()
+
+    def _flush_monitor_log(self):
+        """쌓인 감시 로그를 한 번에 추가"""
+        with self._monitor_log_lock:
+            lines, self._monitor_log_lines = self._monitor_log_lines, []
+        if lines:
+            self.monitor_log.append('\n'.join(lines))
+
     def toggle_monitoring(self, checked):
         if checked:
             dir_ = QFileDialog.getExistingDirectory(self, "감시할 폴더 선택")
@@ -2956,18 +4819,29 @@ li {{ margin: 5px 0; }}
                 self.monitor_btn.setChecked(False)
                 return
 
+            try:
+                observer = make_monitor_observer()
+                handler = make_folder_handler(self._queue_monitor_log)
+            except ImportError:
+                QMessageBox.warning(self, "기능 없음", "watchdog이 설치되지 않았습니다.\n설치: pip install watchdog")
+                self.monitor_btn.setChecked(False)
+                return
+
             self.monitor_btn.setText("⏹️ 실시간 감시 중지")
             self.monitor_path_label.setText(f"감시 중: {dir_}")
             self.monitor_log_signal.emit(f"\n[{datetime.now().strftime('%H:%M:%S')}] 실시간 감시 시작: {dir_}\n")
 
-            self.observer = Observer()
-            handler = FolderHandler(lambda msg: self.monitor_log_signal.emit(f"[{datetime.now().strftime('%H:%M:%S')}] {msg}"))
-            self.observer.schedule(handler, dir_, recursive=False)
+            self.observer = observer
+            self.monitor_handler = handler
+            # 하위 폴더까지 감시 (OS 백엔드는 재귀 감시도 핸들 하나로 처리)
+            self.observer.schedule(handler, dir_, recursive=True)
             self.observer.start()
         else:
             try:
                 self.observer.stop()
                 self.observer.join()
+                self.monitor_handler.close()
+                self._flush_monitor_log()
                 self.monitor_log_signal.emit(f"\n[{datetime.now().strftime('%H:%M:%S')}] 실시간 감시 중지\n")
                 self.monitor_path_label.setText("감시 중인 폴더: 없음")
             except:
@@ -2989,6 +4863,7 @@ li {{ margin: 5px 0; }}
 
         try:
             count = engine.add_signature(name.encode('utf-8'), pattern.encode('utf-8'), severity)
+            record_engine_rule('signature', name, pattern, severity)
             QMessageBox.information(self, "성공",
                                     f"시그니처 추가 완료!\n\n"
                                     f"이름: {name}\n"
@@ -3021,6 +4896,7 @@ li {{ margin: 5px 0; }}
 
         try:
             count = engine.add_hash(hash_value.encode('utf-8'), threat_name.encode('utf-8'), severity, is_sha256)
+            record_engine_rule('hash', hash_value, threat_name, severity, is_sha256)
             QMessageBox.information(self, "성공",
                                     f"해시 추가 완료!\n\n"
                                     f"해시: {hash_value}\n"
@@ -3038,13 +4914,12 @@ li {{ margin: 5px 0; }}
         new_folder = QFileDialog.getExistingDirectory(self, "격리 폴더 선택", QUARANTINE_DIR)
 
         if new_folder:
-            # 폴더가 존재하는지 확인
-            if not os.path.exists(new_folder):
-                try:
-                    os.makedirs(new_folder)
-                except Exception as e:
-                    QMessageBox.critical(self, "오류", f"폴더 생성 실패:\n{e}")
-                    return
+            # 폴더가 없으면 생성 (있으면 그대로)
+            try:
+                os.makedirs(new_folder, exist_ok=True)
+            except OSError as e:
+                QMessageBox.critical(self, "오류", f"폴더 생성 실패:\n{e}")
+                return
 
             # 설정 저장
             SETTINGS['quarantine_dir'] = new_folder
@@ -3063,12 +4938,7 @@ li {{ margin: 5px 0; }}
         """격리 폴더 열기"""
         if os.path.exists(QUARANTINE_DIR):
             try:
-                if sys.platform.startswith("win"):
-                    os.startfile(QUARANTINE_DIR)
-                elif sys.platform.startswith("darwin"):  # macOS
-                    os.system(f'open "{QUARANTINE_DIR}"')
-                else:  # Linux
-                    os.system(f'xdg-open "{QUARANTINE_DIR}"')
+                open_folder(QUARANTINE_DIR)
             except Exception as e:
                 QMessageBox.warning(self, "오류", f"폴더 열기 실패:\n{e}")
         else:
@@ -3082,15 +4952,14 @@ li {{ margin: 5px 0; }}
                                      '기본 폴더: python_gui/quarantine',
                                      QMessageBox.Yes | QMessageBox.No)
         if reply == QMessageBox.Yes:
-            default_folder = os.path.join(os.path.dirname(__file__), "quarantine")
+            default_folder = DEFAULT_QUARANTINE_DIR
 
             # 폴더가 존재하지 않으면 생성
-            if not os.path.exists(default_folder):
-                try:
-                    os.makedirs(default_folder)
-                except Exception as e:
-                    QMessageBox.critical(self, "오류", f"폴더 생성 실패:\n{e}")
-                    return
+            try:
+                os.makedirs(default_folder, exist_ok=True)
+            except OSError as e:
+                QMessageBox.critical(self, "오류", f"폴더 생성 실패:\n{e}")
+                return
 
             # 설정 저장
             SETTINGS['quarantine_dir'] = default_folder
@@ -3133,7 +5002,10 @@ li {{ margin: 5px 0; }}
         """설정 파일이 있는 폴더 열기"""
         settings_dir = os.path.dirname(SETTINGS_FILE)
         if os.path.exists(settings_dir):
-            os.startfile(settings_dir)
+            try:
+                open_folder(settings_dir)
+            except Exception as e:
+                QMessageBox.warning(self, "오류", f"폴더 열기 실패:\n{e}")
         else:
             QMessageBox.warning(self, "오류", "설정 폴더가 존재하지 않습니다.")
 
@@ -3145,7 +5017,7 @@ li {{ margin: 5px 0; }}
                                      f'기본 경로: {SCRIPT_DIR}',
                                      QMessageBox.Yes | QMessageBox.No)
         if reply == QMessageBox.Yes:
-            default_settings_file = os.path.join(SCRIPT_DIR, "settings.json")
+            default_settings_file = DEFAULT_SETTINGS_FILE
             old_settings_file = SETTINGS_FILE
             
             try:
@@ -3168,58 +5040,101 @@ li {{ margin: 5px 0; }}
         filename, _ = QFileDialog.getSaveFileName(self, "결과 내보내기", "",
                                                   "CSV Files (*.csv);;JSON Files (*.json);;All Files (*)")
         if filename:
-            try:
-                if filename.endswith('.json'):
-                    results = []
-                    for row in range(self.result_table.rowCount()):
-                        results.append({
-                            'filename': self.result_table.item(row, 0).text(),
-                            'status': self.result_table.item(row, 1).text(),
-                            'threat': self.result_table.item(row, 2).text(),
-                            'md5': self.result_table.item(row, 3).text(),
-                            'size': self.result_table.item(row, 4).text()
-                        })
-                    with open(filename, 'w', encoding='utf-8') as f:
-                        json.dump(results, f, indent=2, ensure_ascii=False)
-                else:
-                    with open(filename, 'w', encoding='utf-8') as f:
-                        f.write("파일명,상태,위협,MD5,크기\n")
-                        for row in range(self.result_table.rowCount()):
-                            f.write(f"{self.result_table.item(row, 0).text()},"
-                                    f"{self.result_table.item(row, 1).text()},"
-                                    f"{self.result_table.item(row, 2).text()},"
-                                    f"{self.result_table.item(row, 3).text()},"
-                                    f"{self.result_table.item(row, 4).text()}\n")
-                QMessageBox.information(self, "성공", "결과가 저장되었습니다!")
-            except Exception as e:
-                QMessageBox.critical(self, "오류", f"저장 실패:\n{e}")
+            # 행 스냅샷만 여기서 만들고 직렬화/쓰기는 스레드에서 (큰 결과도 GUI가 멈추지 않음)
+            self.export_btn.setEnabled(False)
+            self.export_thread = ExportThread(filename, self.result_model.text_rows(range(5)))
+            self.export_thread.export_done.connect(self.on_export_done)
+            self.export_thread.start()
+
+    def on_export_done(self, error):
+        self.export_btn.setEnabled(True)
+        self.export_thread.wait()  # run()이 완전히 끝난 뒤 참조 해제
+        self.export_thread = None
+        if error:
+            QMessageBox.critical(self, "오류", f"저장 실패:\n{error}")
+        else:
+            QMessageBox.information(self, "성공", "결과가 저장되었습니다!")
+
+    @property
+    def scan_history(self):
+        """스캔 히스토리 (최근 HISTORY_MAX_ENTRIES개 deque) - 처음 접근할 때 파일에서 로드"""
+        if self._scan_history is None:
+            history = self.load_history()
+            self._scan_history = deque(history, maxlen=HISTORY_MAX_ENTRIES)
+            if len(history) > HISTORY_MAX_ENTRIES:
+                self.save_history()  # 잘라낸 만큼 파일도 줄여 둠
+        return self._scan_history
+
+    @scan_history.setter
+    def scan_history(self, history):
+        self._scan_history = deque(history, maxlen=HISTORY_MAX_ENTRIES)
 
     def load_history(self):
-        if os.path.exists(HISTORY_FILE):
+        """히스토리 파일 파싱 - scan_history 속성이 처음 접근될 때 한 번만 호출됨 (이후 메모리 목록이 기준)"""
+        history = []
+        try:
+            # exists 확인 없이 바로 열어 봄 (없으면 이전 형식 확인)
+            with open(HISTORY_FILE, 'rb') as f:
+                lines = [line for line in f.read().splitlines() if line.strip()]
             try:
-                with open(HISTORY_FILE, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except:
-                return []
-        return []
+                # 줄들을 배열 하나로 묶어 한 번에 파싱 (orjson 호출 1회)
+                return json_loads(b'[' + b','.join(lines) + b']')
+            except ValueError:
+                pass
+            for line in lines:
+                try:
+                    history.append(json_loads(line))
+                except ValueError:
+                    pass  # 손상된 줄은 건너뜀
+            return history
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"히스토리 로드 실패: {e}")
+            return history
+
+        # 이전 형식(JSON 배열) 히스토리는 JSONL로 변환
+        try:
+            with open(LEGACY_HISTORY_FILE, 'rb') as f:
+                history = json_loads(f.read())
+            self._write_history(history)
+            return history
+        except Exception:
+            return []
+
+    def _write_history(self, history):
+        """히스토리 파일 전체 다시 쓰기"""
+        write_file_atomic(HISTORY_FILE, b''.join(json_dumps_compact(entry) + b'\n' for entry in history))
+
+    def append_history(self, entry):
+        """히스토리 기록 하나를 파일 끝에 추가"""
+        try:
+            with open(HISTORY_FILE, 'ab') as f:
+                f.write(json_dumps_compact(entry) + b'\n')
+        except Exception as e:
+            print(f"히스토리 저장 실패: {e}")
 
     def save_history(self):
         try:
-            with open(HISTORY_FILE, 'w', encoding='utf-8') as f:
-                json.dump(self.scan_history, f, indent=2, ensure_ascii=False)
+            self._write_history(self.scan_history)
         except Exception as e:
             print(f"히스토리 저장 실패: {e}")
 
     def refresh_history(self):
-        self.history_table.setRowCount(0)
-        for entry in reversed(self.scan_history[-50:]):  # 최근 50개만 표시
-            row = self.history_table.rowCount()
-            self.history_table.insertRow(row)
-            self.history_table.setItem(row, 0, QTableWidgetItem(entry['time']))
-            self.history_table.setItem(row, 1, QTableWidgetItem(entry['type']))
-            self.history_table.setItem(row, 2, QTableWidgetItem(str(entry['total'])))
-            self.history_table.setItem(row, 3, QTableWidgetItem(str(entry['threats'])))
-            self.history_table.setItem(row, 4, QTableWidgetItem(entry['status']))
+        """표시 후 새로 추가된 기록만 맨 위에 삽입 (최근 HISTORY_DISPLAY_LIMIT개만 표시)"""
+        if not hasattr(self, 'history_table'):
+            return  # 히스토리 탭이 아직 생성되지 않음
+        if not self.tabs.currentWidget().isAncestorOf(self.history_table):
+            return  # 다른 탭에 있으면 미뤄 두었다가 탭을 열 때 반영 (_history_pending 유지)
+        count = self._history_pending
+        if count is None:
+            # 처음 표시하거나 기록이 바뀌었으면 (삭제 등) 처음부터 다시 표시
+            self.history_model.clear()
+            count = HISTORY_DISPLAY_LIMIT
+        self._history_pending = 0
+        # 최신 기록부터 필요한 개수만 꺼냄 (전체 목록 복사 없음)
+        new_entries = list(islice(reversed(self.scan_history), min(count, HISTORY_DISPLAY_LIMIT)))
+        self.history_model.prepend_entries(new_entries)  # 삽입 알림 한 번
 
     def clear_history(self):
         reply = QMessageBox.question(self, '확인', '히스토리를 모두 삭제하시겠습니까?',
@@ -3227,22 +5142,18 @@ li {{ margin: 5px 0; }}
         if reply == QMessageBox.Yes:
             self.scan_history = []
             self.save_history()
+            self._history_pending = None
             self.refresh_history()
             QMessageBox.information(self, "성공", "히스토리가 삭제되었습니다.")
 
     def open_docs_folder(self):
         """문서 폴더 열기"""
-        docs_folder = os.path.dirname(os.path.abspath(__file__))
+        docs_folder = SCRIPT_DIR
         parent_folder = os.path.dirname(docs_folder)  # antivirus_project 폴더
 
         if os.path.exists(parent_folder):
             try:
-                if sys.platform.startswith("win"):
-                    os.startfile(parent_folder)
-                elif sys.platform.startswith("darwin"):  # macOS
-                    os.system(f'open "{parent_folder}"')
-                else:  # Linux
-                    os.system(f'xdg-open "{parent_folder}"')
+                open_folder(parent_folder)
             except Exception as e:
                 QMessageBox.warning(self, "오류", f"폴더 열기 실패:\n{e}")
         else:
@@ -3250,216 +5161,34 @@ li {{ margin: 5px 0; }}
 
     def show_about(self):
         """정보 다이얼로그 표시"""
-        about_text = f"""
-<h2>🛡️ InfraRed V2.0</h2>
-<p><b>버전:</b> 2.0</p>
-<p><b>제작자:</b> Dangel</p>
-<p><b>최종 업데이트:</b> 2026-01-17</p>
-<br>
-<p><b>주요 기능:</b></p>
-<ul>
-<li> 시그니처 기반 탐지</li>
-<li> 해시 기반 탐지 (MD5/SHA256)</li>
-<li> 휴리스틱 분석</li>
-<li> 엔트로피 계산</li>
-<li> 파일 핸들 강제 종료</li>
-<li> 드라이브/USB 스캔</li>
-<li> 격리 폴더 지정</li>
-<li> 실시간 감시</li>
-</ul>
-<br>
-<p><b>기술 스택:</b></p>
-<ul>
-<li>C++ 엔진 (OpenSSL)</li>
-<li>Python GUI (PyQt5)</li>
-<li>psutil (프로세스 관리)</li>
-<li>watchdog (실시간 감시)</li>
-</ul>
-<br>
-<br>
-<p><b>격리 폴더:</b> {QUARANTINE_DIR}</p>
-<p><b>DLL 위치:</b> {os.path.dirname(os.path.abspath(__file__))}</p>
-"""
-        QMessageBox.about(self, "정보", about_text)
+        QMessageBox.about(self, "정보", build_about_html(QUARANTINE_DIR, dll_dir))
 
     def toggle_theme(self):
         self.dark_mode = not self.dark_mode
-        self.apply_theme()
-        # 도움말 텍스트 스타일도 업데이트
-        self.update_help_text_style()
+        # 스타일시트 적용은 이벤트 루프로 미뤄 연속 전환을 한 번으로 합침
+        if not self._theme_pending:
+            self._theme_pending = True
+            QTimer.singleShot(0, self._flush_theme)
         # 테마 버튼 텍스트 변경
         if self.dark_mode:
             self.theme_btn.setText("☀️ 라이트모드")
         else:
             self.theme_btn.setText("🌙 다크모드")
 
+    def _flush_theme(self):
+        """미뤄둔 테마 변경을 한 번만 적용 (결국 원래 테마로 돌아왔으면 생략)"""
+        self._theme_pending = False
+        if self._applied_dark_mode != self.dark_mode:
+            self.apply_theme()
+            # 도움말 텍스트 스타일도 업데이트
+            self.update_help_text_style()
+
     def apply_theme(self):
-        if self.dark_mode:
-            # 다크 모드
-            self.setStyleSheet("""
-                QWidget {
-                    background-color: #2b2b2b;
-                    color: #ffffff;
-                }
-                QGroupBox {
-                    border: 2px solid #555555;
-                    border-radius: 5px;
-                    margin-top: 10px;
-                    padding-top: 10px;
-                    font-weight: bold;
-                }
-                QGroupBox::title {
-                    subcontrol-origin: margin;
-                    left: 10px;
-                    padding: 0 5px;
-                }
-                QPushButton {
-                    background-color: #3a3a3a;
-                    border: 1px solid #555555;
-                    border-radius: 4px;
-                    padding: 6px 12px;
-                    color: #ffffff;
-                }
-                QPushButton:hover {
-                    background-color: #4a4a4a;
-                }
-                QPushButton:pressed {
-                    background-color: #2a2a2a;
-                }
-                QLineEdit, QTextEdit, QSpinBox, QComboBox {
-                    background-color: #3a3a3a;
-                    border: 1px solid #555555;
-                    border-radius: 3px;
-                    padding: 4px;
-                    color: #ffffff;
-                }
-                QTableWidget {
-                    background-color: #3a3a3a;
-                    alternate-background-color: #2f2f2f;
-                    gridline-color: #555555;
-                }
-                QHeaderView::section {
-                    background-color: #4a4a4a;
-                    padding: 4px;
-                    border: 1px solid #555555;
-                    font-weight: bold;
-                }
-                QProgressBar {
-                    border: 1px solid #555555;
-                    border-radius: 3px;
-                    text-align: center;
-                    background-color: #3a3a3a;
-                }
-                QProgressBar::chunk {
-                    background-color: #3498db;
-                }
-                QListWidget {
-                    background-color: #3a3a3a;
-                    border: 1px solid #555555;
-                    color: #ffffff;
-                }
-                QTabWidget::pane {
-                    border: 1px solid #555555;
-                }
-                QTabBar::tab {
-                    background-color: #3a3a3a;
-                    border: 1px solid #555555;
-                    padding: 8px 16px;
-                    color: #ffffff;
-                }
-                QTabBar::tab:selected {
-                    background-color: #4a4a4a;
-                }
-                QLabel#quarantine_path_label {
-                    color: #5dade2;
-                    font-weight: bold;
-                }
-                QLabel#settings_path_label {
-                    color: #5dade2;
-                    font-weight: bold;
-                }
-            """)
-        else:
-            # 라이트 모드
-            self.setStyleSheet("""
-                QWidget {
-                    background-color: #f5f5f5;
-                    color: #333333;
-                }
-                QGroupBox {
-                    border: 2px solid #cccccc;
-                    border-radius: 5px;
-                    margin-top: 10px;
-                    padding-top: 10px;
-                    font-weight: bold;
-                }
-                QGroupBox::title {
-                    subcontrol-origin: margin;
-                    left: 10px;
-                    padding: 0 5px;
-                }
-                QPushButton {
-                    background-color: #ffffff;
-                    border: 1px solid #cccccc;
-                    border-radius: 4px;
-                    padding: 6px 12px;
-                }
-                QPushButton:hover {
-                    background-color: #e8e8e8;
-                }
-                QPushButton:pressed {
-                    background-color: #d0d0d0;
-                }
-                QLineEdit, QTextEdit, QSpinBox, QComboBox {
-                    background-color: #ffffff;
-                    border: 1px solid #cccccc;
-                    border-radius: 3px;
-                    padding: 4px;
-                }
-                QTableWidget {
-                    background-color: #ffffff;
-                    alternate-background-color: #f9f9f9;
-                    gridline-color: #e0e0e0;
-                }
-                QHeaderView::section {
-                    background-color: #e8e8e8;
-                    padding: 4px;
-                    border: 1px solid #cccccc;
-                    font-weight: bold;
-                }
-                QProgressBar {
-                    border: 1px solid #cccccc;
-                    border-radius: 3px;
-                    text-align: center;
-                    background-color: #ffffff;
-                }
-                QProgressBar::chunk {
-                    background-color: #3498db;
-                }
-                QListWidget {
-                    background-color: #ffffff;
-                    border: 1px solid #cccccc;
-                }
-                QTabWidget::pane {
-                    border: 1px solid #cccccc;
-                }
-                QTabBar::tab {
-                    background-color: #ffffff;
-                    border: 1px solid #cccccc;
-                    padding: 8px 16px;
-                }
-                QTabBar::tab:selected {
-                    background-color: #e8e8e8;
-                }
-                QLabel#quarantine_path_label {
-                    color: #2c3e50;
-                    font-weight: bold;
-                }
-                QLabel#settings_path_label {
-                    color: #2c3e50;
-                    font-weight: bold;
-                }
-            """)
+        """테마 스타일시트 적용 (문자열은 모듈 상수 - 전환 시 새로 만들지 않음)"""
+        self._applied_dark_mode = self.dark_mode
+        # 색은 팔레트로 한 번에 바꾸고 남은 작은 스타일시트만 파싱
+        QApplication.instance().setPalette(build_theme_palette(self.dark_mode))
+        self.setStyleSheet(DARK_QSS if self.dark_mode else LIGHT_QSS)
 
     # ========================================================================
     # 제외 목록 관리 함수들
@@ -3467,6 +5196,8 @@ li {{ margin: 5px 0; }}
     
     def load_exclusion_lists(self):
         """제외 목록을 UI에 로드"""
+        if not hasattr(self, 'exclusion_folder_list'):
+            return  # 설정 탭이 아직 생성되지 않음
         exclusions = SETTINGS.get('exclusions', {'folders': [], 'files': [], 'extensions': [], 'hashes': []})
         
         # 폴더 목록
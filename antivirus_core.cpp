@@ -1,6 +1,7 @@
 #include <iostream>
 #include <fstream>
 #include <string>
+#include <string_view>
 #include <vector>
 #include <set>
 #include <map>
@@ -8,8 +9,11 @@
 #include <iomanip>
 #include <cstdio>
 #include <cstring>
+#include <climits>
 #include <algorithm>
 #include <mutex>
+#include <memory>
+#include <queue>
 #include <regex>
 #include <openssl/evp.h>
 
@@ -24,7 +28,8 @@
 // 상수 및 전역 변수
 // ============================================================================
 static const long MAX_FILE_SIZE = 100 * 1024 * 1024;
-static char g_result_buffer[16384];
+// 결과 버퍼는 스레드별로 유지 (여러 스레드에서 동시에 스캔 가능)
+static thread_local char g_result_buffer[16384];
 static std::mutex g_mutex;
 
 // ============================================================================
@@ -345,104 +350,178 @@ static std::wstring get_ext(const wchar_t* p) {
 static bool is_safe_ext(const wchar_t* p) { return g_safe_ext.count(get_ext(p)) > 0; }
 static bool is_dangerous_ext(const wchar_t* p) { return g_dangerous_ext.count(get_ext(p)) > 0; }
 
-static std::string read_file(const wchar_t* path, long* sz) {
-    if (!path || !path[0]) { if (sz) *sz = 0; return ""; }
-    FILE* f = nullptr;
-    if (_wfopen_s(&f, path, L"rb") != 0 || !f) { if (sz) *sz = 0; return ""; }
-    fseek(f, 0, SEEK_END);
-    long size = ftell(f);
-    fseek(f, 0, SEEK_SET);
-    if (size <= 0) { fclose(f); if (sz) *sz = 0; return ""; }
-    if (sz) *sz = size;
-    if (size > MAX_FILE_SIZE) size = MAX_FILE_SIZE;
-    std::string data;
-    try { data.resize(size); fread(&data[0], 1, size, f); }
-    catch (...) { fclose(f); return ""; }
-    fclose(f);
-    return data;
-}
-
-static std::string calc_md5(const std::string& d) {
-    const char* zero_md5 = "00000000000000000000000000000000";
-    if (d.empty()) return zero_md5;
+// ============================================================================
+// 파일 내용 읽기 (큰 파일은 메모리 매핑)
+// ============================================================================
+// 이보다 작은 파일은 매핑 준비 비용이 복사보다 커서 그냥 읽음
+static const long MAP_MIN_SIZE = 64 * 1024;
 
-    try {
-        unsigned char dig[16];
-        memset(dig, 0, sizeof(dig));
+#ifdef _WIN32
+// 이동식/네트워크 드라이브는 매핑하지 않음 (매체가 빠지면 페이지 읽기 예외로 종료됨)
+static bool on_fixed_drive(const wchar_t* path) {
+    wchar_t root[MAX_PATH];
+    if (!GetVolumePathNameW(path, root, MAX_PATH)) return false;
+    return GetDriveTypeW(root) == DRIVE_FIXED;
+}
+#endif
 
-        EVP_MD_CTX* ctx = EVP_MD_CTX_new();
-        if (!ctx) return zero_md5;
+// 스캔할 파일 내용 - 큰 파일은 매핑한 페이지를 복사 없이 그대로 사용 (Windows)
+// open()으로 크기를 확인한 뒤 load()로 앞부분을 불러옴
+class FileView {
+public:
+    FileView() = default;
+    ~FileView() { close(); }
+    FileView(const FileView&) = delete;
+    FileView& operator=(const FileView&) = delete;
+
+    bool open(const wchar_t* path) {
+        if (!path || !path[0]) return false;
+#ifdef _WIN32
+        // 다른 프로세스의 읽기/쓰기/삭제를 막지 않음 (매핑된 파일은 OS가 줄이기를 거부함)
+        handle_ = CreateFileW(path, GENERIC_READ, FILE_SHARE_READ | FILE_SHARE_WRITE | FILE_SHARE_DELETE,
+                              NULL, OPEN_EXISTING, FILE_FLAG_SEQUENTIAL_SCAN, NULL);
+        if (handle_ != INVALID_HANDLE_VALUE) {
+            LARGE_INTEGER li;
+            if (!GetFileSizeEx(handle_, &li)) return false;
+            size_ = (long)std::min<LONGLONG>(li.QuadPart, LONG_MAX);
+            mappable_ = size_ >= MAP_MIN_SIZE && on_fixed_drive(path);
+            return true;
+        }
+        // 열지 못하면 일반 읽기로 한 번 더 시도
+#endif
+        if (_wfopen_s(&file_, path, L"rb") != 0 || !file_) {
+            file_ = nullptr;
+            return false;
+        }
+        fseek(file_, 0, SEEK_END);
+        size_ = ftell(file_);
+        fseek(file_, 0, SEEK_SET);
+        return true;
+    }
 
-        const EVP_MD* md = EVP_md5();
-        if (!md) {
-            EVP_MD_CTX_free(ctx);
-            return zero_md5;
+    // 파일 앞부분 최대 max_len 바이트를 불러옴 (읽은 내용이 없으면 false)
+    bool load(long max_len) {
+        if (size_ <= 0) return false;
+        size_t len = (size_t)std::min(size_, max_len);
+#ifdef _WIN32
+        if (handle_ != INVALID_HANDLE_VALUE) {
+            if (mappable_ && (long)len >= MAP_MIN_SIZE) {
+                mapping_ = CreateFileMappingW(handle_, NULL, PAGE_READONLY, 0, 0, NULL);
+                if (mapping_) base_ = MapViewOfFile(mapping_, FILE_MAP_READ, 0, 0, len);
+                if (base_) {
+                    view_ = std::string_view((const char*)base_, len);
+                    return true;
+                }
+            }
+            // 작은 파일이거나 매핑 실패 시 읽기
+            if (!alloc(len)) return false;
+            size_t total = 0;
+            while (total < len) {
+                DWORD got = 0;
+                DWORD chunk = (DWORD)std::min<size_t>(len - total, 1u << 30);
+                if (!ReadFile(handle_, buf_.get() + total, chunk, &got, NULL) || got == 0) break;
+                total += got;
+            }
+            view_ = std::string_view(buf_.get(), total);
+            return total > 0;
         }
+#endif
+        if (!file_ || !alloc(len)) return false;
+        size_t got = fread(buf_.get(), 1, len, file_);
+        view_ = std::string_view(buf_.get(), got);
+        return got > 0;
+    }
 
-        int ok = 1;
-        ok = ok && (EVP_DigestInit_ex(ctx, md, NULL) == 1);
-        ok = ok && (EVP_DigestUpdate(ctx, d.data(), d.size()) == 1);
+    long size() const { return size_; }  // 실제 파일 크기 (load에서 자르기 전)
+    std::string_view data() const { return view_; }
 
-        unsigned int len = 0;
-        ok = ok && (EVP_DigestFinal_ex(ctx, dig, &len) == 1);
+private:
+    // 읽기 버퍼 (0으로 채우지 않음)
+    bool alloc(size_t len) {
+        buf_.reset(new (std::nothrow) char[len]);
+        return buf_ != nullptr;
+    }
+
+    void close() {
+#ifdef _WIN32
+        if (base_) UnmapViewOfFile(base_);
+        if (mapping_) CloseHandle(mapping_);
+        if (handle_ != INVALID_HANDLE_VALUE) CloseHandle(handle_);
+#endif
+        if (file_) fclose(file_);
+    }
 
-        EVP_MD_CTX_free(ctx);
+#ifdef _WIN32
+    HANDLE handle_ = INVALID_HANDLE_VALUE;
+    HANDLE mapping_ = NULL;
+    void* base_ = nullptr;
+    bool mappable_ = false;
+#endif
+    FILE* file_ = nullptr;
+    long size_ = 0;
+    std::unique_ptr<char[]> buf_;
+    std::string_view view_;
+};
 
-        if (!ok || len != 16) return zero_md5;
+static const char* ZERO_MD5 = "00000000000000000000000000000000";
+static const char* ZERO_SHA256 = "0000000000000000000000000000000000000000000000000000000000000000";
+static const size_t HASH_BLOCK_SIZE = 64 * 1024;
 
-        char buf[33];
-        for (int i = 0; i < 16; i++) {
-            buf[i*2] = "0123456789abcdef"[dig[i] >> 4];
-            buf[i*2+1] = "0123456789abcdef"[dig[i] & 0x0f];
-        }
-        buf[32] = '\0';
-        return std::string(buf);
-    } catch (...) {
-        return zero_md5;
+static void to_hex(const unsigned char* dig, unsigned int len, std::string& out) {
+    out.resize(len * 2);
+    for (unsigned int i = 0; i < len; i++) {
+        out[i*2] = "0123456789abcdef"[dig[i] >> 4];
+        out[i*2+1] = "0123456789abcdef"[dig[i] & 0x0f];
     }
 }
 
-static std::string calc_sha256(const std::string& d) {
-    const char* zero_sha = "0000000000000000000000000000000000000000000000000000000000000000";
-    if (d.empty()) return zero_sha;
+// MD5/SHA256 동시 계산 - 스레드별 컨텍스트 재사용, 블록 단위로 두 해시를 번갈아 갱신
+static void calc_hashes(std::string_view d, std::string& md5, std::string& sha256) {
+    md5 = ZERO_MD5;
+    sha256 = ZERO_SHA256;
+    if (d.empty()) return;
 
     try {
-        unsigned char dig[32];
-        memset(dig, 0, sizeof(dig));
-
-        EVP_MD_CTX* ctx = EVP_MD_CTX_new();
-        if (!ctx) return zero_sha;
-
-        const EVP_MD* md = EVP_sha256();
-        if (!md) {
-            EVP_MD_CTX_free(ctx);
-            return zero_sha;
+        // 스레드가 끝나면 컨텍스트도 해제됨
+        using CtxPtr = std::unique_ptr<EVP_MD_CTX, decltype(&EVP_MD_CTX_free)>;
+        static thread_local CtxPtr md5_holder(EVP_MD_CTX_new(), &EVP_MD_CTX_free);
+        static thread_local CtxPtr sha_holder(EVP_MD_CTX_new(), &EVP_MD_CTX_free);
+        EVP_MD_CTX* md5_ctx = md5_holder.get();
+        EVP_MD_CTX* sha_ctx = sha_holder.get();
+        if (!md5_ctx || !sha_ctx) return;
+
+        const EVP_MD* md5_md = EVP_md5();
+        const EVP_MD* sha_md = EVP_sha256();
+        if (!md5_md || !sha_md) return;
+
+        int ok_md5 = (EVP_DigestInit_ex(md5_ctx, md5_md, NULL) == 1);
+        int ok_sha = (EVP_DigestInit_ex(sha_ctx, sha_md, NULL) == 1);
+
+        // 블록이 캐시에 남아 있는 동안 두 해시를 모두 갱신
+        const char* p = d.data();
+        size_t remaining = d.size();
+        while (remaining > 0 && (ok_md5 || ok_sha)) {
+            size_t n = remaining < HASH_BLOCK_SIZE ? remaining : HASH_BLOCK_SIZE;
+            ok_md5 = ok_md5 && (EVP_DigestUpdate(md5_ctx, p, n) == 1);
+            ok_sha = ok_sha && (EVP_DigestUpdate(sha_ctx, p, n) == 1);
+            p += n;
+            remaining -= n;
         }
 
-        int ok = 1;
-        ok = ok && (EVP_DigestInit_ex(ctx, md, NULL) == 1);
-        ok = ok && (EVP_DigestUpdate(ctx, d.data(), d.size()) == 1);
-
+        unsigned char dig[32];
         unsigned int len = 0;
-        ok = ok && (EVP_DigestFinal_ex(ctx, dig, &len) == 1);
-
-        EVP_MD_CTX_free(ctx);
-
-        if (!ok || len != 32) return zero_sha;
-
-        char buf[65];
-        for (int i = 0; i < 32; i++) {
-            buf[i*2] = "0123456789abcdef"[dig[i] >> 4];
-            buf[i*2+1] = "0123456789abcdef"[dig[i] & 0x0f];
-        }
-        buf[64] = '\0';
-        return std::string(buf);
+        if (ok_md5 && EVP_DigestFinal_ex(md5_ctx, dig, &len) == 1 && len == 16)
+            to_hex(dig, len, md5);
+        len = 0;
+        if (ok_sha && EVP_DigestFinal_ex(sha_ctx, dig, &len) == 1 && len == 32)
+            to_hex(dig, len, sha256);
     } catch (...) {
-        return zero_sha;
+        md5 = ZERO_MD5;
+        sha256 = ZERO_SHA256;
     }
 }
 
-static double calc_entropy(const std::string& d) {
+static double calc_entropy(std::string_view d) {
     if (d.empty()) return 0.0;
     int freq[256] = {0};
     for (unsigned char c : d) freq[c]++;
@@ -452,6 +531,110 @@ static double calc_entropy(const std::string& d) {
     return ent;
 }
 
+// ============================================================================
+// 다중 패턴 매칭 (Aho-Corasick)
+// ============================================================================
+// 시그니처 패턴과 YARA 문자열 패턴을 오토마톤 하나로 묶어
+// 파일을 한 번만 훑어서 모든 패턴의 포함 여부를 구함 (대소문자 무시, 소문자 사본 없음)
+struct PatternMatcher {
+    std::vector<int> next;              // 상태 * 256 + 바이트 -> 다음 상태 (실패 전이 포함)
+    std::vector<std::vector<int>> out;  // 상태에서 끝나는 패턴 번호 (접미사 패턴 포함)
+    std::vector<int> empty_ids;         // 빈 패턴 (항상 일치)
+    size_t pattern_count = 0;
+    size_t sig_count = 0;               // 패턴 0 ~ sig_count-1 = g_signatures
+    std::vector<size_t> yara_first;     // YARA 룰별 첫 문자열 패턴 번호
+};
+
+static inline unsigned char lower_byte(unsigned char c) {
+    return (c >= 'A' && c <= 'Z') ? (unsigned char)(c + 32) : c;
+}
+
+static std::shared_ptr<const PatternMatcher> build_matcher() {
+    auto m = std::make_shared<PatternMatcher>();
+    std::vector<const std::string*> patterns;
+    for (const auto& sig : g_signatures) patterns.push_back(&sig.pattern);
+    m->sig_count = patterns.size();
+    for (const auto& rule : g_yara_rules) {
+        m->yara_first.push_back(patterns.size());
+        for (const auto& str : rule.strings) patterns.push_back(&str);
+    }
+    m->pattern_count = patterns.size();
+
+    // 트라이 구성
+    m->next.assign(256, -1);
+    m->out.emplace_back();
+    for (size_t id = 0; id < patterns.size(); id++) {
+        if (patterns[id]->empty()) { m->empty_ids.push_back((int)id); continue; }
+        int state = 0;
+        for (unsigned char c : *patterns[id]) {
+            size_t slot = (size_t)state * 256 + lower_byte(c);
+            if (m->next[slot] < 0) {
+                m->next[slot] = (int)m->out.size();
+                m->out.emplace_back();
+                m->next.resize(m->next.size() + 256, -1);
+            }
+            state = m->next[slot];
+        }
+        m->out[state].push_back((int)id);
+    }
+
+    // BFS로 실패 링크를 구해 전이표에 합침 (스캔 중에는 실패 링크를 따라가지 않음)
+    std::vector<int> fail(m->out.size(), 0);
+    std::queue<int> q;
+    for (int c = 0; c < 256; c++) {
+        int s = m->next[c];
+        if (s < 0) m->next[c] = 0;
+        else q.push(s);
+    }
+    while (!q.empty()) {
+        int r = q.front(); q.pop();
+        const auto& inherited = m->out[fail[r]];
+        m->out[r].insert(m->out[r].end(), inherited.begin(), inherited.end());
+        for (int c = 0; c < 256; c++) {
+            size_t slot = (size_t)r * 256 + c;
+            int f = m->next[(size_t)fail[r] * 256 + c];
+            if (m->next[slot] < 0) {
+                m->next[slot] = f;
+            } else {
+                fail[m->next[slot]] = f;
+                q.push(m->next[slot]);
+            }
+        }
+    }
+    return m;
+}
+
+// 시그니처/YARA 룰이 바뀌면 비워 두고 다음 스캔에서 다시 만듦
+static std::shared_ptr<const PatternMatcher> g_matcher;
+
+static std::shared_ptr<const PatternMatcher> get_matcher() {
+    auto m = std::atomic_load(&g_matcher);
+    if (m) return m;
+    std::lock_guard<std::mutex> lock(g_mutex);
+    m = std::atomic_load(&g_matcher);
+    if (!m) {
+        m = build_matcher();
+        std::atomic_store(&g_matcher, m);
+    }
+    return m;
+}
+
+static void invalidate_matcher() {
+    std::atomic_store(&g_matcher, std::shared_ptr<const PatternMatcher>());
+}
+
+// 데이터를 한 번 훑어 패턴별 포함 여부 계산 (hits[패턴 번호])
+static std::vector<char> match_patterns(const PatternMatcher& m, std::string_view data) {
+    std::vector<char> hits(m.pattern_count, 0);
+    for (int id : m.empty_ids) hits[id] = 1;
+    const int* next = m.next.data();
+    int state = 0;
+    for (unsigned char c : data) {
+        state = next[(size_t)state * 256 + lower_byte(c)];
+        for (int id : m.out[state]) hits[id] = 1;
+    }
+    return hits;
+}
 
 // ============================================================================
 // YARA 룰 엔진
@@ -465,7 +648,7 @@ struct YaraMatchResult {
     std::vector<std::string> matched_strings;
 };
 
-static bool match_hex_pattern(const std::string& data, const std::string& hex_pattern) {
+static bool match_hex_pattern(std::string_view data, const std::string& hex_pattern) {
     // 헥스 패턴을 바이트로 변환하여 검색
     std::string bytes;
     std::istringstream iss(hex_pattern);
@@ -482,23 +665,21 @@ static bool match_hex_pattern(const std::string& data, const std::string& hex_pa
     return data.find(bytes) != std::string::npos;
 }
 
-static YaraMatchResult check_yara_rules(const std::string& data) {
+static YaraMatchResult check_yara_rules(std::string_view data, const PatternMatcher& m,
+                                       const std::vector<char>& hits) {
     YaraMatchResult result = {false, "", "", 0, 0, {}};
 
-    std::string lower = data;
-    std::transform(lower.begin(), lower.end(), lower.begin(), ::tolower);
-
-    for (const auto& rule : g_yara_rules) {
+    // 오토마톤을 만든 뒤 추가된 룰은 다음 스캔부터 검사
+    for (size_t r = 0; r < m.yara_first.size(); r++) {
+        const auto& rule = g_yara_rules[r];
         int matches = 0;
         std::vector<std::string> matched;
 
-        // 문자열 패턴 검사
-        for (const auto& str : rule.strings) {
-            std::string str_lower = str;
-            std::transform(str_lower.begin(), str_lower.end(), str_lower.begin(), ::tolower);
-            if (lower.find(str_lower) != std::string::npos) {
+        // 문자열 패턴 검사 (match_patterns 결과 사용)
+        for (size_t k = 0; k < rule.strings.size(); k++) {
+            if (hits[m.yara_first[r] + k]) {
                 matches++;
-                matched.push_back(str);
+                matched.push_back(rule.strings[k]);
             }
         }
 
@@ -554,7 +735,7 @@ static uint32_t rva_to_offset(uint32_t rva, const std::vector<SectionHeader>& se
     return 0;
 }
 
-static ImportAnalysisResult analyze_imports(const std::string& data) {
+static ImportAnalysisResult analyze_imports(std::string_view data) {
     ImportAnalysisResult result = {false, {}, {}, {}, 0, ""};
 
     if (data.size() < sizeof(DOSHeader)) return result;
@@ -690,7 +871,7 @@ struct PEAnalysisResult {
     uint32_t timestamp;
 };
 
-static PEAnalysisResult analyze_pe(const std::string& data) {
+static PEAnalysisResult analyze_pe(std::string_view data) {
     PEAnalysisResult result = {false, false, false, false, 0, "", {}, 0, 0};
 
     if (data.size() < sizeof(DOSHeader)) return result;
@@ -780,7 +961,7 @@ struct ZipAnalysisResult {
     std::string suspicious_file;
 };
 
-static ZipAnalysisResult analyze_zip(const std::string& data) {
+static ZipAnalysisResult analyze_zip(std::string_view data) {
     ZipAnalysisResult result = {false, {}, false, false, ""};
 
     // ZIP 시그니처 확인 (PK..)
@@ -848,15 +1029,13 @@ static ZipAnalysisResult analyze_zip(const std::string& data) {
 // ============================================================================
 // 시그니처/해시 검사
 // ============================================================================
-static bool check_signatures(const std::string& data, std::string& name, bool is_pe, bool dangerous) {
-    std::string lower = data;
-    std::transform(lower.begin(), lower.end(), lower.begin(), ::tolower);
-
-    for (const auto& sig : g_signatures) {
+static bool check_signatures(const PatternMatcher& m, const std::vector<char>& hits,
+                             std::string& name, bool is_pe, bool dangerous) {
+    // 목록 순서대로 확인 (먼저 등록된 시그니처 우선)
+    for (size_t i = 0; i < m.sig_count; i++) {
+        const auto& sig = g_signatures[i];
         if (sig.require_pe && !is_pe) continue;
-        std::string pat = sig.pattern;
-        std::transform(pat.begin(), pat.end(), pat.begin(), ::tolower);
-        if (lower.find(pat) != std::string::npos) {
+        if (hits[i]) {
             if (!dangerous && sig.severity <= 2) continue;
             name = sig.name;
             return true;
@@ -892,12 +1071,13 @@ EXPORT int scan_file(const wchar_t* filepath) {
     if (!filepath || !filepath[0]) return -1;
     if (is_safe_ext(filepath)) return 0;
 
-    long size = 0;
-    std::string data = read_file(filepath, &size);
-    if (data.empty() || size < 100) return (size > 0) ? 0 : -1;
+    FileView file;
+    if (!file.open(filepath) || file.size() <= 0) return -1;
+    if (file.size() < 100 || !file.load(MAX_FILE_SIZE)) return 0;
+    std::string_view data = file.data();
 
-    std::string md5 = calc_md5(data);
-    std::string sha256 = calc_sha256(data);
+    std::string md5, sha256;
+    calc_hashes(data, md5, sha256);
 
     // 화이트리스트
     for (const auto& h : g_whitelist_hashes)
@@ -907,12 +1087,16 @@ EXPORT int scan_file(const wchar_t* filepath) {
     bool dangerous = is_dangerous_ext(filepath);
     std::string threat;
 
+    // 시그니처/YARA 문자열은 한 번에 매칭
+    auto matcher = get_matcher();
+    std::vector<char> hits = match_patterns(*matcher, data);
+
     // YARA 룰 검사
-    YaraMatchResult yara = check_yara_rules(data);
+    YaraMatchResult yara = check_yara_rules(data, *matcher, hits);
     if (yara.matched && yara.severity >= 3) return 1;
 
     // 시그니처 검사
-    if (check_signatures(data, threat, pe.is_pe, dangerous)) return 1;
+    if (check_signatures(*matcher, hits, threat, pe.is_pe, dangerous)) return 1;
 
     // 해시 검사
     if (check_hashes(md5, sha256, threat)) return 2;
@@ -946,39 +1130,29 @@ EXPORT const char* scan_file_detailed(const wchar_t* filepath) {
         return g_result_buffer;
     }
 
-    // 파일 읽기
-    long size = 0;
-    std::string data;
-
-    FILE* f = nullptr;
-    if (_wfopen_s(&f, filepath, L"rb") != 0 || !f) {
+    // 파일 열기 (큰 파일은 매핑, 작은 파일은 읽기)
+    FileView file;
+    if (!file.open(filepath)) {
         strcpy(g_result_buffer, "{\"status\":-1,\"threat_type\":\"error\",\"threat_name\":\"OpenFail\",\"md5\":\"\",\"sha256\":\"\",\"entropy\":0,\"file_size\":0}");
         return g_result_buffer;
     }
 
-    fseek(f, 0, SEEK_END);
-    size = ftell(f);
-    fseek(f, 0, SEEK_SET);
-
+    long size = file.size();
     if (size <= 0 || size > MAX_FILE_SIZE) {
-        fclose(f);
         snprintf(g_result_buffer, sizeof(g_result_buffer)-1,
             "{\"status\":0,\"threat_type\":\"none\",\"threat_name\":\"Clean\",\"md5\":\"\",\"sha256\":\"\",\"entropy\":0,\"file_size\":%ld}", size);
         return g_result_buffer;
     }
 
-    data.resize(size);
-    size_t read_size = fread(&data[0], 1, size, f);
-    fclose(f);
-
-    if (read_size == 0) {
+    if (!file.load(MAX_FILE_SIZE)) {
         strcpy(g_result_buffer, "{\"status\":-1,\"threat_type\":\"error\",\"threat_name\":\"ReadFail\",\"md5\":\"\",\"sha256\":\"\",\"entropy\":0,\"file_size\":0}");
         return g_result_buffer;
     }
+    std::string_view data = file.data();
 
     // 해시 계산
-    std::string md5 = calc_md5(data);
-    std::string sha256 = calc_sha256(data);
+    std::string md5, sha256;
+    calc_hashes(data, md5, sha256);
     double entropy = calc_entropy(data);
 
     // 기본 결과
@@ -1006,10 +1180,15 @@ EXPORT const char* scan_file_detailed(const wchar_t* filepath) {
         }
     }
 
+    // 시그니처/YARA 문자열은 한 번에 매칭 (이미 탐지됐으면 생략)
+    auto matcher = get_matcher();
+    std::vector<char> hits;
+    if (status == 0) hits = match_patterns(*matcher, data);
+
     // YARA 검사
-    static char yara_name[64] = {0};
+    static thread_local char yara_name[64] = {0};
     if (status == 0 && data.size() > 0) {
-        YaraMatchResult yara = check_yara_rules(data);
+        YaraMatchResult yara = check_yara_rules(data, *matcher, hits);
         if (yara.matched) {
             status = 1;
             threat_type = "yara";
@@ -1021,10 +1200,10 @@ EXPORT const char* scan_file_detailed(const wchar_t* filepath) {
     }
 
     // 시그니처 검사
-    static char sig_name[64] = {0};
+    static thread_local char sig_name[64] = {0};
     if (status == 0) {
         std::string sig_threat;
-        if (check_signatures(data, sig_threat, is_pe, is_pe)) {
+        if (check_signatures(*matcher, hits, sig_threat, is_pe, is_pe)) {
             status = 1;
             threat_type = "signature";
             strncpy(sig_name, sig_threat.c_str(), 63);
@@ -1034,7 +1213,7 @@ EXPORT const char* scan_file_detailed(const wchar_t* filepath) {
     }
 
     // 해시 검사
-    static char hash_name[64] = {0};
+    static thread_local char hash_name[64] = {0};
     if (status == 0) {
         std::string hash_threat;
         if (check_hashes(md5, sha256, hash_threat)) {
@@ -1071,6 +1250,33 @@ EXPORT const char* scan_file_detailed(const wchar_t* filepath) {
     return g_result_buffer;
 }
 
+// ============================================================================
+// 배치 스캔 API
+// ============================================================================
+// 여러 파일을 한 번의 호출로 검사하고 결과를 JSON 배열로 반환
+// (파이썬 쪽 ctypes 호출/JSON 파싱 횟수를 파일 수 → 배치 수로 줄임)
+static thread_local std::string g_batch_buffer;
+
+EXPORT const char* scan_files_detailed(const wchar_t** filepaths, int count) {
+    g_batch_buffer.clear();
+    g_batch_buffer.push_back('[');
+    for (int i = 0; i < count; i++) {
+        if (i > 0) g_batch_buffer.push_back(',');
+        g_batch_buffer.append(scan_file_detailed(filepaths ? filepaths[i] : nullptr));
+    }
+    g_batch_buffer.push_back(']');
+    return g_batch_buffer.c_str();
+}
+
+// 여러 파일을 기본 스캔하고 결과 코드를 results 배열에 기록 (반환: 처리한 파일 수)
+EXPORT int scan_files(const wchar_t** filepaths, int count, int* results) {
+    if (!filepaths || !results || count <= 0) return 0;
+    for (int i = 0; i < count; i++) {
+        results[i] = scan_file(filepaths[i]);
+    }
+    return count;
+}
+
 
 // ============================================================================
 // YARA 룰 관리
@@ -1100,6 +1306,7 @@ EXPORT int add_yara_rule(const char* name, const char* desc, const char* strings
     }
 
     g_yara_rules.push_back(rule);
+    invalidate_matcher();
     return (int)g_yara_rules.size();
 }
 
@@ -1310,6 +1517,7 @@ EXPORT int add_signature(const char* name, const char* pattern, int severity) {
     if (!name || !pattern) return -1;
     std::lock_guard<std::mutex> lock(g_mutex);
     g_signatures.push_back({name, pattern, severity, 1, false});
+    invalidate_matcher();
     return (int)g_signatures.size();
 }
 